@@ -0,0 +1,6 @@
+"""Benchmarks for the make87 Python SDK.
+
+Benchmarks are plain scripts run as modules from the repository root, e.g.
+``python -m benchmarks.encodings.zero_copy``. They are not part of the
+installed package and are not collected by pytest.
+"""
@@ -0,0 +1,68 @@
+"""Benchmark of columnar Arrow batches against row-by-row JSON telemetry.
+
+Encodes the same telemetry records once as one JSON payload per row and
+once as a single Arrow IPC payload, and reports payload size, throughput
+and peak allocated bytes per decode of the whole batch.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.arrow_batches
+"""
+
+import pyarrow as pa
+
+from benchmarks.encodings.common import ops_per_second, peak_allocated_bytes, print_table
+from make87.encodings import ArrowEncoder, JsonEncoder
+
+
+def _records(num_records):
+    return [
+        {
+            "timestamp": 1712345678.123 + i * 0.01,
+            "robot_id": i % 32,
+            "battery": 0.5 + (i % 50) / 100,
+            "temperature": 20.0 + (i % 15),
+            "state": ["idle", "moving", "charging"][i % 3],
+        }
+        for i in range(num_records)
+    ]
+
+
+def main() -> None:
+    json_encoder = JsonEncoder()
+    rows = []
+    for num_records in (100, 10_000, 100_000):
+        records = _records(num_records)
+        table = pa.Table.from_pylist(records)
+        json_payloads = json_encoder.encode_many(records)
+        methods = {
+            "json rows": (
+                lambda: json_encoder.encode_many(records),
+                lambda: json_encoder.decode_many(json_payloads),
+                sum(len(p) for p in json_payloads),
+            ),
+        }
+        for compression in (None, "zstd"):
+            encoder = ArrowEncoder(compression=compression)
+            payload = encoder.encode(table)
+            methods[f"arrow ({compression or 'raw'})"] = (
+                lambda encoder=encoder: encoder.encode(table),
+                lambda encoder=encoder, payload=payload: encoder.decode(payload),
+                len(payload),
+            )
+        for method, (encode, decode, size) in methods.items():
+            rows.append(
+                {
+                    "records": num_records,
+                    "method": method,
+                    "bytes": size,
+                    "encode ops/s": round(ops_per_second(encode), 1),
+                    "decode ops/s": round(ops_per_second(decode), 1),
+                    "peak bytes/decode": peak_allocated_bytes(decode, repeat=5),
+                }
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
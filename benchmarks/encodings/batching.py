@@ -0,0 +1,61 @@
+"""Throughput benchmark for `Encoder.encode_many` and `Encoder.decode_many`.
+
+Compares messages per second of per-message `encode`/`decode` calls against
+the batched API at several batch sizes.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.batching
+"""
+
+from benchmarks.encodings.common import ops_per_second, print_table, sample_document
+from make87.encodings import JsonEncoder, ProtobufEncoder, YamlEncoder
+
+BATCH_SIZES = (1, 10, 100, 1000)
+
+
+def _cases():
+    from google.protobuf.struct_pb2 import Struct
+
+    def to_struct(obj):
+        message = Struct()
+        message.update(obj)
+        return message
+
+    document = sample_document(3)
+    return [
+        ("json", JsonEncoder(), document),
+        ("json+hooks", JsonEncoder(object_hook=dict, default=str), document),
+        ("yaml", YamlEncoder(), document),
+        ("protobuf", ProtobufEncoder(message_type=Struct), to_struct(document)),
+    ]
+
+
+def main() -> None:
+    rows = []
+    for name, encoder, obj in _cases():
+        for batch_size in BATCH_SIZES:
+            objs = [obj] * batch_size
+            payloads = encoder.encode_many(objs)
+
+            def encode_single():
+                return [encoder.encode(o) for o in objs]
+
+            def decode_single():
+                return [encoder.decode(p) for p in payloads]
+
+            rows.append(
+                {
+                    "encoder": name,
+                    "batch": batch_size,
+                    "encode msg/s": round(ops_per_second(encode_single) * batch_size),
+                    "encode_many msg/s": round(ops_per_second(lambda: encoder.encode_many(objs)) * batch_size),
+                    "decode msg/s": round(ops_per_second(decode_single) * batch_size),
+                    "decode_many msg/s": round(ops_per_second(lambda: encoder.decode_many(payloads)) * batch_size),
+                }
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Shared helpers for the encoding benchmarks."""
+
+import math
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+
+def peak_allocated_bytes(fn: Callable[[], Any], repeat: int = 20) -> int:
+    """Measure the peak number of bytes allocated by a single call of `fn`.
+
+    Args:
+        fn: Zero-argument callable to measure
+        repeat: Number of measured calls; the median peak is reported
+
+    Returns:
+        The median peak of traced allocations per call, in bytes
+    """
+    fn()  # warm up caches and lazily created objects
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            result = fn()
+            _, peak = tracemalloc.get_traced_memory()
+            del result
+            peaks.append(peak - start)
+    finally:
+        tracemalloc.stop()
+    peaks.sort()
+    return peaks[len(peaks) // 2]
+
+
+def ops_per_second(fn: Callable[[], Any], min_time: float = 0.2) -> float:
+    """Measure how many calls of `fn` complete per second.
+
+    Args:
+        fn: Zero-argument callable to measure
+        min_time: Minimum wall-clock time to spend measuring, in seconds
+
+    Returns:
+        The number of calls per second
+    """
+    fn()
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls / elapsed
+
+
+def call_latencies(fn: Callable[[], Any], min_time: float = 0.2, min_calls: int = 5) -> List[float]:
+    """Measure the wall-clock time of individual calls of `fn`.
+
+    Args:
+        fn: Zero-argument callable to measure
+        min_time: Minimum wall-clock time to spend measuring, in seconds
+        min_calls: Minimum number of measured calls, however long they take
+
+    Returns:
+        The duration of every measured call in seconds, in call order
+    """
+    fn()
+    latencies: List[float] = []
+    clock = time.perf_counter
+    deadline = clock() + min_time
+    while len(latencies) < min_calls or clock() < deadline:
+        start = clock()
+        fn()
+        latencies.append(clock() - start)
+    return latencies
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Get a percentile of a list of values, using the nearest-rank method.
+
+    Args:
+        values: The values, in any order
+        fraction: The percentile as a fraction, e.g. 0.99 for p99
+
+    Returns:
+        The smallest value that at least `fraction` of the values are less than or equal to
+    """
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * fraction)) - 1]
+
+
+def sample_document(num_items: int) -> Dict[str, Any]:
+    """Build a detection-style document with `num_items` entries.
+
+    Args:
+        num_items: Number of detections in the document
+
+    Returns:
+        A JSON/YAML-serializable dictionary
+    """
+    return {
+        "header": {"timestamp": 1712345678.123, "entity_path": "/camera/front", "reference_id": 7},
+        "detections": [
+            {"label": f"object_{i % 17}", "score": 0.5 + (i % 50) / 100, "box": [i, i + 1, i + 20, i + 40]}
+            for i in range(num_items)
+        ],
+    }
+
+
+def print_table(rows: List[Dict[str, Any]], file: Optional[TextIO] = None) -> None:
+    """Print a list of result rows as an aligned text table.
+
+    Args:
+        rows: Result rows sharing the same keys
+        file: Stream to print to. Defaults to stdout.
+    """
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(str(c)), *(len(str(r[c])) for r in rows)) for c in columns}
+    print("  ".join(str(c).ljust(widths[c]) for c in columns), file=file)
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(widths[c]) for c in columns), file=file)
@@ -0,0 +1,77 @@
+"""Compression ratio versus CPU cost benchmark for `CompressedEncoder`.
+
+For every installed algorithm and a low, default and high level, reports
+the compression ratio and the compress/decompress throughput on payloads
+of typical make87 message shapes. Small messages are additionally measured
+with a dictionary trained from other messages of the same shape.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.compression
+"""
+
+from benchmarks.encodings.common import ops_per_second, print_table, sample_document
+from make87.encodings import CompressedEncoder, JsonEncoder
+from make87.encodings.compressed import available_compression_algorithms, train_dictionary
+
+LEVELS = {
+    "zlib": (1, 6, 9),
+    "lzma": (0, 6, 9),
+    "zstd": (1, 3, 19),
+    "lz4": (0, 4, 12),
+}
+
+
+def _small_message(i):
+    return {
+        "header": {"timestamp": 1712345678.123 + i, "entity_path": "/robot/status", "reference_id": i},
+        "battery": 0.5 + (i % 50) / 100,
+        "state": ["idle", "moving", "charging"][i % 3],
+    }
+
+
+def _shapes():
+    return {
+        "status(~150 B)": (_small_message(10_001), [_small_message(i) for i in range(500)]),
+        "detections(100)": (sample_document(100), None),
+        "detections(5000)": (sample_document(5000), None),
+    }
+
+
+def _row(shape, algorithm, level, dictionary, encoder, obj, raw_size):
+    payload = encoder.encode(obj)
+    # Compression only: the inner payload is encoded once up front. Decode includes the inner decoder.
+    inner_payload = encoder.inner.encode(obj)
+    mb = raw_size / 1e6
+    return {
+        "shape": shape,
+        "algorithm": algorithm,
+        "level": level,
+        "dict": dictionary,
+        "raw bytes": raw_size,
+        "ratio": round(raw_size / len(payload), 2),
+        "compress MB/s": round(ops_per_second(lambda: encoder._compress(inner_payload)) * mb, 1),
+        "decode MB/s": round(ops_per_second(lambda: encoder.decode(payload)) * mb, 1),
+    }
+
+
+def main() -> None:
+    inner = JsonEncoder()
+    rows = []
+    for shape, (obj, samples) in _shapes().items():
+        raw_size = len(inner.encode(obj))
+        for algorithm in available_compression_algorithms():
+            for level in LEVELS[algorithm]:
+                encoder = CompressedEncoder(inner, algorithm=algorithm, level=level, min_size=0)
+                rows.append(_row(shape, algorithm, level, False, encoder, obj, raw_size))
+                if samples is not None and algorithm != "lzma":
+                    dictionary = train_dictionary([inner.encode(s) for s in samples], algorithm=algorithm, size=4096)
+                    encoder = CompressedEncoder(
+                        inner, algorithm=algorithm, level=level, min_size=0, dictionary=dictionary
+                    )
+                    rows.append(_row(shape, algorithm, level, True, encoder, obj, raw_size))
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
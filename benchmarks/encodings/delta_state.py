@@ -0,0 +1,78 @@
+"""Bytes on the wire and CPU cost of `DeltaEncoder` for slowly changing state.
+
+Publishes a sequence of state messages of which only a small part changes
+per message (an occupancy grid with a few updated cells, a configuration
+blob with one edited parameter) and reports the average payload size with
+and without delta encoding, together with the encode and decode cost per
+message.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.delta_state
+"""
+
+import random
+
+from benchmarks.encodings.common import ops_per_second, print_table
+from make87.encodings import DeltaEncoder, JsonEncoder, NdarrayEncoder
+
+MESSAGES = 200
+
+
+def _occupancy_grids(size: int, cells_per_update: int):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    grid = rng.integers(0, 100, size=(size, size), dtype=np.uint8)
+    grids = []
+    for _ in range(MESSAGES):
+        grid = grid.copy()
+        rows = rng.integers(0, size, cells_per_update)
+        cols = rng.integers(0, size, cells_per_update)
+        grid[rows, cols] = rng.integers(0, 100, cells_per_update, dtype=np.uint8)
+        grids.append(grid)
+    return grids
+
+
+def _configs(parameters: int):
+    rng = random.Random(0)
+    config = {f"node_{i}": {"enabled": True, "gain": i / 10, "label": f"parameter {i}"} for i in range(parameters)}
+    configs = []
+    for _ in range(MESSAGES):
+        config = {**config, f"node_{rng.randrange(parameters)}": {"enabled": False, "gain": 0.0, "label": "edited"}}
+        configs.append(config)
+    return configs
+
+
+def _row(shape, inner, messages, keyframe_interval):
+    encoder = DeltaEncoder(inner, keyframe_interval=keyframe_interval)
+    payloads = [encoder.encode(message) for message in messages]
+    raw = sum(len(inner.encode(message)) for message in messages) / len(messages)
+    delta = sum(len(payload) for payload in payloads) / len(payloads)
+
+    decoder = DeltaEncoder(inner)
+    decoder.decode(payloads[0])
+    delta_payload = next(p for p in payloads[1:] if p[0] == 1)
+    return {
+        "shape": shape,
+        "keyframe every": keyframe_interval,
+        "raw bytes/msg": round(raw),
+        "delta bytes/msg": round(delta),
+        "reduction": f"{raw / delta:.1f}x",
+        "encode us (raw)": round(1e6 / ops_per_second(lambda: inner.encode(messages[-1])), 1),
+        "encode us (delta)": round(1e6 / ops_per_second(lambda: encoder.encode(messages[-1])), 1),
+        "decode us (raw)": round(1e6 / ops_per_second(lambda: inner.decode(payloads[0][6:])), 1),
+        "decode us (delta)": round(1e6 / ops_per_second(lambda: decoder.decode(delta_payload)), 1),
+    }
+
+
+def main() -> None:
+    rows = []
+    for interval in (10, 100):
+        rows.append(_row("grid 1024x1024, 20 cells", NdarrayEncoder(), _occupancy_grids(1024, 20), interval))
+        rows.append(_row("config, 500 params", JsonEncoder(), _configs(500), interval))
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Throughput benchmark for the `JsonEncoder` backends.
+
+Measures encode and decode throughput of every installed JSON backend on
+typical make87 message shapes, with and without custom hooks.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.json_backends
+"""
+
+from benchmarks.encodings.common import ops_per_second, print_table, sample_document
+from make87.encodings import JsonEncoder
+from make87.encodings.json_ import available_json_backends
+
+
+def _shapes():
+    return {
+        "header": {"timestamp": 1712345678.123, "entity_path": "/robot/status", "reference_id": 7},
+        "detections(100)": sample_document(100),
+        "pointcloud(10k floats)": {"points": [i * 0.001 for i in range(10_000)]},
+        "config": {"nodes": {f"node_{i}": {"enabled": i % 2 == 0, "rate": i, "tags": ["a", "b"]} for i in range(200)}},
+    }
+
+
+def main() -> None:
+    rows = []
+    for shape, obj in _shapes().items():
+        for backend in available_json_backends():
+            for hooks in (False, True):
+                if hooks:
+                    encoder = JsonEncoder(object_hook=lambda d: d, default=str, backend=backend)
+                else:
+                    encoder = JsonEncoder(backend=backend)
+                payload = encoder.encode(obj)
+                view = memoryview(payload)
+                rows.append(
+                    {
+                        "shape": shape,
+                        "backend": backend,
+                        "hooks": hooks,
+                        "bytes": len(payload),
+                        "encode ops/s": round(ops_per_second(lambda: encoder.encode(obj))),
+                        "decode ops/s": round(ops_per_second(lambda: encoder.decode_from(view))),
+                    }
+                )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Peak memory and throughput of streaming versus whole-document JSON decoding.
+
+Decodes a large JSON document holding a detection history, once with
+`JsonEncoder.decode` on the whole payload and once element by element
+with `JsonEncoder.iter_decode`, from memory and from a file. Peak memory
+is measured with `tracemalloc` and includes the payload read from the
+file, but not the in-memory payload itself.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.json_streaming
+"""
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.encodings.common import print_table, sample_document
+from make87.encodings import JsonEncoder
+
+
+def _measure(fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    # Traced separately, as tracing slows down allocation-heavy decoding several times over.
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    encoder = JsonEncoder()
+    rows = []
+    for items in (10_000, 100_000):
+        document = {"history": sample_document(items)}
+        data = json.dumps(document).encode("utf-8")
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            f.write(data)
+        try:
+
+            def read_and_decode():
+                with open(f.name, "rb") as source:
+                    encoder.decode(source.read())
+
+            def stream_file():
+                with open(f.name, "rb") as source:
+                    for _ in encoder.iter_decode(source, "history.detections"):
+                        pass
+
+            cases = {
+                "decode (memory)": lambda: encoder.decode(data),
+                "iter_decode (memory)": lambda: sum(1 for _ in encoder.iter_decode(data, "history.detections")),
+                "decode (file)": read_and_decode,
+                "iter_decode (file)": stream_file,
+            }
+            for name, fn in cases.items():
+                elapsed, peak = _measure(fn)
+                rows.append(
+                    {
+                        "document bytes": len(data),
+                        "mode": name,
+                        "MB/s": round(len(data) / elapsed / 1e6, 1),
+                        "peak MB": round(peak / 1e6, 2),
+                    }
+                )
+        finally:
+            os.unlink(f.name)
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
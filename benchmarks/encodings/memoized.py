@@ -0,0 +1,50 @@
+"""Encode cost of republished messages with and without `MemoizedEncoder`.
+
+Republishes the same heartbeat, status and calibration messages and
+reports the encode rate of the plain encoder and of the memoizing wrapper
+keyed by identity, by version and by a user key.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.memoized
+"""
+
+from benchmarks.encodings.common import ops_per_second, print_table
+from make87.encodings import JsonEncoder, MemoizedEncoder, ProtobufEncoder
+
+
+def _cases():
+    from google.protobuf.struct_pb2 import Struct
+
+    calibration = Struct()
+    calibration.update({"camera": "front", "intrinsics": [[600.0, 0.0, 320.0], [0.0, 600.0, 240.0], [0, 0, 1]]})
+    calibration.update({"distortion": [0.01 * i for i in range(14)], "revision": 3})
+    return [
+        ("heartbeat (json)", JsonEncoder(), {"node": "lidar", "state": "ok", "revision": 1}),
+        ("calibration (protobuf)", ProtobufEncoder(Struct), calibration),
+    ]
+
+
+def main() -> None:
+    rows = []
+    for name, inner, message in _cases():
+        encoders = {
+            "plain": inner,
+            "identity": MemoizedEncoder(inner),
+            "version": MemoizedEncoder(inner, version=lambda m: m["revision"]),
+            "user key": MemoizedEncoder(inner, key=lambda m: "static"),
+        }
+        for mode, encoder in encoders.items():
+            rows.append(
+                {
+                    "message": name,
+                    "mode": mode,
+                    "bytes": len(encoder.encode(message)),
+                    "encodes/s": round(ops_per_second(lambda: encoder.encode(message))),
+                }
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark of `NdarrayEncoder` against pickle and `np.save` for raw frames.
+
+Measures throughput and peak allocated bytes per decode for camera frames
+and point clouds. `NdarrayEncoder` decodes into views over the payload, so
+its decode cost is independent of the frame size.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.ndarray_frames
+"""
+
+import io
+import pickle
+
+import numpy as np
+
+from benchmarks.encodings.common import ops_per_second, peak_allocated_bytes, print_table
+from make87.encodings import NdarrayEncoder
+
+
+def _npy_encode(array):
+    stream = io.BytesIO()
+    np.save(stream, array, allow_pickle=False)
+    return stream.getvalue()
+
+
+def _npy_decode(payload):
+    return np.load(io.BytesIO(payload), allow_pickle=False)
+
+
+def _shapes():
+    return {
+        "rgb 640x480": np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8),
+        "rgb 1920x1080": np.random.randint(0, 255, (1080, 1920, 3), dtype=np.uint8),
+        "pointcloud 100k xyz": np.random.rand(100_000, 3).astype(np.float32),
+    }
+
+
+def main() -> None:
+    encoder = NdarrayEncoder(alignment=64)
+    methods = {
+        "ndarray": (encoder.encode, encoder.decode),
+        "pickle": (lambda a: pickle.dumps(a, protocol=5), pickle.loads),
+        "np.save": (_npy_encode, _npy_decode),
+    }
+    rows = []
+    for shape, array in _shapes().items():
+        for method, (encode, decode) in methods.items():
+            payload = encode(array)
+            rows.append(
+                {
+                    "shape": shape,
+                    "method": method,
+                    "bytes": len(payload),
+                    "encode ops/s": round(ops_per_second(lambda: encode(array))),
+                    "decode ops/s": round(ops_per_second(lambda: decode(payload))),
+                    "peak bytes/decode": peak_allocated_bytes(lambda: decode(payload)),
+                }
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Serial versus `ParallelDecoder` decode throughput.
+
+Decodes a batch of large payloads on the calling thread and through a
+`ParallelDecoder` with an increasing number of worker processes. The
+parallel numbers include handing payloads over through shared memory and
+pickling the decoded objects back, which for fast parsers (orjson) costs
+about as much as decoding itself; the decoder pays off for slow parsers
+such as YAML, and on machines with spare cores.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.parallel_decode
+"""
+
+import os
+import time
+
+from benchmarks.encodings.common import print_table, sample_document
+from make87.encodings import JsonEncoder, ParallelDecoder, YamlEncoder
+
+PAYLOADS = 32
+
+
+def main() -> None:
+    rows = []
+    cpus = os.cpu_count() or 1
+    for encoder, items in ((JsonEncoder(), 20_000), (YamlEncoder(), 2_000)):
+        payloads = [encoder.encode(sample_document(items)) for _ in range(PAYLOADS)]
+        start = time.perf_counter()
+        for payload in payloads:
+            encoder.decode(payload)
+        serial = time.perf_counter() - start
+        rows.append(
+            {
+                "encoder": type(encoder).__name__,
+                "payload bytes": len(payloads[0]),
+                "workers": 0,
+                "payloads/s": round(PAYLOADS / serial, 1),
+            }
+        )
+        for workers in sorted({1, 2, 4, cpus}):
+            with ParallelDecoder(encoder, workers=workers) as decoder:
+                list(decoder.map(payloads[:workers]))  # start the workers
+                start = time.perf_counter()
+                for _ in decoder.map(payloads):
+                    pass
+                elapsed = time.perf_counter() - start
+            rows.append(
+                {
+                    "encoder": type(encoder).__name__,
+                    "payload bytes": len(payloads[0]),
+                    "workers": workers,
+                    "payloads/s": round(PAYLOADS / elapsed, 1),
+                }
+            )
+    print(f"{cpus} CPUs")
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
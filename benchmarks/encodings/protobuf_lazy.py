@@ -0,0 +1,84 @@
+"""Benchmark of lazy protobuf decoding for filter-then-drop subscribers.
+
+Compares a full `decode` against `decode_lazy` for an image-like message
+whose header is read before the message is dropped. The image bytes grow
+from 1 KB to a 1080p RGB frame; a small status message shows the overhead
+of the lazy path when every field is read.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.protobuf_lazy
+"""
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from benchmarks.encodings.common import ops_per_second, print_table
+from make87.encodings import ProtobufEncoder
+
+
+def _message_classes():
+    """Build the benchmark message classes at runtime, mirroring make87 image messages."""
+    pool = descriptor_pool.DescriptorPool()
+    pool.AddSerializedFile(Timestamp.DESCRIPTOR.file.serialized_pb)
+    file = descriptor_pb2.FileDescriptorProto(
+        name="benchmark_image.proto", package="benchmark", dependency=["google/protobuf/timestamp.proto"]
+    )
+    header = file.message_type.add(name="Header")
+    header.field.add(name="timestamp", number=1, type=11, label=1, type_name=".google.protobuf.Timestamp")
+    header.field.add(name="entity_path", number=2, type=9, label=1)
+    header.field.add(name="reference_id", number=3, type=3, label=1)
+    image = file.message_type.add(name="Image")
+    image.field.add(name="header", number=1, type=11, label=1, type_name=".benchmark.Header")
+    image.field.add(name="width", number=2, type=13, label=1)
+    image.field.add(name="height", number=3, type=13, label=1)
+    image.field.add(name="data", number=4, type=12, label=1)
+    pool.Add(file)
+    return (
+        message_factory.GetMessageClass(pool.FindMessageTypeByName("benchmark.Header")),
+        message_factory.GetMessageClass(pool.FindMessageTypeByName("benchmark.Image")),
+    )
+
+
+def main() -> None:
+    header_type, image_type = _message_classes()
+    encoder = ProtobufEncoder(image_type)
+    header_encoder = ProtobufEncoder(header_type)
+    rows = []
+
+    cases = {
+        f"image {size // 1024} KB": image_type(
+            header=header_type(entity_path="/camera/front", reference_id=7), width=640, height=480, data=bytes(size)
+        ).SerializeToString()
+        for size in (1024, 100 * 1024, 512 * 1024, 1920 * 1080 * 3)
+    }
+    for case, payload in cases.items():
+        rows.append(
+            {
+                "case": case,
+                "full decode ops/s": round(ops_per_second(lambda: encoder.decode(payload).header.timestamp.seconds)),
+                "lazy decode ops/s": round(
+                    ops_per_second(lambda: encoder.decode_lazy(payload, min_size=0).header.timestamp.seconds)
+                ),
+            }
+        )
+
+    payload = header_type(entity_path="/robot/status", reference_id=7).SerializeToString()
+
+    def read_all(message):
+        return message.timestamp.seconds, message.entity_path, message.reference_id
+
+    rows.append(
+        {
+            "case": "header, all fields read",
+            "full decode ops/s": round(ops_per_second(lambda: read_all(header_encoder.decode(payload)))),
+            "lazy decode ops/s": round(
+                ops_per_second(lambda: read_all(header_encoder.decode_lazy(payload, min_size=0)))
+            ),
+        }
+    )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
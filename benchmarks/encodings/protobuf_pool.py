@@ -0,0 +1,62 @@
+"""Allocation benchmark for pooled and in-place `ProtobufEncoder.decode`.
+
+Compares a new message per decode against parsing into a caller-supplied
+message (`into=`) and into messages recycled through the encoder's pool.
+Allocations are measured with `tracemalloc`, which sees Python object
+allocations but not the upb arenas allocated with malloc.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.protobuf_pool
+"""
+
+from benchmarks.encodings.common import ops_per_second, peak_allocated_bytes, print_table
+from make87.encodings import ProtobufEncoder
+
+
+def _cases():
+    from google.protobuf.timestamp_pb2 import Timestamp
+    from google.protobuf.type_pb2 import Field, Type
+
+    detections = Type(
+        name="Detections",
+        fields=[Field(name=f"object_{i}", number=i, json_name=f"o{i}", type_url="Box") for i in range(20)],
+    )
+    return [
+        ("Timestamp", Timestamp, Timestamp(seconds=1712345678, nanos=123456789)),
+        ("Field", Field, Field(name="acceleration", number=3, json_name="acc", type_url="type.example.com/Vec3")),
+        ("Type(20 fields)", Type, detections),
+    ]
+
+
+def main() -> None:
+    rows = []
+    for name, message_type, message in _cases():
+        payload = message.SerializeToString()
+        plain = ProtobufEncoder(message_type)
+        pooled = ProtobufEncoder(message_type, pool_size=4)
+        scratch = message_type()
+
+        def decode_new():
+            return plain.decode(payload)
+
+        def decode_into():
+            return plain.decode(payload, into=scratch)
+
+        def decode_pooled():
+            pooled.release(pooled.decode(payload))
+
+        for mode, fn in (("new", decode_new), ("into", decode_into), ("pool", decode_pooled)):
+            rows.append(
+                {
+                    "message": name,
+                    "mode": mode,
+                    "peak bytes/decode": peak_allocated_bytes(fn),
+                    "decodes/s": round(ops_per_second(fn)),
+                }
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
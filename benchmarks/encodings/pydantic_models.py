@@ -0,0 +1,88 @@
+"""Benchmark of `PydanticEncoder` against `JsonEncoder` with an `object_hook`.
+
+Compares decoding into pydantic models via pydantic-core (`validate_json`)
+with the previous approach of `JsonEncoder` with an object hook calling
+`Model(**d)`. Encoding compares `dump_json` against
+`JsonEncoder` with `default=Model.model_dump`.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.pydantic_models
+"""
+
+from typing import List
+
+from pydantic import BaseModel, field_validator
+
+from benchmarks.encodings.common import ops_per_second, print_table, sample_document
+from make87.encodings import JsonEncoder, PydanticEncoder
+
+
+class Header(BaseModel):
+    timestamp: float
+    entity_path: str
+    reference_id: int
+
+
+class Detection(BaseModel):
+    label: str
+    score: float
+    box: List[int]
+
+
+class Detections(BaseModel):
+    header: Header
+    detections: List[Detection]
+
+
+class CheckedDetection(Detection):
+    @field_validator("score")
+    @classmethod
+    def _check_score(cls, value: float) -> float:
+        if not 0 <= value <= 1:
+            raise ValueError("score out of range")
+        return value
+
+
+class CheckedDetections(BaseModel):
+    header: Header
+    detections: List[CheckedDetection]
+
+
+def _object_hook(d):
+    """Build models bottom-up from the keys present, as applications do with JsonEncoder today."""
+    if "timestamp" in d:
+        return Header(**d)
+    if "label" in d:
+        return Detection(**d)
+    if "detections" in d:
+        return Detections(**d)
+    return d
+
+
+def main() -> None:
+    rows = []
+    for num_items in (1, 100, 1000):
+        document = sample_document(num_items)
+        for name, model_type in (("plain", Detections), ("field_validator", CheckedDetections)):
+            obj = model_type.model_validate(document)
+            encoders = {
+                "json+object_hook": JsonEncoder(object_hook=_object_hook, default=lambda m: m.model_dump()),
+                "pydantic": PydanticEncoder(model_type),
+            }
+            payload = PydanticEncoder(model_type).encode(obj)
+            for method, encoder in encoders.items():
+                rows.append(
+                    {
+                        "detections": num_items,
+                        "model": name,
+                        "method": method,
+                        "encode ops/s": round(ops_per_second(lambda: encoder.encode(obj))),
+                        "decode ops/s": round(ops_per_second(lambda: encoder.decode(payload))),
+                    }
+                )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
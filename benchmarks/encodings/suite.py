@@ -0,0 +1,270 @@
+"""Encoder benchmark suite with payload-size sweeps.
+
+Runs every encoder over payloads from 100 B to 10 MB and measures, for
+encode and decode separately, the throughput, the p50 and p99 latency of a
+single call and the peak number of bytes allocated by a call. Document
+encoders (JSON, YAML, MessagePack, CBOR, protobuf, pydantic, compressed
+JSON) encode the same detection-style document; array encoders (ndarray,
+Arrow) encode float32 arrays of the same size.
+
+Results are written as JSON, so runs can be stored and compared. With
+`--baseline`, every result is compared against a stored run and the
+command exits with status 1 if any p50 latency regressed by more than
+`--threshold` percent.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.suite --output baseline.json
+    python -m benchmarks.encodings.suite --baseline baseline.json
+    python -m benchmarks.encodings.suite --quick --encoders json protobuf
+
+YAML is orders of magnitude slower than the other encoders; a 10 MB YAML
+document takes around half a minute per call, so a full run takes several
+minutes. `--quick` stops at 1 MB.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.encodings.common import call_latencies, peak_allocated_bytes, percentile, print_table, sample_document
+from make87.encodings import CompressedEncoder, JsonEncoder, NdarrayEncoder, ProtobufEncoder, YamlEncoder
+from make87.encodings.base import Encoder
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUICK_MAX_SIZE = 1_000_000
+
+# An encoder and a function building an object whose payload is about the given size
+Case = Tuple[Encoder, Callable[[int], Any]]
+
+
+def _document_of_size(size: int) -> Dict[str, Any]:
+    """Build a detection document whose JSON encoding is about `size` bytes."""
+    header_size = len(JsonEncoder().encode(sample_document(0)))
+    item_size = (len(JsonEncoder().encode(sample_document(1000))) - header_size) / 1000
+    return sample_document(max(0, round((size - header_size) / item_size)))
+
+
+def _json_case() -> Case:
+    return JsonEncoder(), _document_of_size
+
+
+def _yaml_case() -> Case:
+    return YamlEncoder(), _document_of_size
+
+
+def _msgpack_case() -> Case:
+    from make87.encodings import MsgpackEncoder
+
+    return MsgpackEncoder(), _document_of_size
+
+
+def _cbor_case() -> Case:
+    from make87.encodings import CborEncoder
+
+    return CborEncoder(), _document_of_size
+
+
+def _compressed_case() -> Case:
+    return CompressedEncoder(JsonEncoder()), _document_of_size
+
+
+def _protobuf_case() -> Case:
+    from google.protobuf.struct_pb2 import Struct
+
+    def build(size: int) -> Struct:
+        message = Struct()
+        message.update(_document_of_size(size))
+        return message
+
+    return ProtobufEncoder(Struct), build
+
+
+def _pydantic_case() -> Case:
+    from pydantic import BaseModel
+
+    from make87.encodings import PydanticEncoder
+
+    class Header(BaseModel):
+        timestamp: float
+        entity_path: str
+        reference_id: int
+
+    class Detection(BaseModel):
+        label: str
+        score: float
+        box: List[int]
+
+    class Detections(BaseModel):
+        header: Header
+        detections: List[Detection]
+
+    return PydanticEncoder(Detections), lambda size: Detections.model_validate(_document_of_size(size))
+
+
+def _ndarray_case() -> Case:
+    import numpy as np
+
+    return NdarrayEncoder(), lambda size: np.random.default_rng(0).random(max(1, size // 4), dtype=np.float32)
+
+
+def _arrow_case() -> Case:
+    import numpy as np
+    import pyarrow as pa
+
+    from make87.encodings import ArrowEncoder
+
+    def build(size: int) -> pa.Table:
+        values = np.random.default_rng(0).random(max(1, size // 16), dtype=np.float32)
+        return pa.table({"x": values, "y": values, "z": values, "intensity": values})
+
+    return ArrowEncoder(), build
+
+
+CASES: Dict[str, Tuple[str, Callable[[], Case]]] = {
+    "json": ("document", _json_case),
+    "yaml": ("document", _yaml_case),
+    "msgpack": ("document", _msgpack_case),
+    "cbor": ("document", _cbor_case),
+    "protobuf": ("document", _protobuf_case),
+    "pydantic": ("document", _pydantic_case),
+    "compressed-json": ("document", _compressed_case),
+    "ndarray": ("array", _ndarray_case),
+    "arrow": ("array", _arrow_case),
+}
+
+
+def _measure(fn: Callable[[], Any], payload_size: int, min_time: float) -> Dict[str, Any]:
+    latencies = call_latencies(fn, min_time=min_time, min_calls=3 if payload_size >= 1_000_000 else 5)
+    return {
+        "calls": len(latencies),
+        "throughput_mb_s": round(payload_size * len(latencies) / sum(latencies) / 1e6, 3),
+        "p50_us": round(percentile(latencies, 0.5) * 1e6, 2),
+        "p99_us": round(percentile(latencies, 0.99) * 1e6, 2),
+        "allocated_bytes": peak_allocated_bytes(fn, repeat=3 if payload_size >= 1_000_000 else 10),
+    }
+
+
+def run(encoders: List[str], sizes: List[int], min_time: float) -> List[Dict[str, Any]]:
+    """Run the benchmark for the given encoders and payload sizes.
+
+    Encoders whose dependencies are not installed are skipped with a note on stderr.
+
+    Args:
+        encoders: Names of the encoders to benchmark, keys of `CASES`
+        sizes: Target payload sizes in bytes
+        min_time: Minimum time to spend measuring each operation, in seconds
+
+    Returns:
+        One result dict per encoder, size and operation
+    """
+    results = []
+    for name in encoders:
+        shape, factory = CASES[name]
+        try:
+            encoder, build = factory()
+        except ImportError as e:
+            print(f"skipping {name}: {e}", file=sys.stderr)
+            continue
+        for size in sizes:
+            obj = build(size)
+            payload = encoder.encode(obj)
+            for operation, fn in (("encode", lambda: encoder.encode(obj)), ("decode", lambda: encoder.decode(payload))):
+                result = {
+                    "encoder": name,
+                    "shape": shape,
+                    "size": size,
+                    "operation": operation,
+                    "payload_bytes": len(payload),
+                }
+                result.update(_measure(fn, len(payload), min_time))
+                results.append(result)
+                print(f"{name} {size} B {operation}: {result['p50_us']} us p50", file=sys.stderr)
+    return results
+
+
+def _key(result: Dict[str, Any]) -> Tuple[str, int, str]:
+    return result["encoder"], result["size"], result["operation"]
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float) -> List[Dict[str, Any]]:
+    """Compare results against a baseline run.
+
+    Args:
+        results: Results of the current run
+        baseline: Results of the stored run
+        threshold: Relative p50 latency increase, in percent, that counts as a regression
+
+    Returns:
+        One row per result present in both runs, with the relative changes
+        and whether the result regressed
+    """
+    previous = {_key(result): result for result in baseline}
+    rows = []
+    for result in results:
+        before = previous.get(_key(result))
+        if before is None:
+            continue
+        p50_change = 100 * (result["p50_us"] / before["p50_us"] - 1)
+        rows.append(
+            {
+                "encoder": result["encoder"],
+                "size": result["size"],
+                "operation": result["operation"],
+                "p50 change %": round(p50_change, 1),
+                "p99 change %": round(100 * (result["p99_us"] / before["p99_us"] - 1), 1),
+                "throughput change %": round(100 * (result["throughput_mb_s"] / before["throughput_mb_s"] - 1), 1),
+                "allocated change": result["allocated_bytes"] - before["allocated_bytes"],
+                "regressed": p50_change > threshold,
+            }
+        )
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--encoders", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES), help="payload sizes in bytes")
+    parser.add_argument("--quick", action="store_true", help=f"skip sizes above {QUICK_MAX_SIZE} bytes")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to measure each operation for")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="p50 regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in args.sizes if not args.quick or size <= QUICK_MAX_SIZE]
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": run(args.encoders, sizes, args.min_time),
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        rows = compare(report["results"], baseline, args.threshold)
+        print_table(rows, file=sys.stderr)
+        regressions = [row for row in rows if row["regressed"]]
+        if regressions:
+            print(f"{len(regressions)} result(s) regressed by more than {args.threshold}%", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""Benchmark of the libyaml C loader/dumper against pure-Python PyYAML.
+
+Measures `YamlEncoder` throughput with `use_libyaml=True` and
+`use_libyaml=False` on large config-like documents.
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.yaml_libyaml
+"""
+
+from benchmarks.encodings.common import ops_per_second, print_table
+from make87.encodings import YamlEncoder
+from make87.encodings.yaml_ import LIBYAML_AVAILABLE
+
+
+def config_document(num_nodes: int) -> dict:
+    """Build a deployment-config-like document with `num_nodes` nodes.
+
+    Args:
+        num_nodes: Number of node entries in the document
+
+    Returns:
+        A YAML-serializable dictionary
+    """
+    return {
+        "version": 3,
+        "nodes": [
+            {
+                "name": f"node_{i}",
+                "image": f"registry.example.com/apps/node_{i}:1.{i % 10}.0",
+                "enabled": i % 3 != 0,
+                "env": {"LOG_LEVEL": "info", "RATE_HZ": str(10 + i % 20), "MODE": "streaming"},
+                "interfaces": [{"name": "zenoh", "topics": [f"/camera/{i}/rgb", f"/camera/{i}/depth"]}],
+                "resources": {"cpu": 0.5 + (i % 4) / 4, "memory_mb": 256 * (1 + i % 4)},
+            }
+            for i in range(num_nodes)
+        ],
+    }
+
+
+def main() -> None:
+    if not LIBYAML_AVAILABLE:
+        print("PyYAML was built without libyaml, nothing to compare.")
+        return
+
+    rows = []
+    for num_nodes in (10, 100, 1000):
+        document = config_document(num_nodes)
+        for use_libyaml in (False, True):
+            encoder = YamlEncoder(use_libyaml=use_libyaml)
+            payload = encoder.encode(document)
+            rows.append(
+                {
+                    "nodes": num_nodes,
+                    "libyaml": use_libyaml,
+                    "bytes": len(payload),
+                    "encode ops/s": round(ops_per_second(lambda: encoder.encode(document)), 1),
+                    "decode ops/s": round(ops_per_second(lambda: encoder.decode(payload)), 1),
+                }
+            )
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
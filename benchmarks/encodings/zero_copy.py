@@ -0,0 +1,52 @@
+"""Allocation benchmark for `Encoder.encode_into` and `Encoder.decode_from`.
+
+Compares the bytes allocated per message on the classic path
+(``encode`` returning a new payload, ``decode(bytes(view))`` on receive)
+against the buffer-based path (``encode_into`` a reused buffer,
+``decode_from`` straight from a memoryview).
+
+Run from the repository root:
+
+    python -m benchmarks.encodings.zero_copy
+"""
+
+from benchmarks.encodings.common import peak_allocated_bytes, print_table, sample_document
+from make87.encodings import JsonEncoder, ProtobufEncoder, YamlEncoder
+
+
+def _cases():
+    from google.protobuf.wrappers_pb2 import BytesValue
+
+    document = sample_document(500)
+    frame = BytesValue(value=bytes(1920 * 1080 * 3))
+    return [
+        ("json", JsonEncoder(), document),
+        ("yaml", YamlEncoder(), sample_document(50)),
+        ("protobuf", ProtobufEncoder(message_type=BytesValue), frame),
+    ]
+
+
+def main() -> None:
+    rows = []
+    for name, encoder, obj in _cases():
+        payload = encoder.encode(obj)
+        buffer = bytearray(len(payload))
+        # Simulate a payload that arrives as a slice of a larger receive buffer.
+        received = memoryview(bytearray(payload))
+
+        rows.append(
+            {
+                "encoder": name,
+                "payload_bytes": len(payload),
+                "encode": peak_allocated_bytes(lambda: encoder.encode(obj)),
+                "encode_into": peak_allocated_bytes(lambda: encoder.encode_into(obj, buffer)),
+                "decode(bytes(view))": peak_allocated_bytes(lambda: encoder.decode(bytes(received))),
+                "decode_from(view)": peak_allocated_bytes(lambda: encoder.decode_from(received)),
+            }
+        )
+    print("Peak bytes allocated per message:")
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
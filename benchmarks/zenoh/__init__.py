@@ -0,0 +1 @@
+"""Benchmarks for `make87.interfaces.zenoh`."""
@@ -0,0 +1,82 @@
+"""Throughput of `AioSubscriber` against `run_in_executor(subscriber.recv)`.
+
+Publishes small samples on a local Zenoh session from a background thread
+and consumes them in an asyncio coroutine, once with a channel subscriber
+whose blocking `recv` runs in the default executor (a thread hop per
+sample) and once with `AioSubscriber`, which wakes the loop once per batch
+of samples. Reports the consume rate and the number of loop wakeups.
+
+Run from the repository root:
+
+    python -m benchmarks.zenoh.aio_subscriber
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import zenoh
+
+from benchmarks.encodings.common import print_table
+from make87.interfaces.zenoh import AioSubscriber, FifoChannel
+
+MESSAGES = 20_000
+KEY = "benchmarks/aio_subscriber"
+
+
+def _publish(session):
+    publisher = session.declare_publisher(KEY)
+    for i in range(MESSAGES):
+        publisher.put(b"%d" % i)
+    publisher.undeclare()
+
+
+async def _executor_recv(session):
+    subscriber = session.declare_subscriber(KEY, zenoh.handlers.FifoChannel(MESSAGES))
+    loop = asyncio.get_running_loop()
+    threading.Thread(target=_publish, args=(session,)).start()
+    for _ in range(MESSAGES):
+        await loop.run_in_executor(None, subscriber.recv)
+    subscriber.undeclare()
+    return MESSAGES  # one executor round trip per sample
+
+
+async def _aio_subscriber(session):
+    loop = asyncio.get_running_loop()
+    wakeups = [0]
+    call_soon_threadsafe = loop.call_soon_threadsafe
+
+    def counting(*args):
+        wakeups[0] += 1
+        return call_soon_threadsafe(*args)
+
+    loop.call_soon_threadsafe = counting
+    received = 0
+    async with AioSubscriber(session, KEY, FifoChannel(handler_type="FIFO", capacity=MESSAGES)) as subscriber:
+        threading.Thread(target=_publish, args=(session,)).start()
+        async for _ in subscriber:
+            received += 1
+            if received == MESSAGES:
+                break
+    loop.call_soon_threadsafe = call_soon_threadsafe
+    return wakeups[0]
+
+
+def main() -> None:
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    session = zenoh.open(config)
+
+    rows = []
+    for mode, consume in (("run_in_executor(recv)", _executor_recv), ("AioSubscriber", _aio_subscriber)):
+        start = time.perf_counter()
+        wakeups = asyncio.run(consume(session))
+        elapsed = time.perf_counter() - start
+        rows.append({"mode": mode, "samples/s": round(MESSAGES / elapsed), "loop wakeups": wakeups})
+    print_table(rows)
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
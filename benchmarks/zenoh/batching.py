@@ -0,0 +1,69 @@
+"""Publisher cost of small messages with and without micro-batching.
+
+Publishes small JSON messages with `TypedPublisher` on a local Zenoh
+session, unbatched and with several batch sizes, while a subscriber on the
+same session splits batches with `iter_payloads` and counts the messages.
+Reports the end-to-end message rate and the CPU time spent per message.
+
+Run from the repository root:
+
+    python -m benchmarks.zenoh.batching
+"""
+
+import json
+import threading
+import time
+
+import zenoh
+
+from benchmarks.encodings.common import print_table
+from make87.encodings import JsonEncoder
+from make87.interfaces.zenoh import BatchingConfig, TypedPublisher, iter_payloads
+
+MESSAGES = 50_000
+KEY = "benchmarks/batching"
+
+
+def _run(session, batching):
+    received = [0]
+    done = threading.Event()
+
+    def on_sample(sample):
+        for _ in iter_payloads(sample):
+            received[0] += 1
+        if received[0] == MESSAGES:
+            done.set()
+
+    subscriber = session.declare_subscriber(KEY, on_sample)
+    publisher = TypedPublisher(session.declare_publisher(KEY), JsonEncoder(), batching=batching)
+    message = {"sensor": "imu", "ax": 0.01, "ay": -0.02, "az": 9.81}
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    for _ in range(MESSAGES):
+        publisher.put(message)
+    publisher.undeclare()
+    done.wait(120)
+    elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+    subscriber.undeclare()
+    return {
+        "messages/s": round(MESSAGES / elapsed),
+        "cpu us/message": round(1e6 * cpu / MESSAGES, 2),
+        "puts": MESSAGES if publisher.batcher is None else publisher.batcher.batches,
+    }
+
+
+def main() -> None:
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    session = zenoh.open(config)
+
+    rows = [{"batching": "off", **_run(session, None)}]
+    for max_messages in (8, 64, 256):
+        batching = BatchingConfig(max_messages=max_messages, linger_ms=5)
+        rows.append({"batching": f"{max_messages} messages", **_run(session, batching)})
+    print_table(rows)
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Query round-trip latency of two Zenoh peers over different endpoints.
+
+Opens a peer listening like `ZenohInterface` does (TCP on all interfaces
+and a Unix socket) and connects a second peer to it over the host's
+network address, standing in for the VPN address that same-node peers
+used to be reached over, over the loopback interface and over the Unix
+socket. Reports the median and p99 latency of a query answered by the
+listening peer.
+
+Run from the repository root:
+
+    python -m benchmarks.zenoh.endpoints
+"""
+
+import json
+import socket
+import time
+
+import zenoh
+
+from benchmarks.encodings.common import call_latencies, percentile, print_table
+from make87.interfaces.zenoh.interface import listen_endpoints, unixsock_endpoint
+
+PORT = 17447
+KEY = "benchmarks/endpoints"
+
+
+def _host_address() -> str:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.connect(("10.255.255.255", 1))  # no packet is sent; this only picks the outgoing interface
+        return sock.getsockname()[0]
+
+
+def _open(**endpoints) -> zenoh.Session:
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    for kind, values in endpoints.items():
+        config.insert_json5(f"{kind}/endpoints", json.dumps(values))
+    return zenoh.open(config)
+
+
+def main() -> None:
+    server = _open(listen=listen_endpoints(PORT))
+    queryable = server.declare_queryable(KEY, lambda query: query.reply(KEY, b"pong"))
+
+    rows = []
+    for link, endpoint in (
+        ("host address", f"tcp/{_host_address()}:{PORT}"),
+        ("loopback", f"tcp/127.0.0.1:{PORT}"),
+        ("unix socket", unixsock_endpoint(PORT)),
+    ):
+        client = _open(connect=[endpoint])
+        time.sleep(0.2)  # let the peers exchange declarations
+        querier = client.declare_querier(KEY)
+        latencies = call_latencies(lambda: list(querier.get(payload=b"ping")), min_time=1.0)
+        rows.append(
+            {
+                "link": link,
+                "p50 µs": round(percentile(latencies, 0.5) * 1e6),
+                "p99 µs": round(percentile(latencies, 0.99) * 1e6),
+            }
+        )
+        querier.undeclare()
+        client.close()
+
+    print_table(rows)
+    queryable.undeclare()
+    server.close()
+
+
+if __name__ == "__main__":
+    main()
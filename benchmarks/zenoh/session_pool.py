@@ -0,0 +1,53 @@
+"""Cost of giving several interfaces a Zenoh session, with and without the session pool.
+
+Opens one session per interface, as `ZenohInterface` used to, and
+acquires them from the session pool instead, for the same configuration.
+Reports the time to hand out all sessions and the number of distinct
+sessions (each with its own transports, listeners and runtime buffers).
+
+Run from the repository root:
+
+    python -m benchmarks.zenoh.session_pool
+"""
+
+import json
+import time
+
+import zenoh
+
+from benchmarks.encodings.common import print_table
+from make87.interfaces.zenoh.session_pool import acquire_session, release_session
+
+INTERFACES = 8
+
+
+def _config() -> zenoh.Config:
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    return config
+
+
+def main() -> None:
+    rows = []
+    for mode, open_session, close_session in (
+        ("zenoh.open per interface", zenoh.open, zenoh.Session.close),
+        ("acquire_session", acquire_session, release_session),
+    ):
+        start = time.perf_counter()
+        sessions = [open_session(_config()) for _ in range(INTERFACES)]
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "mode": mode,
+                "interfaces": INTERFACES,
+                "sessions": len({id(session) for session in sessions}),
+                "ms": round(elapsed * 1000, 1),
+            }
+        )
+        for session in sessions:
+            close_session(session)
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
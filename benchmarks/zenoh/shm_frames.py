@@ -0,0 +1,95 @@
+"""4K-frame throughput between two peers on one host, over TCP and shared memory.
+
+Opens two Zenoh sessions connected over TCP on the loopback interface and
+publishes 3840x2160 RGB frames (about 25 MB each) with `TypedPublisher`
+and `NdarrayEncoder` from one to the other:
+
+- tcp: shared memory disabled, frames travel through the TCP stack
+- shm (auto): shared memory enabled, Zenoh copies frames into its
+  transport pool (enlarged to hold 4K frames)
+- shm (provider): the publisher allocates payloads from a shared-memory
+  pool with `ShmConfig`, which Zenoh passes on without copying
+
+The subscriber decodes every frame. Reports the frame rate and the share
+of frames received through shared memory.
+
+Run from the repository root:
+
+    python -m benchmarks.zenoh.shm_frames
+"""
+
+import json
+import threading
+import time
+
+import numpy as np
+import zenoh
+
+from benchmarks.encodings.common import print_table
+from make87.encodings import NdarrayEncoder
+from make87.interfaces.zenoh import ShmConfig, TypedPublisher, is_shm
+
+FRAMES = 30
+KEY = "benchmarks/shm_frames"
+ENDPOINT = "tcp/127.0.0.1:17448"
+POOL_SIZE = 256 * 1024 * 1024
+
+
+def _config(shm: bool, **endpoints) -> zenoh.Config:
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    config.insert_json5("transport/shared_memory/enabled", json.dumps(shm))
+    config.insert_json5("transport/shared_memory/transport_optimization/pool_size", json.dumps(POOL_SIZE))
+    for key, value in endpoints.items():
+        config.insert_json5(f"{key}/endpoints", json.dumps([value]))
+    return config
+
+
+def _run(shm_transport: bool, shm_config):
+    publishing = zenoh.open(_config(shm_transport, listen=ENDPOINT))
+    subscribing = zenoh.open(_config(shm_transport, connect=ENDPOINT))
+    encoder = NdarrayEncoder()
+    received = [0, 0]
+    done = threading.Event()
+
+    def on_sample(sample):
+        received[1] += is_shm(sample)
+        encoder.decode(sample.payload.to_bytes())
+        received[0] += 1
+        if received[0] == FRAMES:
+            done.set()
+
+    subscribing.declare_subscriber(KEY, on_sample)
+    publisher = TypedPublisher(
+        publishing.declare_publisher(KEY, congestion_control=zenoh.CongestionControl.BLOCK), encoder, shm=shm_config
+    )
+    time.sleep(0.5)  # let the sessions connect and the subscription propagate
+
+    frame = np.random.default_rng(0).integers(0, 255, (2160, 3840, 3), dtype=np.uint8)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        publisher.put(frame)
+    done.wait(300)
+    elapsed = time.perf_counter() - start
+
+    publisher.undeclare()
+    subscribing.close()
+    publishing.close()
+    return {
+        "frames/s": round(received[0] / elapsed, 1),
+        "MB/s": round(received[0] * frame.nbytes / elapsed / 1e6),
+        "via shm": f"{received[1]}/{received[0]}",
+    }
+
+
+def main() -> None:
+    rows = [
+        {"transport": "tcp", **_run(False, None)},
+        {"transport": "shm (auto)", **_run(True, None)},
+        {"transport": "shm (provider)", **_run(True, ShmConfig(pool_size=POOL_SIZE))},
+    ]
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Per-put overhead of `TypedPublisher` against encoding and putting by hand.
+
+Publishes small JSON messages, protobuf messages and camera frames on a
+local Zenoh session, once with `publisher.put(encoder.encode(msg))` and
+once with `TypedPublisher.put(msg)`, and reports the put rate and the peak
+bytes allocated per put. Nothing subscribes, so the numbers cover encoding
+and handing the payload to Zenoh, not the network.
+
+Run from the repository root:
+
+    python -m benchmarks.zenoh.typed_publisher
+"""
+
+import json
+
+import numpy as np
+import zenoh
+
+from benchmarks.encodings.common import ops_per_second, peak_allocated_bytes, print_table
+from make87.encodings import JsonEncoder, NdarrayEncoder, ProtobufEncoder
+from make87.interfaces.zenoh import TypedPublisher
+
+
+def _cases():
+    from google.protobuf.struct_pb2 import Struct
+
+    status = Struct()
+    status.update({"node": "lidar", "state": "ok", "temperature": 41.5})
+    return [
+        ("status (json)", JsonEncoder(), {"node": "lidar", "state": "ok", "temperature": 41.5}),
+        ("status (protobuf)", ProtobufEncoder(Struct), status),
+        ("frame 640x480x3 (ndarray)", NdarrayEncoder(), np.zeros((480, 640, 3), dtype=np.uint8)),
+        ("frame 1920x1080x3 (ndarray)", NdarrayEncoder(), np.zeros((1080, 1920, 3), dtype=np.uint8)),
+    ]
+
+
+def main() -> None:
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    session = zenoh.open(config)
+    publisher = session.declare_publisher("benchmarks/typed_publisher")
+
+    rows = []
+    for name, encoder, message in _cases():
+        typed = TypedPublisher(publisher, encoder)
+        for mode, put in (
+            ("manual", lambda: publisher.put(encoder.encode(message))),
+            ("typed", lambda: typed.put(message)),
+        ):
+            rate = ops_per_second(put)
+            rows.append(
+                {
+                    "message": name,
+                    "mode": mode,
+                    "puts/s": round(rate),
+                    "us/put": round(1e6 / rate, 2),
+                    "allocated bytes/put": peak_allocated_bytes(put),
+                }
+            )
+    print_table(rows)
+    publisher.undeclare()
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
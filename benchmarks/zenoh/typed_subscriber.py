@@ -0,0 +1,116 @@
+"""Throughput of `TypedSubscriber` against decoding in the Zenoh callback.
+
+Publishes YAML configuration documents on a local Zenoh session and
+measures how long it takes until all of them are decoded and handled,
+once decoding inline in a plain subscriber callback and once with
+`TypedSubscriber` on thread and process pools of several sizes. It also
+reports how long the Zenoh callback thread is busy per sample, which is
+what blocks other subscribers of the session.
+
+Thread pools do not decode faster than the callback, since decoding holds
+the GIL; they only free the callback thread. Process pools decode in
+parallel given more than one CPU core.
+
+Run from the repository root:
+
+    python -m benchmarks.zenoh.typed_subscriber
+"""
+
+import json
+import os
+import threading
+import time
+
+import zenoh
+
+from benchmarks.encodings.common import print_table, sample_document
+from make87.encodings import YamlEncoder
+from make87.interfaces.zenoh import FifoChannel, TypedSubscriber
+
+MESSAGES = 200
+KEY = "benchmarks/typed_subscriber"
+
+
+class _TimedSubscriber(TypedSubscriber):
+    busy = 0.0
+
+    def _on_sample(self, sample):
+        start = time.perf_counter()
+        super()._on_sample(sample)
+        self.busy += time.perf_counter() - start
+
+
+def _run(session, payload, subscribe):
+    """Publish `MESSAGES` payloads and wait until all are handled.
+
+    `subscribe(handle)` subscribes with the handler and returns a function
+    returning the callback busy time and closing the subscription.
+    """
+    done = threading.Event()
+    handled = [0]
+
+    def handle(obj):
+        handled[0] += 1
+        if handled[0] == MESSAGES:
+            done.set()
+
+    close = subscribe(handle)
+    start = time.perf_counter()
+    for _ in range(MESSAGES):
+        session.put(KEY, payload)
+    done.wait(600)
+    elapsed = time.perf_counter() - start
+    busy = close()
+    return {"messages/s": round(MESSAGES / elapsed), "callback us/msg": round(1e6 * busy / MESSAGES, 1)}
+
+
+def main() -> None:
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    session = zenoh.open(config)
+    encoder = YamlEncoder()
+    payload = encoder.encode(sample_document(50))
+    channel = FifoChannel(handler_type="FIFO", capacity=MESSAGES)
+
+    def inline(handle):
+        busy = [0.0]
+
+        def callback(sample):
+            start = time.perf_counter()
+            handle(encoder.decode(sample.payload.to_bytes()))
+            busy[0] += time.perf_counter() - start
+
+        subscriber = session.declare_subscriber(KEY, callback)
+
+        def close():
+            subscriber.undeclare()
+            return busy[0]
+
+        return close
+
+    def typed(workers, processes):
+        def subscribe(handle):
+            subscriber = _TimedSubscriber(
+                session, KEY, encoder, handle, workers=workers, processes=processes, channel=channel
+            )
+
+            def close():
+                subscriber.close()
+                return subscriber.busy
+
+            return close
+
+        return subscribe
+
+    rows = [{"mode": "inline callback", **_run(session, payload, inline)}]
+    for workers in (1, 4):
+        rows.append({"mode": f"{workers} thread(s)", **_run(session, payload, typed(workers, False))})
+    for workers in (2, 4):
+        rows.append({"mode": f"{workers} processes", **_run(session, payload, typed(workers, True))})
+    print(f"{len(payload)} B YAML documents, {os.cpu_count()} CPU(s)")
+    print_table(rows)
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
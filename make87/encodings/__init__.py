@@ -1,10 +1,40 @@
 from .json_ import JsonEncoder
 from .yaml_ import YamlEncoder
-from .protobuf import ProtobufEncoder
+from .msgpack_ import MsgpackEncoder
+from .cbor import CborEncoder
+from .protobuf import ProtobufEncoder, DelimitedProtobufEncoder
+from .compressed import CompressedEncoder
+from .delta import DeltaEncoder
+from .memoize import MemoizedEncoder
+from .ndarray import NdarrayEncoder
+from .pydantic_ import PydanticEncoder
+from .parallel import ParallelDecoder
+from .registry import get_encoder, register_encoding
 
 
 __all__ = [
     "JsonEncoder",
     "YamlEncoder",
+    "MsgpackEncoder",
+    "CborEncoder",
     "ProtobufEncoder",
+    "DelimitedProtobufEncoder",
+    "CompressedEncoder",
+    "DeltaEncoder",
+    "MemoizedEncoder",
+    "NdarrayEncoder",
+    "PydanticEncoder",
+    "ParallelDecoder",
+    "ArrowEncoder",
+    "get_encoder",
+    "register_encoding",
 ]
+
+
+def __getattr__(name):
+    # pyarrow imports NumPy and is slow to import, so the Arrow encoder is only loaded on first access.
+    if name == "ArrowEncoder":
+        from .arrow import ArrowEncoder
+
+        return ArrowEncoder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,191 @@
+"""Arrow IPC encoder for columnar record batches.
+
+This module provides an encoder that serializes `pyarrow.RecordBatch` and
+`pyarrow.Table` objects in the Arrow IPC stream format. One payload can
+hold any number of batches sharing a schema. Decoding maps the Arrow
+buffers directly onto the received payload instead of copying them. Falls
+back to an import error if pyarrow is not installed.
+"""
+
+try:
+    import pyarrow as pa
+    from typing import Iterable, Iterator, Optional, Union
+
+    from make87.encodings.base import Buffer, Encoder, WritableBuffer
+
+    Columnar = Union[pa.RecordBatch, pa.Table, Iterable[pa.RecordBatch]]
+
+    class ArrowEncoder(Encoder[pa.Table]):
+        """Arrow IPC stream encoder for record batches and tables.
+
+        Encodes a RecordBatch, a Table, or an iterable of RecordBatches into a
+        single IPC stream payload. Decoding returns a Table whose columns
+        reference the payload buffer, or iterates its batches one by one.
+
+        Attributes:
+            compression: IPC buffer compression codec, or None
+        """
+
+        def __init__(self, *, compression: Optional[str] = None) -> None:
+            """Initialize the Arrow encoder.
+
+            Args:
+                compression: Compress the IPC buffers with "lz4" or "zstd".
+                    Defaults to None. Compressed payloads are smaller on the
+                    wire but decoding has to decompress them, so they cannot
+                    be decoded without copying.
+
+            Raises:
+                ValueError: If the compression codec is not supported
+
+            Example:
+                >>> encoder = ArrowEncoder()
+                >>> table = pa.table({"robot_id": [1, 2], "battery": [0.9, 0.4]})
+                >>> decoded = encoder.decode(encoder.encode(table))
+            """
+            if compression is not None and compression not in ("lz4", "zstd"):
+                raise ValueError(f"Unsupported Arrow IPC compression {compression!r}. Choose one of: lz4, zstd")
+            self.compression = compression
+            self._options = pa.ipc.IpcWriteOptions(compression=compression)
+
+        def encode(self, obj: Columnar) -> bytes:
+            """Serialize record batches to an Arrow IPC stream.
+
+            Args:
+                obj: A RecordBatch, a Table, or an iterable of RecordBatches
+                    sharing one schema
+
+            Returns:
+                The IPC stream as bytes
+
+            Raises:
+                ValueError: If the batches are empty without a schema, their
+                    schemas differ, or Arrow encoding fails otherwise
+
+            Example:
+                >>> encoder = ArrowEncoder()
+                >>> payload = encoder.encode([batch_1, batch_2])
+            """
+            sink = pa.BufferOutputStream()
+            self._write(obj, sink)
+            return sink.getvalue().to_pybytes()
+
+        def encode_into(self, obj: Columnar, buffer: WritableBuffer) -> int:
+            """Serialize record batches straight into a caller-provided buffer.
+
+            The IPC writer writes into the buffer directly, without an
+            intermediate bytes object.
+
+            Args:
+                obj: A RecordBatch, a Table, or an iterable of RecordBatches
+                    sharing one schema
+                buffer: Writable buffer receiving the stream, starting at offset 0
+
+            Returns:
+                The number of bytes written to the buffer
+
+            Raises:
+                ValueError: If the buffer is too small or Arrow encoding fails
+
+            Example:
+                >>> buffer = bytearray(16 * 1024 * 1024)
+                >>> size = encoder.encode_into(table, buffer)
+            """
+            sink = pa.FixedSizeBufferWriter(pa.py_buffer(buffer))
+            self._write(obj, sink)
+            return sink.tell()
+
+        def decode(self, data: bytes) -> pa.Table:
+            """Deserialize an Arrow IPC stream to a Table.
+
+            Args:
+                data: IPC stream bytes
+
+            Returns:
+                A Table holding all batches of the stream
+
+            Raises:
+                ValueError: If the data is not a valid IPC stream
+            """
+            return self.decode_from(data)
+
+        def decode_from(self, data: Buffer) -> pa.Table:
+            """Deserialize an Arrow IPC stream from any bytes-like buffer without copying.
+
+            Uncompressed column buffers reference `data`, which therefore stays
+            alive as long as the Table does.
+
+            Args:
+                data: IPC stream as bytes, bytearray or memoryview
+
+            Returns:
+                A Table holding all batches of the stream
+
+            Raises:
+                ValueError: If the data is not a valid IPC stream
+
+            Example:
+                >>> encoder = ArrowEncoder()
+                >>> table = encoder.decode_from(memoryview(payload))
+            """
+            try:
+                return pa.ipc.open_stream(pa.py_buffer(data)).read_all()
+            except Exception as e:
+                raise ValueError(f"Arrow decoding failed: {e}")
+
+        def iter_decode(self, data: Buffer) -> Iterator[pa.RecordBatch]:
+            """Iterate over the record batches of an Arrow IPC stream without copying.
+
+            Batches are read one at a time, so consumers can process a
+            multi-batch payload before all of it has been parsed.
+
+            Args:
+                data: IPC stream as bytes, bytearray or memoryview
+
+            Yields:
+                The record batches of the stream, in order
+
+            Raises:
+                ValueError: If the data is not a valid IPC stream
+
+            Example:
+                >>> for batch in encoder.iter_decode(payload):
+                ...     process(batch)
+            """
+            try:
+                reader = pa.ipc.open_stream(pa.py_buffer(data))
+                for batch in reader:
+                    yield batch
+            except Exception as e:
+                raise ValueError(f"Arrow decoding failed: {e}")
+
+        def _write(self, obj: Columnar, sink: "pa.NativeFile") -> None:
+            """Write record batches as an IPC stream to a sink."""
+            try:
+                if isinstance(obj, (pa.RecordBatch, pa.Table)):
+                    with pa.ipc.new_stream(sink, obj.schema, options=self._options) as writer:
+                        writer.write(obj)
+                    return
+
+                batches = iter(obj)
+                first = next(batches, None)
+                if first is None:
+                    raise ValueError("cannot encode an empty batch sequence without a schema")
+                with pa.ipc.new_stream(sink, first.schema, options=self._options) as writer:
+                    writer.write_batch(first)
+                    for batch in batches:
+                        writer.write_batch(batch)
+            except Exception as e:
+                raise ValueError(f"Arrow encoding failed: {e}")
+
+except ImportError:
+
+    def _raise_arrow_import_error(*args, **kwargs):
+        """Raise ImportError when pyarrow dependencies are not installed.
+
+        Raises:
+            ImportError: Always raised with installation instructions
+        """
+        raise ImportError("Arrow support is not installed. " "Install with: pip install make87[arrow]")
+
+    ArrowEncoder = _raise_arrow_import_error
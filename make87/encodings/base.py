@@ -4,11 +4,14 @@ This module provides the abstract base class for all make87 data encoders,
 defining the interface for converting Python objects to and from bytes.
 """
 
-from typing import TypeVar, Generic
+from typing import Any, Callable, Iterable, List, TypeVar, Generic, Union
 from abc import ABC, abstractmethod
 
 T = TypeVar("T")  # The Python object type to encode/decode (e.g. dict, custom class)
 
+Buffer = Union[bytes, bytearray, memoryview]  # Read-only byte buffers accepted by `decode_from`
+WritableBuffer = Union[bytearray, memoryview]  # Writable byte buffers accepted by `encode_into`
+
 
 class Encoder(ABC, Generic[T]):
     """Abstract base class for data serialization and deserialization.
@@ -50,3 +53,164 @@ class Encoder(ABC, Generic[T]):
             DecodingError: If the data cannot be deserialized
         """
         pass
+
+    def encode_into(self, obj: T, buffer: WritableBuffer) -> int:
+        """Serialize a Python object into a caller-provided buffer.
+
+        Allows publishers to reuse one preallocated buffer for every message
+        instead of holding on to a fresh bytes object per message. Encoders
+        that can serialize directly into the target buffer override this method.
+
+        Args:
+            obj: The Python object to serialize
+            buffer: Writable buffer (e.g. a bytearray) that receives the
+                serialized bytes, starting at offset 0
+
+        Returns:
+            The number of bytes written to the buffer
+
+        Raises:
+            ValueError: If the buffer is too small to hold the serialized object
+
+        Example:
+            >>> buffer = bytearray(1024)
+            >>> size = encoder.encode_into(obj, buffer)
+            >>> payload = memoryview(buffer)[:size]
+        """
+        return write_into(self.encode(obj), buffer)
+
+    def decode_from(self, data: Buffer) -> T:
+        """Deserialize a Python object from any bytes-like buffer.
+
+        Unlike `decode`, this method accepts memoryviews and bytearrays, so
+        slices of a larger receive buffer can be decoded without first
+        copying them into a bytes object. Encoders whose parser can read the
+        buffer directly override this method to avoid the copy.
+
+        Args:
+            data: The bytes-like object to deserialize
+
+        Returns:
+            The deserialized Python object
+
+        Raises:
+            DecodingError: If the data cannot be deserialized
+
+        Example:
+            >>> view = memoryview(receive_buffer)[offset:offset + size]
+            >>> obj = encoder.decode_from(view)
+        """
+        return self.decode(bytes(data))
+
+    def encode_many(self, objs: Iterable[T]) -> List[bytes]:
+        """Serialize a batch of Python objects to one payload each.
+
+        The default implementation calls `encode` per object. Encoders with
+        per-call setup cost override this method to pay it once per batch.
+
+        Args:
+            objs: The Python objects to serialize
+
+        Returns:
+            One serialized payload per object, in input order
+
+        Raises:
+            EncodingError: If any object cannot be serialized
+
+        Example:
+            >>> payloads = encoder.encode_many(messages)
+            >>> for payload in payloads:
+            ...     publisher.put(payload)
+        """
+        return [self.encode(obj) for obj in objs]
+
+    def decode_many(self, buffers: Iterable[Buffer]) -> List[T]:
+        """Deserialize a batch of payloads, one Python object per payload.
+
+        The default implementation calls `decode_from` per payload. Encoders
+        that can parse several payloads in one pass override this method.
+
+        Args:
+            buffers: The bytes-like payloads to deserialize
+
+        Returns:
+            One deserialized object per payload, in input order
+
+        Raises:
+            DecodingError: If any payload cannot be deserialized
+
+        Example:
+            >>> payloads = [sample.payload.to_bytes() for sample in samples]
+            >>> messages = encoder.decode_many(payloads)
+        """
+        return [self.decode_from(data) for data in buffers]
+
+
+def write_into(data: Buffer, buffer: WritableBuffer) -> int:
+    """Copy serialized bytes to the start of a writable buffer.
+
+    Args:
+        data: The serialized bytes to copy
+        buffer: The writable target buffer
+
+    Returns:
+        The number of bytes written
+
+    Raises:
+        ValueError: If the buffer is smaller than the data
+    """
+    size = len(data)
+    target = memoryview(buffer).cast("B")
+    if size > target.nbytes:
+        raise ValueError(f"Buffer too small: need {size} bytes, got {target.nbytes}")
+    target[:size] = data
+    return size
+
+
+def unwrap_buffer(data: Buffer) -> Buffer:
+    """Return the object underlying a memoryview that spans all of it.
+
+    Some parsers (notably the upb protobuf backend) copy memoryviews into a
+    temporary bytes object but read bytes and bytearrays in place. Handing
+    them the underlying object avoids that copy whenever the view covers the
+    whole object.
+
+    Args:
+        data: A bytes-like object, possibly a memoryview
+
+    Returns:
+        The underlying bytes or bytearray if `data` is a memoryview spanning
+        it completely, otherwise `data` unchanged
+    """
+    if isinstance(data, memoryview):
+        base = data.obj
+        if isinstance(base, (bytes, bytearray)) and data.c_contiguous and data.nbytes == len(base):
+            return base
+    return data
+
+
+def apply_object_hook(value: Any, object_hook: Callable[[dict], Any]) -> Any:
+    """Apply an object hook to every dict of a decoded document.
+
+    Dicts are visited innermost first and replaced by the hook's return
+    value before their parent is visited, matching the order in which the
+    standard library JSON parser calls `object_hook`. Used by encoders whose
+    parsers have no native hook.
+
+    Args:
+        value: The decoded document
+        object_hook: The hook to call with every decoded dict
+
+    Returns:
+        The document with every dict replaced by the hook's return value
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = apply_object_hook(item, object_hook)
+        return object_hook(value)
+    if isinstance(value, list):
+        for index, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                value[index] = apply_object_hook(item, object_hook)
+    return value
@@ -0,0 +1,136 @@
+"""CBOR encoder for compact schemaless payloads.
+
+This module provides a CBOR (RFC 8949) encoder that converts Python
+objects to CBOR bytes and vice versa, with the same custom serialization
+and deserialization hooks as `JsonEncoder`. Bytes, datetimes and NumPy
+scalars are serialized without hooks. Falls back to an import error if
+cbor2 is not installed.
+"""
+
+try:
+    import cbor2
+    from datetime import timezone
+    from typing import Any, Callable, Optional, TypeVar
+
+    from make87.encodings.base import Buffer, Encoder, apply_object_hook, unwrap_buffer
+    from make87.encodings.native import to_native
+
+    T = TypeVar("T")
+
+    class CborEncoder(Encoder[T]):
+        """CBOR encoder for Python objects.
+
+        This encoder converts Python objects to CBOR bytes and deserializes
+        CBOR bytes back to Python objects. Besides the JSON types, it handles
+        bytes (as CBOR byte strings), datetimes (as epoch-based date/time
+        tags, decoded as UTC datetimes) and NumPy scalars (as plain numbers)
+        without hooks.
+
+        Attributes:
+            object_hook: Custom deserialization function for complex objects
+            default: Custom serialization function for complex objects
+        """
+
+        def __init__(
+            self,
+            *,
+            object_hook: Optional[Callable[[dict], T]] = None,
+            default: Optional[Callable[[T], Any]] = None,
+        ) -> None:
+            """Initialize the CBOR encoder with optional custom hooks.
+
+            Args:
+                object_hook: Custom deserialization function that will be called
+                    with every decoded map (a dict), innermost first. The return
+                    value will be used in place of the dict.
+                default: Custom serialization function that will be called for
+                    objects that are not serializable natively. Should return
+                    a serializable object or raise TypeError.
+
+            Example:
+                >>> encoder = CborEncoder()
+                >>> encoder.decode(encoder.encode({"score": np.float32(0.5), "mask": b"\\x01\\x00"}))
+                {'score': 0.5, 'mask': b'\\x01\\x00'}
+            """
+            self.object_hook = object_hook
+            self.default = default
+
+        def _default(self, encoder: "cbor2.CBOREncoder", obj: Any) -> None:
+            encoder.encode(to_native(obj, self.default))
+
+        def encode(self, obj: T) -> bytes:
+            """Serialize a Python object to CBOR bytes.
+
+            Args:
+                obj: The Python object to serialize
+
+            Returns:
+                CBOR bytes representation of the object
+
+            Raises:
+                ValueError: If encoding fails due to unsupported object types
+                    or other serialization errors
+
+            Example:
+                >>> encoder = CborEncoder()
+                >>> encoder.encode({"key": "value", "number": 42})
+                b'\\xa2ckeyevaluefnumber\\x18*'
+            """
+            try:
+                return cbor2.dumps(obj, default=self._default, datetime_as_timestamp=True, timezone=timezone.utc)
+            except Exception as e:
+                raise ValueError(f"CBOR encoding failed: {e}")
+
+        def decode(self, data: bytes) -> T:
+            """Deserialize CBOR bytes to a Python object.
+
+            Args:
+                data: CBOR bytes to deserialize
+
+            Returns:
+                The deserialized Python object
+
+            Raises:
+                ValueError: If decoding fails due to invalid or truncated data
+            """
+            return self.decode_from(data)
+
+        def decode_from(self, data: Buffer) -> T:
+            """Deserialize CBOR from any bytes-like buffer.
+
+            Bytes, and memoryviews spanning a bytes object, are parsed
+            directly. Other buffers are copied into bytes once, as cbor2
+            does with any other buffer type.
+
+            Args:
+                data: CBOR data as bytes, bytearray or memoryview
+
+            Returns:
+                The deserialized Python object
+
+            Raises:
+                ValueError: If decoding fails due to invalid or truncated data
+
+            Example:
+                >>> encoder = CborEncoder()
+                >>> encoder.decode_from(memoryview(b'\\xa1ckeyevalue'))
+                {'key': 'value'}
+            """
+            try:
+                value = cbor2.loads(unwrap_buffer(data))
+                # Applied in a separate pass: cbor2's own object_hook signature differs between releases.
+                return value if self.object_hook is None else apply_object_hook(value, self.object_hook)
+            except Exception as e:
+                raise ValueError(f"CBOR decoding failed: {e}")
+
+except ImportError:
+
+    def _raise_cbor_import_error(*args, **kwargs):
+        """Raise ImportError when cbor2 dependencies are not installed.
+
+        Raises:
+            ImportError: Always raised with installation instructions
+        """
+        raise ImportError("CBOR support is not installed. " "Install with: pip install make87[cbor]")
+
+    CborEncoder = _raise_cbor_import_error
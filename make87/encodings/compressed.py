@@ -0,0 +1,458 @@
+"""Compressing encoder that wraps any other encoder.
+
+This module provides an encoder that compresses the payloads of an inner
+encoder with zlib, lzma, zstd or lz4. Every payload starts with a small
+header naming the algorithm, so decoders accept payloads of any installed
+algorithm. Payloads can be compressed with a dictionary trained from sample
+payloads of a topic, which pays off for the small, repetitive messages that
+generic compression barely shrinks.
+
+Header layout:
+
+    byte 0      low nibble: algorithm id (0 = stored raw), bit 4: dictionary flag
+    bytes 1-4   dictionary id (little endian), only present with the dictionary flag
+"""
+
+import lzma
+import struct
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from make87.encodings.base import Buffer, Encoder
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.block as lz4_block
+except ImportError:
+    lz4_block = None
+
+T = TypeVar("T")
+
+_RAW_ID = 0
+_DICT_FLAG = 0x10
+_ALGORITHM_MASK = 0x0F
+_DICT_ID = struct.Struct("<I")
+
+
+class CompressionDictionary:
+    """A compression dictionary trained for one algorithm.
+
+    Attributes:
+        algorithm: Name of the algorithm the dictionary was trained for
+        dict_id: Non-zero id written to the header of every payload compressed with it
+        data: Raw dictionary bytes
+    """
+
+    def __init__(self, algorithm: str, data: bytes, dict_id: Optional[int] = None) -> None:
+        """Initialize a dictionary from raw dictionary bytes.
+
+        Args:
+            algorithm: Name of the algorithm the dictionary was trained for
+            data: Raw dictionary bytes, e.g. as stored from a previous training
+            dict_id: Dictionary id. Defaults to the id zstd stores in a trained
+                dictionary, or the Adler-32 checksum of the data otherwise.
+
+        Raises:
+            ValueError: If the algorithm does not support dictionaries or the data is empty
+        """
+        if algorithm not in ("zlib", "zstd", "lz4"):
+            raise ValueError(f"Algorithm {algorithm!r} does not support dictionaries. Choose one of: zlib, zstd, lz4")
+        if not data:
+            raise ValueError("Compression dictionary must not be empty.")
+
+        if dict_id is None and algorithm == "zstd" and zstandard is not None:
+            dict_id = zstandard.ZstdCompressionDict(data).dict_id()
+        if not dict_id:
+            dict_id = zlib.adler32(data) or 1
+
+        self.algorithm = algorithm
+        self.data = bytes(data)
+        self.dict_id = dict_id & 0xFFFFFFFF
+
+    def __repr__(self) -> str:
+        return f"CompressionDictionary(algorithm={self.algorithm!r}, dict_id={self.dict_id}, size={len(self.data)})"
+
+
+class _ZlibCodec:
+    """Raw DEFLATE streams; the header replaces the zlib container."""
+
+    name = "zlib"
+    algorithm_id = 1
+    default_level = 6
+    max_dictionary_size = 32 * 1024
+
+    @staticmethod
+    def compress(data: Buffer, level: int, dictionary: Optional[CompressionDictionary]) -> bytes:
+        if dictionary is None:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        else:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=dictionary.data)
+        return compressor.compress(data) + compressor.flush()
+
+    @staticmethod
+    def decompress(data: Buffer, dictionary: Optional[CompressionDictionary]) -> bytes:
+        if dictionary is None:
+            decompressor = zlib.decompressobj(-15)
+        else:
+            decompressor = zlib.decompressobj(-15, zdict=dictionary.data)
+        return decompressor.decompress(data) + decompressor.flush()
+
+
+class _LzmaCodec:
+    """Raw LZMA2 streams; the header replaces the xz container."""
+
+    name = "lzma"
+    algorithm_id = 2
+    default_level = 6
+    max_dictionary_size = 0
+
+    @staticmethod
+    def _filters(level: int) -> List[dict]:
+        return [{"id": lzma.FILTER_LZMA2, "preset": level}]
+
+    @classmethod
+    def compress(cls, data: Buffer, level: int, dictionary: Optional[CompressionDictionary]) -> bytes:
+        return lzma.compress(data, format=lzma.FORMAT_RAW, filters=cls._filters(level))
+
+    @classmethod
+    def decompress(cls, data: Buffer, dictionary: Optional[CompressionDictionary]) -> bytes:
+        # The largest preset dictionary size decodes streams of every level.
+        return lzma.decompress(data, format=lzma.FORMAT_RAW, filters=cls._filters(9))
+
+
+class _ZstdCodec:
+    """Zstandard frames without checksum and dictionary id.
+
+    Compression contexts are expensive to create and not thread-safe, so
+    every thread keeps its own contexts per level and dictionary.
+    """
+
+    name = "zstd"
+    algorithm_id = 3
+    default_level = 3
+    max_dictionary_size = 1024 * 1024
+    _local = threading.local()
+
+    @classmethod
+    def _contexts(cls) -> Dict[Tuple, object]:
+        contexts = getattr(cls._local, "contexts", None)
+        if contexts is None:
+            contexts = cls._local.contexts = {}
+        return contexts
+
+    @staticmethod
+    def _dict_data(dictionary: Optional[CompressionDictionary]):
+        return None if dictionary is None else zstandard.ZstdCompressionDict(dictionary.data)
+
+    @classmethod
+    def compress(cls, data: Buffer, level: int, dictionary: Optional[CompressionDictionary]) -> bytes:
+        contexts = cls._contexts()
+        key = ("c", level, dictionary and dictionary.dict_id)
+        compressor = contexts.get(key)
+        if compressor is None:
+            compressor = contexts[key] = zstandard.ZstdCompressor(
+                level=level, dict_data=cls._dict_data(dictionary), write_checksum=False, write_dict_id=False
+            )
+        return compressor.compress(data)
+
+    @classmethod
+    def decompress(cls, data: Buffer, dictionary: Optional[CompressionDictionary]) -> bytes:
+        contexts = cls._contexts()
+        key = ("d", dictionary and dictionary.dict_id)
+        decompressor = contexts.get(key)
+        if decompressor is None:
+            decompressor = contexts[key] = zstandard.ZstdDecompressor(dict_data=cls._dict_data(dictionary))
+        return decompressor.decompress(data)
+
+
+class _Lz4Codec:
+    """LZ4 blocks prefixed with their uncompressed size.
+
+    A level of 0 selects the fast mode, higher levels the high compression
+    mode.
+    """
+
+    name = "lz4"
+    algorithm_id = 4
+    default_level = 0
+    max_dictionary_size = 64 * 1024
+
+    @staticmethod
+    def compress(data: Buffer, level: int, dictionary: Optional[CompressionDictionary]) -> bytes:
+        kwargs = {} if dictionary is None else {"dict": dictionary.data}
+        if level > 0:
+            return lz4_block.compress(data, mode="high_compression", compression=level, **kwargs)
+        return lz4_block.compress(data, **kwargs)
+
+    @staticmethod
+    def decompress(data: Buffer, dictionary: Optional[CompressionDictionary]) -> bytes:
+        kwargs = {} if dictionary is None else {"dict": dictionary.data}
+        return lz4_block.decompress(data, **kwargs)
+
+
+_CODECS = {
+    "zlib": (_ZlibCodec, zlib),
+    "lzma": (_LzmaCodec, lzma),
+    "zstd": (_ZstdCodec, zstandard),
+    "lz4": (_Lz4Codec, lz4_block),
+}
+_CODECS_BY_ID = {codec.algorithm_id: name for name, (codec, _) in _CODECS.items()}
+
+
+def available_compression_algorithms() -> List[str]:
+    """List the compression algorithms that can be used in this environment.
+
+    Returns:
+        Names of the installed algorithms
+
+    Example:
+        >>> available_compression_algorithms()
+        ['zlib', 'lzma', 'zstd']
+    """
+    return [name for name, (_, module) in _CODECS.items() if module is not None]
+
+
+def _get_codec(algorithm: str):
+    """Look up the codec of an installed algorithm.
+
+    Raises:
+        ValueError: If the algorithm is unknown or not installed
+    """
+    if algorithm not in _CODECS:
+        raise ValueError(f"Unknown compression algorithm {algorithm!r}. Choose one of: {', '.join(_CODECS)}")
+    codec, module = _CODECS[algorithm]
+    if module is None:
+        raise ValueError(
+            f"Compression algorithm {algorithm!r} is not installed. Install with: pip install make87[{algorithm}]"
+        )
+    return codec
+
+
+def train_dictionary(
+    payloads: Iterable[Buffer], *, algorithm: str = "zstd", size: int = 16 * 1024
+) -> CompressionDictionary:
+    """Train a compression dictionary from sample payloads of one topic.
+
+    For zstd, the dictionary is trained with zstd's own trainer. zlib and lz4
+    take a raw content dictionary: the most recent samples are concatenated
+    up to the dictionary size, as both algorithms only match against the
+    last bytes of the dictionary window.
+
+    Args:
+        payloads: Representative encoded payloads, e.g. the output of the inner
+            encoder for a few hundred recent messages of the topic
+        algorithm: Algorithm to train for. One of "zstd", "zlib" or "lz4".
+        size: Maximum dictionary size in bytes. Capped at the window size of
+            the algorithm (32 KiB for zlib, 64 KiB for lz4).
+
+    Returns:
+        The trained dictionary
+
+    Raises:
+        ValueError: If the algorithm does not support dictionaries, is not
+            installed, or training fails (e.g. too few samples)
+
+    Example:
+        >>> inner = JsonEncoder()
+        >>> samples = [inner.encode(msg) for msg in recent_messages]
+        >>> dictionary = train_dictionary(samples, algorithm="zstd")
+        >>> encoder = CompressedEncoder(inner, algorithm="zstd", dictionary=dictionary)
+    """
+    codec = _get_codec(algorithm)
+    if not codec.max_dictionary_size:
+        raise ValueError(f"Algorithm {algorithm!r} does not support dictionaries. Choose one of: zlib, zstd, lz4")
+    size = min(size, codec.max_dictionary_size)
+    samples = [bytes(payload) for payload in payloads]
+    if not samples:
+        raise ValueError("Dictionary training needs at least one sample payload.")
+
+    if algorithm == "zstd":
+        try:
+            trained = zstandard.train_dictionary(size, samples)
+        except Exception as e:
+            raise ValueError(f"Dictionary training failed: {e}")
+        return CompressionDictionary(algorithm, trained.as_bytes(), trained.dict_id())
+
+    data = bytearray()
+    for sample in reversed(samples):
+        data[:0] = sample
+        if len(data) >= size:
+            break
+    return CompressionDictionary(algorithm, bytes(data[-size:]))
+
+
+class CompressedEncoder(Encoder[T]):
+    """Encoder that compresses the payloads of an inner encoder.
+
+    Payloads smaller than `min_size`, and payloads that do not shrink, are
+    stored raw behind a one-byte header, so small messages pay no
+    compression cost. Decoding reads the algorithm from the header and
+    accepts payloads of every installed algorithm.
+
+    Attributes:
+        inner: Encoder producing the uncompressed payloads
+        algorithm: Name of the compression algorithm used for encoding
+        level: Compression level passed to the algorithm
+        min_size: Payloads below this size in bytes are stored raw
+        dictionary: Dictionary used for compression, if any
+    """
+
+    def __init__(
+        self,
+        inner: Encoder[T],
+        *,
+        algorithm: str = "zlib",
+        level: Optional[int] = None,
+        min_size: int = 64,
+        dictionary: Optional[CompressionDictionary] = None,
+    ) -> None:
+        """Initialize the compressing encoder.
+
+        Args:
+            inner: Encoder producing the uncompressed payloads
+            algorithm: One of "zlib", "lzma", "zstd" or "lz4". zlib and lzma are
+                part of the standard library, zstd and lz4 need the matching
+                extra to be installed.
+            level: Compression level. Defaults to 6 for zlib and lzma, 3 for
+                zstd and 0 (fast mode) for lz4.
+            min_size: Payloads below this size in bytes are stored raw. Defaults to 64.
+            dictionary: Dictionary from `train_dictionary` for the same algorithm.
+                Decoding payloads compressed with a dictionary requires an
+                encoder holding the dictionary with the same id.
+
+        Raises:
+            ValueError: If the algorithm is unknown or not installed, or the
+                dictionary was trained for another algorithm
+
+        Example:
+            >>> encoder = CompressedEncoder(JsonEncoder(), algorithm="zstd", level=3)
+            >>> encoder.decode(encoder.encode({"key": "value"}))
+            {'key': 'value'}
+        """
+        self._codec = _get_codec(algorithm)
+        if dictionary is not None and dictionary.algorithm != algorithm:
+            raise ValueError(
+                f"Dictionary was trained for {dictionary.algorithm!r} and cannot be used with {algorithm!r}."
+            )
+
+        self.inner = inner
+        self.algorithm = algorithm
+        self.level = self._codec.default_level if level is None else level
+        self.min_size = min_size
+        self.dictionary = dictionary
+
+        if dictionary is None:
+            self._header = bytes([self._codec.algorithm_id])
+        else:
+            self._header = bytes([self._codec.algorithm_id | _DICT_FLAG]) + _DICT_ID.pack(dictionary.dict_id)
+
+    def encode(self, obj: T) -> bytes:
+        """Serialize an object with the inner encoder and compress the payload.
+
+        Args:
+            obj: The object to serialize
+
+        Returns:
+            Header followed by the compressed or raw payload
+
+        Raises:
+            ValueError: If the inner encoder or the compression fails
+        """
+        return self._compress(self.inner.encode(obj))
+
+    def decode(self, data: bytes) -> T:
+        """Decompress a payload and deserialize it with the inner encoder.
+
+        Args:
+            data: Payload produced by `encode`
+
+        Returns:
+            The deserialized object
+
+        Raises:
+            ValueError: If the header is invalid, the algorithm is not installed,
+                the dictionary id is unknown, or decompression or the inner
+                encoder fails
+        """
+        return self.decode_from(data)
+
+    def decode_from(self, data: Buffer) -> T:
+        """Decompress a payload from any bytes-like buffer and deserialize it.
+
+        Raw payloads are handed to the inner encoder's `decode_from` as a
+        memoryview slice, without copying.
+
+        Args:
+            data: Payload produced by `encode`, as bytes, bytearray or memoryview
+
+        Returns:
+            The deserialized object
+
+        Raises:
+            ValueError: If the header is invalid, the algorithm is not installed,
+                the dictionary id is unknown, or decompression or the inner
+                encoder fails
+        """
+        view = memoryview(data)
+        if not view:
+            raise ValueError("Compressed payload is empty.")
+        if view[0] == _RAW_ID:
+            return self.inner.decode_from(view[1:])
+        return self.inner.decode(self._decompress(view))
+
+    def encode_many(self, objs: Iterable[T]) -> List[bytes]:
+        """Serialize and compress a batch of objects.
+
+        The inner encoder serializes the whole batch in one call, see
+        `Encoder.encode_many`.
+
+        Args:
+            objs: The objects to serialize
+
+        Returns:
+            One compressed payload per object, in input order
+
+        Raises:
+            ValueError: If the inner encoder or the compression fails
+        """
+        return [self._compress(payload) for payload in self.inner.encode_many(objs)]
+
+    def _compress(self, payload: bytes) -> bytes:
+        """Compress an inner payload and prepend the header."""
+        if len(payload) >= self.min_size:
+            try:
+                compressed = self._codec.compress(payload, self.level, self.dictionary)
+            except Exception as e:
+                raise ValueError(f"Compression failed: {e}")
+            if len(compressed) + len(self._header) < len(payload) + 1:
+                return self._header + compressed
+        return b"\x00" + payload
+
+    def _decompress(self, view: memoryview) -> bytes:
+        """Decompress a payload that is not stored raw."""
+        flags = view[0]
+        algorithm = _CODECS_BY_ID.get(flags & _ALGORITHM_MASK)
+        if algorithm is None or flags & ~(_ALGORITHM_MASK | _DICT_FLAG):
+            raise ValueError(f"Invalid compression header byte {flags:#04x}.")
+        codec = _get_codec(algorithm)
+
+        dictionary = None
+        offset = 1
+        if flags & _DICT_FLAG:
+            if len(view) < 1 + _DICT_ID.size:
+                raise ValueError("Compressed payload is truncated.")
+            (dict_id,) = _DICT_ID.unpack_from(view, 1)
+            dictionary = self.dictionary
+            if dictionary is None or dictionary.dict_id != dict_id or dictionary.algorithm != algorithm:
+                raise ValueError(f"Payload was compressed with unknown {algorithm} dictionary id {dict_id}.")
+            offset += _DICT_ID.size
+
+        try:
+            return codec.decompress(view[offset:], dictionary)
+        except Exception as e:
+            raise ValueError(f"Decompression failed: {e}")
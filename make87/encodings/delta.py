@@ -0,0 +1,391 @@
+"""Keyframe and delta encoder for slowly changing state topics.
+
+This module provides an encoder that wraps any other encoder and sends
+full keyframes periodically, with binary diffs against the last keyframe
+in between. Topics republishing large state messages (maps, configuration
+blobs, occupancy grids) of which only a few bytes change per message shrink
+by orders of magnitude on the wire.
+
+Every delta refers to a keyframe, not to the previous message, so lost
+deltas do not corrupt later ones. Only a lost keyframe makes the following
+deltas undecodable, which the decoder reports with `MissingKeyframeError`
+until the next keyframe arrives.
+
+Payload layout:
+
+    byte 0      kind: 0 = keyframe, 1 = delta
+    bytes 1-4   stream id (u32, little endian), random per encoder instance
+    varint      sequence number of the message
+    keyframe    inner payload
+    delta       varint sequence number of the keyframe, then operations:
+                varint (length << 1 | 0) + varint keyframe offset  copy bytes from the keyframe
+                varint (length << 1 | 1) + literal bytes           insert new bytes
+"""
+
+import random
+import struct
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, TypeVar
+
+from make87.encodings.base import Buffer, Encoder
+from make87.encodings.framing import decode_varint, encode_varint
+
+T = TypeVar("T")
+
+_KEYFRAME = 0
+_DELTA = 1
+_HEADER = struct.Struct("<BI")
+_COPY = 0
+_INSERT = 1
+_MAX_STREAMS = 16
+_RESYNC_WINDOW = 1024
+
+
+class MissingKeyframeError(ValueError):
+    """Raised when a delta refers to a keyframe the decoder has not received.
+
+    Attributes:
+        stream_id: Stream id of the publishing encoder
+        keyframe_sequence: Sequence number of the missing keyframe
+    """
+
+    def __init__(self, stream_id: int, keyframe_sequence: int) -> None:
+        super().__init__(
+            f"Delta refers to keyframe {keyframe_sequence} of stream {stream_id:#010x}, which was not received."
+        )
+        self.stream_id = stream_id
+        self.keyframe_sequence = keyframe_sequence
+
+
+def _match_length(old: memoryview, old_start: int, new: bytes, new_start: int, limit: int) -> int:
+    """Get the number of equal bytes of `old[old_start:]` and `new[new_start:]`, up to `limit`.
+
+    Binary searches with `bytes.startswith`, which compares natively without
+    copying the memoryview slices.
+    """
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if new.startswith(old[old_start + low : old_start + middle], new_start + low):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _suffix_length(old: memoryview, new: bytes, limit: int) -> int:
+    """Get the length of the common suffix of two buffers, up to `limit` bytes."""
+    old_end, new_end = len(old), len(new)
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if new.startswith(old[old_end - middle : old_end - low], new_end - middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _resync(
+    old: bytes, old_position: int, old_end: int, new: bytes, new_position: int, new_end: int, block_size: int
+) -> Optional[Tuple[int, int]]:
+    """Find where `new` matches `old` again after a change at the given positions.
+
+    Probes blocks of `new` following the change, first at the same distance
+    in `old` (bytes changed in place), then anywhere within a window around
+    it (bytes inserted or removed).
+
+    Returns:
+        The positions in `old` and `new` at which a block matches, or None
+    """
+    for skip in range(0, min(_RESYNC_WINDOW, new_end - new_position - block_size) + 1, block_size):
+        start = new_position + skip
+        block = new[start : start + block_size]
+        if old_position + skip + block_size <= old_end and old.startswith(block, old_position + skip):
+            return old_position + skip, start
+        found = old.find(
+            block, max(old_position - _RESYNC_WINDOW, 0), min(old_position + skip + _RESYNC_WINDOW, old_end)
+        )
+        if found >= 0:
+            return found, start
+    return None
+
+
+def diff(old: Buffer, new: Buffer, block_size: int = 32) -> bytes:
+    """Compute the delta operations rebuilding `new` from `old`.
+
+    Walks both buffers, copying matching runs from `old` and inserting the
+    bytes of `new` between them. After a change, matching resumes at the
+    next block of `new` found near the current position in `old`, so edits
+    in place as well as inserted or removed bytes yield small deltas.
+
+    Args:
+        old: The keyframe payload
+        new: The payload to encode
+        block_size: Minimum length in bytes of a matching run after a change
+
+    Returns:
+        The encoded delta operations
+    """
+    if not isinstance(old, bytes):
+        old = bytes(old)
+    if not isinstance(new, bytes):
+        new = bytes(new)
+    old_view = memoryview(old)
+    limit = min(len(old), len(new))
+    old_position = new_position = _match_length(old_view, 0, new, 0, limit)
+    suffix = _suffix_length(old_view, new, limit - old_position)
+    old_end, new_end = len(old) - suffix, len(new) - suffix
+
+    ops = bytearray()
+
+    def copy(offset: int, length: int) -> None:
+        if length:
+            ops.extend(encode_varint(length << 1 | _COPY))
+            ops.extend(encode_varint(offset))
+
+    def insert(start: int, end: int) -> None:
+        if end > start:
+            ops.extend(encode_varint((end - start) << 1 | _INSERT))
+            ops.extend(new[start:end])
+
+    copy(0, old_position)
+    while new_position < new_end:
+        match = _resync(old, old_position, old_end, new, new_position, new_end, block_size)
+        if match is None:
+            # Nothing matches nearby: insert the window and continue past it.
+            skip = min(_RESYNC_WINDOW, new_end - new_position)
+            insert(new_position, new_position + skip)
+            old_position, new_position = old_position + skip, new_position + skip
+            continue
+        insert(new_position, match[1])
+        old_position, new_position = match
+        length = _match_length(
+            old_view, old_position, new, new_position, min(old_end - old_position, new_end - new_position)
+        )
+        if not length:
+            # Always move forward, even if the match does not extend into the compared range.
+            insert(new_position, new_position + 1)
+            old_position, new_position = old_position + 1, new_position + 1
+            continue
+        copy(old_position, length)
+        old_position, new_position = old_position + length, new_position + length
+    copy(old_end, suffix)
+    return bytes(ops)
+
+
+def patch(old: Buffer, ops: Buffer) -> bytes:
+    """Apply delta operations produced by `diff` to a keyframe.
+
+    Args:
+        old: The keyframe payload
+        ops: The encoded delta operations
+
+    Returns:
+        The rebuilt payload
+
+    Raises:
+        ValueError: If the operations are malformed or exceed the keyframe
+    """
+    old = memoryview(old).cast("B")
+    ops = memoryview(ops).cast("B")
+    parts = []
+    offset = 0
+    while offset < len(ops):
+        value, offset = decode_varint(ops, offset)
+        length = value >> 1
+        if value & 1 == _INSERT:
+            if offset + length > len(ops):
+                raise ValueError("Delta is truncated.")
+            parts.append(ops[offset : offset + length])
+            offset += length
+        else:
+            source, offset = decode_varint(ops, offset)
+            if source + length > len(old):
+                raise ValueError("Delta copies beyond the end of the keyframe.")
+            parts.append(old[source : source + length])
+    return b"".join(parts)
+
+
+class DeltaEncoder(Encoder[T]):
+    """Encoder sending periodic keyframes and binary diffs against them.
+
+    The same instance encodes on the publisher side and decodes on the
+    subscriber side. Encoding keeps the last keyframe sent; decoding keeps
+    the last keyframe received per publishing stream.
+
+    Attributes:
+        inner: Encoder producing the full payloads
+        keyframe_interval: Maximum number of messages between keyframes
+        max_delta_ratio: Deltas larger than this fraction of the full payload
+            are sent as keyframes instead
+        stream_id: Random id identifying this encoder's stream to decoders
+    """
+
+    def __init__(
+        self,
+        inner: Encoder[T],
+        *,
+        keyframe_interval: int = 100,
+        max_delta_ratio: float = 0.5,
+        block_size: int = 32,
+        on_missing_keyframe: Optional[Callable[[MissingKeyframeError], None]] = None,
+    ) -> None:
+        """Initialize the delta encoder.
+
+        Args:
+            inner: Encoder producing the full payloads
+            keyframe_interval: Maximum number of messages between keyframes,
+                which bounds how long a subscriber that joins late or lost a
+                keyframe waits for the next one. Defaults to 100.
+            max_delta_ratio: Send a keyframe instead of a delta whose size
+                exceeds this fraction of the full payload. Defaults to 0.5.
+            block_size: Minimum length in bytes of an unchanged run that is
+                copied from the keyframe after a change. Defaults to 32.
+            on_missing_keyframe: Called by `decode` before it raises
+                `MissingKeyframeError`, e.g. to ask the publisher for a
+                keyframe over a side channel that calls `force_keyframe`.
+
+        Raises:
+            ValueError: If keyframe_interval or block_size is below 1
+
+        Example:
+            >>> # Publisher
+            >>> encoder = DeltaEncoder(ProtobufEncoder(OccupancyGrid), keyframe_interval=50)
+            >>> publisher.put(encoder.encode(grid))
+            >>>
+            >>> # Subscriber
+            >>> decoder = DeltaEncoder(ProtobufEncoder(OccupancyGrid))
+            >>> try:
+            ...     grid = decoder.decode(sample.payload.to_bytes())
+            ... except MissingKeyframeError:
+            ...     pass  # skip until the next keyframe arrives
+        """
+        if keyframe_interval < 1 or block_size < 1:
+            raise ValueError("keyframe_interval and block_size must be at least 1")
+        self.inner = inner
+        self.keyframe_interval = keyframe_interval
+        self.max_delta_ratio = max_delta_ratio
+        self.block_size = block_size
+        self.on_missing_keyframe = on_missing_keyframe
+        self.stream_id = random.getrandbits(32)
+
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._keyframe: Optional[bytes] = None
+        self._keyframe_sequence = 0
+        self._force_keyframe = True
+        self._received: "OrderedDict[int, Tuple[int, bytes]]" = OrderedDict()
+
+    def force_keyframe(self) -> None:
+        """Make the next encoded message a keyframe.
+
+        Call this when a subscriber requests a keyframe, e.g. after it
+        joined late or reported a `MissingKeyframeError`.
+        """
+        self._force_keyframe = True
+
+    def encode(self, obj: T) -> bytes:
+        """Serialize an object as a keyframe or as a delta against the last keyframe.
+
+        Args:
+            obj: The object to serialize
+
+        Returns:
+            The keyframe or delta payload
+
+        Raises:
+            ValueError: If the inner encoder fails
+        """
+        payload = self.inner.encode(obj)
+        with self._lock:
+            sequence = self._sequence
+            self._sequence += 1
+            keyframe = self._keyframe
+            if (
+                keyframe is not None
+                and not self._force_keyframe
+                and sequence - self._keyframe_sequence < self.keyframe_interval
+            ):
+                ops = diff(keyframe, payload, self.block_size)
+                if len(ops) <= self.max_delta_ratio * len(payload):
+                    return b"".join(
+                        (
+                            _HEADER.pack(_DELTA, self.stream_id),
+                            encode_varint(sequence),
+                            encode_varint(self._keyframe_sequence),
+                            ops,
+                        )
+                    )
+            self._keyframe = payload
+            self._keyframe_sequence = sequence
+            self._force_keyframe = False
+            return b"".join((_HEADER.pack(_KEYFRAME, self.stream_id), encode_varint(sequence), payload))
+
+    def decode(self, data: bytes) -> T:
+        """Deserialize a keyframe or delta payload.
+
+        Args:
+            data: Payload produced by `encode`
+
+        Returns:
+            The deserialized object
+
+        Raises:
+            MissingKeyframeError: If the payload is a delta against a keyframe
+                that was not received (e.g. after joining late or a lost keyframe)
+            ValueError: If the payload is malformed or the inner encoder fails
+        """
+        return self.decode_from(data)
+
+    def decode_from(self, data: Buffer) -> T:
+        """Deserialize a keyframe or delta payload from any bytes-like buffer.
+
+        Keyframe payloads are handed to the inner encoder's `decode_from` as a
+        memoryview slice, without copying.
+
+        Args:
+            data: Payload produced by `encode`, as bytes, bytearray or memoryview
+
+        Returns:
+            The deserialized object
+
+        Raises:
+            MissingKeyframeError: If the payload is a delta against a keyframe
+                that was not received (e.g. after joining late or a lost keyframe)
+            ValueError: If the payload is malformed or the inner encoder fails
+        """
+        view = memoryview(data).cast("B")
+        try:
+            kind, stream_id = _HEADER.unpack_from(view, 0)
+            sequence, offset = decode_varint(view, _HEADER.size)
+        except (struct.error, ValueError) as e:
+            raise ValueError(f"Delta decoding failed: {e}")
+
+        if kind == _KEYFRAME:
+            payload = view[offset:]
+            with self._lock:
+                self._received[stream_id] = (sequence, bytes(payload))
+                self._received.move_to_end(stream_id)
+                while len(self._received) > _MAX_STREAMS:
+                    self._received.popitem(last=False)
+            return self.inner.decode_from(payload)
+        if kind != _DELTA:
+            raise ValueError(f"Delta decoding failed: unknown payload kind {kind}")
+
+        try:
+            keyframe_sequence, offset = decode_varint(view, offset)
+        except ValueError as e:
+            raise ValueError(f"Delta decoding failed: {e}")
+        keyframe = self._received.get(stream_id)
+        if keyframe is None or keyframe[0] != keyframe_sequence:
+            error = MissingKeyframeError(stream_id, keyframe_sequence)
+            if self.on_missing_keyframe is not None:
+                self.on_missing_keyframe(error)
+            raise error
+        try:
+            payload = patch(keyframe[1], view[offset:])
+        except ValueError as e:
+            raise ValueError(f"Delta decoding failed: {e}")
+        return self.inner.decode(payload)
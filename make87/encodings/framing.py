@@ -0,0 +1,182 @@
+"""Varint length-prefixed framing for streams of encoded messages.
+
+This module implements the framing used by protobuf's `writeDelimitedTo` /
+`parseDelimitedFrom`: every payload is preceded by its length encoded as a
+base-128 varint. The helpers are independent of any encoding and can frame
+JSON, YAML or protobuf payloads alike.
+"""
+
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple, Union
+
+from make87.encodings.base import Buffer
+
+Source = Union[bytes, bytearray, memoryview, BinaryIO]  # Framed data held in memory or read from a binary stream
+
+_MAX_VARINT_BYTES = 10
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a base-128 varint.
+
+    Args:
+        value: The integer to encode
+
+    Returns:
+        The varint encoding of the value
+
+    Raises:
+        ValueError: If the value is negative
+
+    Example:
+        >>> encode_varint(300)
+        b'\\xac\\x02'
+    """
+    if value < 0:
+        raise ValueError(f"Cannot encode negative varint: {value}")
+    if value < 0x80:
+        return bytes((value,))
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(data: Buffer, offset: int = 0) -> Tuple[int, int]:
+    """Decode a base-128 varint from a buffer.
+
+    Args:
+        data: The buffer holding the varint
+        offset: Position of the first varint byte
+
+    Returns:
+        A tuple of the decoded value and the offset just past the varint
+
+    Raises:
+        ValueError: If the varint is truncated or longer than 10 bytes
+
+    Example:
+        >>> decode_varint(b'\\xac\\x02rest')
+        (300, 2)
+    """
+    result = 0
+    shift = 0
+    end = len(data)
+    for position in range(offset, min(end, offset + _MAX_VARINT_BYTES)):
+        byte = data[position]
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position + 1
+        shift += 7
+    if end - offset >= _MAX_VARINT_BYTES:
+        raise ValueError("Varint is longer than 10 bytes")
+    raise ValueError("Truncated varint")
+
+
+def read_varint(stream: BinaryIO) -> Optional[int]:
+    """Read a base-128 varint from a binary stream.
+
+    Args:
+        stream: A readable binary file-like object
+
+    Returns:
+        The decoded value, or None if the stream is at its end before the
+        first varint byte
+
+    Raises:
+        ValueError: If the stream ends in the middle of the varint or the
+            varint is longer than 10 bytes
+    """
+    result = 0
+    for index in range(_MAX_VARINT_BYTES):
+        chunk = stream.read(1)
+        if not chunk:
+            if index == 0:
+                return None
+            raise ValueError("Truncated varint")
+        byte = chunk[0]
+        result |= (byte & 0x7F) << (7 * index)
+        if not byte & 0x80:
+            return result
+    raise ValueError("Varint is longer than 10 bytes")
+
+
+def frame(payloads: Iterable[Buffer]) -> bytes:
+    """Concatenate payloads into one length-delimited stream.
+
+    Args:
+        payloads: The encoded payloads to frame
+
+    Returns:
+        The framed stream: a varint length followed by the payload, for
+        every payload in input order
+
+    Example:
+        >>> frame([b"ab", b"c"])
+        b'\\x02ab\\x01c'
+    """
+    parts = []
+    for payload in payloads:
+        parts.append(encode_varint(len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+def write_frame(stream: BinaryIO, payload: Buffer) -> int:
+    """Write one length-delimited payload to a binary stream.
+
+    Args:
+        stream: A writable binary file-like object
+        payload: The encoded payload to write
+
+    Returns:
+        The number of bytes written, including the length prefix
+    """
+    prefix = encode_varint(len(payload))
+    stream.write(prefix)
+    stream.write(payload)
+    return len(prefix) + len(payload)
+
+
+def iter_frames(source: Source) -> Iterator[Buffer]:
+    """Iterate over the payloads of a length-delimited stream.
+
+    Payloads are produced one at a time, so the stream is never materialized
+    as a whole. In-memory sources yield memoryview slices of the source
+    without copying. File objects are read incrementally and yield one bytes
+    object per payload.
+
+    Args:
+        source: The framed stream as bytes, bytearray, memoryview or a
+            readable binary file-like object
+
+    Yields:
+        The payload of every frame, in stream order
+
+    Raises:
+        ValueError: If the stream ends in the middle of a frame
+
+    Example:
+        >>> [bytes(p) for p in iter_frames(b'\\x02ab\\x01c')]
+        [b'ab', b'c']
+    """
+    if hasattr(source, "read"):
+        while True:
+            size = read_varint(source)
+            if size is None:
+                return
+            payload = source.read(size)
+            if len(payload) != size:
+                raise ValueError(f"Truncated frame: expected {size} bytes, got {len(payload)}")
+            yield payload
+    else:
+        view = memoryview(source).cast("B")
+        offset = 0
+        end = len(view)
+        while offset < end:
+            size, offset = decode_varint(view, offset)
+            if offset + size > end:
+                raise ValueError(f"Truncated frame: expected {size} bytes, got {end - offset}")
+            yield view[offset : offset + size]
+            offset += size
@@ -2,16 +2,257 @@
 
 This module provides a JSON-based encoder that converts Python objects
 to UTF-8 encoded JSON bytes and vice versa, with support for custom
-serialization and deserialization hooks.
+serialization and deserialization hooks. Serialization is delegated to a
+pluggable backend: the standard library `json` module, or the native
+`orjson` and `msgspec` libraries when they are installed.
 """
 
+import codecs
 import json
-from typing import Any, Callable, Optional, TypeVar
+import re
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
 
-from make87.encodings.base import Encoder
+from make87.encodings.base import Buffer, Encoder, apply_object_hook
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 T = TypeVar("T")
 
+JsonPath = Union[str, Sequence[Union[str, int]]]  # Dotted object keys, or a sequence of object keys and array indices
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may continue a number, e.g. "-2" followed by ".5" or "1" followed by "e3".
+_NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+
+class _StdlibBackend:
+    """JSON backend using the standard library `json` module."""
+
+    name = "stdlib"
+
+    @staticmethod
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]]) -> bytes:
+        return json.dumps(obj, default=default).encode("utf-8")
+
+    @staticmethod
+    def dumps_many(objs: Iterable[Any], default: Optional[Callable[[Any], Any]]) -> List[bytes]:
+        json_encoder = json.JSONEncoder(default=default)
+        return [json_encoder.encode(obj).encode("utf-8") for obj in objs]
+
+    @staticmethod
+    def loads(data: Buffer, object_hook: Optional[Callable[[dict], Any]]) -> Any:
+        if not isinstance(data, (bytes, bytearray)):
+            data = str(data, "utf-8")
+        return json.loads(data, object_hook=object_hook)
+
+    @staticmethod
+    def loads_many(buffers: Iterable[Buffer], object_hook: Optional[Callable[[dict], Any]]) -> List[Any]:
+        # json.loads builds a new decoder per call once a hook is set; one decoder serves the whole batch.
+        json_decoder = json.JSONDecoder(object_hook=object_hook)
+        return [json_decoder.decode(str(data, "utf-8")) for data in buffers]
+
+
+class _OrjsonBackend:
+    """JSON backend using `orjson`.
+
+    Datetimes and dataclasses are passed to `default` like the standard
+    library does. UUIDs and enums are serialized natively by orjson before
+    `default` is consulted.
+    """
+
+    name = "orjson"
+
+    @staticmethod
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]]) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(obj, default=default, option=option)
+
+    @classmethod
+    def dumps_many(cls, objs: Iterable[Any], default: Optional[Callable[[Any], Any]]) -> List[bytes]:
+        return [cls.dumps(obj, default) for obj in objs]
+
+    @staticmethod
+    def loads(data: Buffer, object_hook: Optional[Callable[[dict], Any]]) -> Any:
+        value = orjson.loads(data)
+        return value if object_hook is None else apply_object_hook(value, object_hook)
+
+    @classmethod
+    def loads_many(cls, buffers: Iterable[Buffer], object_hook: Optional[Callable[[dict], Any]]) -> List[Any]:
+        return [cls.loads(data, object_hook) for data in buffers]
+
+
+class _MsgspecBackend:
+    """JSON backend using `msgspec.json`.
+
+    Datetimes, UUIDs, enums and dataclasses are serialized natively by
+    msgspec before `default` is consulted.
+    """
+
+    name = "msgspec"
+
+    @staticmethod
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]]) -> bytes:
+        return msgspec.json.encode(obj, enc_hook=default)
+
+    @staticmethod
+    def dumps_many(objs: Iterable[Any], default: Optional[Callable[[Any], Any]]) -> List[bytes]:
+        json_encoder = msgspec.json.Encoder(enc_hook=default)
+        return [json_encoder.encode(obj) for obj in objs]
+
+    @staticmethod
+    def loads(data: Buffer, object_hook: Optional[Callable[[dict], Any]]) -> Any:
+        value = msgspec.json.decode(data)
+        return value if object_hook is None else apply_object_hook(value, object_hook)
+
+    @staticmethod
+    def loads_many(buffers: Iterable[Buffer], object_hook: Optional[Callable[[dict], Any]]) -> List[Any]:
+        json_decoder = msgspec.json.Decoder()
+        values = [json_decoder.decode(data) for data in buffers]
+        return values if object_hook is None else [apply_object_hook(value, object_hook) for value in values]
+
+
+class _JsonStream:
+    """Incrementally decoded text window over a JSON document held in a buffer or read from a file.
+
+    Values are parsed with the C scanner of `json.JSONDecoder.raw_decode`.
+    A value that fails to parse, or ends at the end of the window or before
+    a character that may continue a number (e.g. "-2" of "-2.5" cut after
+    the dot), is parsed again after reading more of the source. The read size doubles with every retry, so large values
+    cost amortized linear time.
+    """
+
+    def __init__(self, source: Union[Buffer, BinaryIO], chunk_size: int, decoder: json.JSONDecoder) -> None:
+        if hasattr(source, "read"):
+            self._read = source.read
+        else:
+            view = memoryview(source).cast("B")
+            position = 0
+
+            def read(size: int) -> Buffer:
+                nonlocal position
+                chunk = view[position : position + size]
+                position += len(chunk)
+                return chunk
+
+            self._read = read
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._chunk_size = chunk_size
+        self._decoder = decoder
+        self.text = ""
+        self.position = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read more of the source into the window, dropping the consumed text.
+
+        Returns:
+            False if the source is exhausted
+        """
+        if self.eof:
+            return False
+        chunk = self._read(max(self._chunk_size, len(self.text) - self.position))
+        self.eof = not chunk
+        self.text = self.text[self.position :] + self._utf8.decode(chunk, final=self.eof)
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and get the next character, or "" at the end of the document."""
+        while True:
+            self.position = _WHITESPACE.match(self.text, self.position).end()
+            if self.position < len(self.text) or not self.fill():
+                return self.text[self.position : self.position + 1]
+
+    def expect(self, character: str) -> None:
+        """Consume the next character, which must be `character`."""
+        found = self.peek()
+        if found != character:
+            raise ValueError(f"Expected {character!r}, found {found or 'end of document'!r}")
+        self.position += 1
+
+    def value(self) -> Any:
+        """Parse the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.position)
+                if self.eof or (end < len(self.text) and self.text[end] not in _NUMBER_CHARACTERS):
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def members(self) -> Iterator[str]:
+        """Iterate over the keys of the object at the current position.
+
+        After every key, the stream is positioned at the key's value, which
+        the caller must consume before advancing the iterator.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected an object key, found {key!r}")
+            self.expect(":")
+            yield key
+            if self.peek() == "}":
+                self.position += 1
+                return
+            self.expect(",")
+
+    def items(self) -> Iterator[None]:
+        """Iterate over the elements of the array at the current position.
+
+        Before every element, the stream is positioned at the element, which
+        the caller must consume before advancing the iterator.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield
+            if self.peek() == "]":
+                self.position += 1
+                return
+            self.expect(",")
+
+
+_BACKENDS = {
+    "stdlib": (_StdlibBackend, json),
+    "orjson": (_OrjsonBackend, orjson),
+    "msgspec": (_MsgspecBackend, msgspec),
+}
+_AUTO_PREFERENCE = ("orjson", "msgspec", "stdlib")
+
+
+def available_json_backends() -> List[str]:
+    """List the JSON backends that can be used in this environment.
+
+    Returns:
+        Names of the installed backends, fastest first
+
+    Example:
+        >>> available_json_backends()
+        ['orjson', 'stdlib']
+    """
+    return [name for name in _AUTO_PREFERENCE if _BACKENDS[name][1] is not None]
+
 
 class JsonEncoder(Encoder[T]):
     """JSON encoder for Python objects.
@@ -23,10 +264,15 @@ class JsonEncoder(Encoder[T]):
     Attributes:
         object_hook: Custom deserialization function for complex objects
         default: Custom serialization function for complex objects
+        backend: Name of the JSON library used for (de)serialization
     """
 
     def __init__(
-        self, *, object_hook: Optional[Callable[[dict], T]] = None, default: Optional[Callable[[T], Any]] = None
+        self,
+        *,
+        object_hook: Optional[Callable[[dict], T]] = None,
+        default: Optional[Callable[[T], Any]] = None,
+        backend: str = "stdlib",
     ) -> None:
         """Initialize the JSON encoder with optional custom hooks.
 
@@ -37,6 +283,20 @@ class JsonEncoder(Encoder[T]):
             default: Custom serialization function that will be called for
                 objects that are not serializable by default. Should return
                 a JSON-serializable object or raise TypeError.
+            backend: JSON library to use. One of "stdlib", "orjson",
+                "msgspec" or "auto", which picks the fastest installed library
+                in the order orjson, msgspec, stdlib. Defaults to "stdlib".
+                The native backends are opt-in as their output differs from
+                the standard library's: they emit compact JSON without
+                spaces, serialize some types (e.g. UUIDs, enums) without
+                calling `default`, and orjson writes NaN as null and rejects
+                integers wider than 64 bits. While an `object_hook` is set,
+                "auto" decodes with the standard library, whose C parser calls
+                the hook natively; the native backends need an extra Python
+                pass over the decoded document instead.
+
+        Raises:
+            ValueError: If the backend is unknown or not installed
 
         Example:
             >>> # Simple encoder
@@ -52,9 +312,38 @@ class JsonEncoder(Encoder[T]):
             ...         return {'__type__': 'MyClass', **obj.__dict__}
             ...     raise TypeError
             >>> encoder = JsonEncoder(object_hook=custom_decoder, default=custom_encoder)
+            >>>
+            >>> # Fastest installed library
+            >>> encoder = JsonEncoder(backend="auto")
         """
+        auto = backend == "auto"
+        if auto:
+            backend = available_json_backends()[0]
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown JSON backend {backend!r}. Choose one of: auto, {', '.join(_BACKENDS)}")
+        if _BACKENDS[backend][1] is None:
+            raise ValueError(f"JSON backend {backend!r} is not installed. Install with: pip install make87[{backend}]")
+
         self.object_hook = object_hook
         self.default = default
+        self._backend = _BACKENDS[backend][0]
+        self._auto = auto
+
+    @property
+    def _decoding_backend(self):
+        """Get the backend used for decoding with the current hooks."""
+        if self._auto and self.object_hook is not None:
+            return _StdlibBackend
+        return self._backend
+
+    @property
+    def backend(self) -> str:
+        """Get the name of the JSON library used by this encoder.
+
+        Returns:
+            One of "stdlib", "orjson" or "msgspec"
+        """
+        return self._backend.name
 
     def encode(self, obj: T) -> bytes:
         """Serialize a Python object to UTF-8 encoded JSON bytes.
@@ -70,14 +359,14 @@ class JsonEncoder(Encoder[T]):
                 or other serialization errors
 
         Example:
-            >>> encoder = JsonEncoder()
+            >>> encoder = JsonEncoder(backend="stdlib")
             >>> data = {"key": "value", "number": 42}
             >>> encoded = encoder.encode(data)
             >>> print(encoded)
             b'{"key": "value", "number": 42}'
         """
         try:
-            return json.dumps(obj, default=self.default).encode("utf-8")
+            return self._backend.dumps(obj, self.default)
         except Exception as e:
             raise ValueError(f"JSON encoding failed: {e}")
 
@@ -102,6 +391,160 @@ class JsonEncoder(Encoder[T]):
             {'key': 'value', 'number': 42}
         """
         try:
-            return json.loads(data.decode("utf-8"), object_hook=self.object_hook)
+            return self._decoding_backend.loads(data, self.object_hook)
+        except Exception as e:
+            raise ValueError(f"JSON decoding failed: {e}")
+
+    def decode_from(self, data: Buffer) -> T:
+        """Deserialize UTF-8 encoded JSON from any bytes-like buffer.
+
+        The native backends parse the buffer in place. The standard library
+        backend decodes it to text in a single step, skipping the
+        intermediate bytes copy that `decode` would need for a memoryview.
+
+        Args:
+            data: UTF-8 encoded JSON as bytes, bytearray or memoryview
+
+        Returns:
+            The deserialized Python object
+
+        Raises:
+            ValueError: If JSON decoding fails due to invalid JSON data
+                or encoding issues
+
+        Example:
+            >>> encoder = JsonEncoder()
+            >>> decoded = encoder.decode_from(memoryview(b'{"key": "value"}'))
+            >>> print(decoded)
+            {'key': 'value'}
+        """
+        try:
+            return self._decoding_backend.loads(data, self.object_hook)
+        except Exception as e:
+            raise ValueError(f"JSON decoding failed: {e}")
+
+    def encode_many(self, objs: Iterable[T]) -> List[bytes]:
+        """Serialize a batch of Python objects to UTF-8 encoded JSON bytes.
+
+        Backends with per-call setup cost (e.g. the `json.JSONEncoder` of the
+        standard library) set it up once for the whole batch.
+
+        Args:
+            objs: The Python objects to serialize
+
+        Returns:
+            One UTF-8 encoded JSON payload per object, in input order
+
+        Raises:
+            ValueError: If JSON encoding fails for any object
+
+        Example:
+            >>> encoder = JsonEncoder(backend="stdlib")
+            >>> encoder.encode_many([{"a": 1}, {"b": 2}])
+            [b'{"a": 1}', b'{"b": 2}']
+        """
+        try:
+            return self._backend.dumps_many(objs, self.default)
+        except Exception as e:
+            raise ValueError(f"JSON encoding failed: {e}")
+
+    def decode_many(self, buffers: Iterable[Buffer]) -> List[T]:
+        """Deserialize a batch of UTF-8 encoded JSON payloads.
+
+        Every payload is parsed on its own, so a malformed payload cannot
+        spill into its neighbours, but the backend's decoder is set up once
+        for the whole batch.
+
+        Args:
+            buffers: UTF-8 encoded JSON payloads, each holding one JSON value
+
+        Returns:
+            One deserialized object per payload, in input order
+
+        Raises:
+            ValueError: If JSON decoding fails for any payload
+
+        Example:
+            >>> encoder = JsonEncoder()
+            >>> encoder.decode_many([b'{"a": 1}', b'[1, 2]'])
+            [{'a': 1}, [1, 2]]
+        """
+        try:
+            return self._decoding_backend.loads_many(buffers, self.object_hook)
         except Exception as e:
             raise ValueError(f"JSON decoding failed: {e}")
+
+    def iter_decode(
+        self, source: Union[Buffer, BinaryIO], path: Optional[JsonPath] = None, *, chunk_size: int = 64 * 1024
+    ) -> Iterator[Any]:
+        """Incrementally decode the elements of a large JSON array or object.
+
+        The document is read and decoded in chunks, and only one element is
+        materialized at a time, so peak memory grows with the size of the
+        largest element rather than the whole document. Elements are parsed
+        by the standard library's C scanner regardless of the backend, with
+        `object_hook` applied natively.
+
+        Args:
+            source: The JSON document as bytes, bytearray, memoryview or a
+                readable binary file-like object
+            path: Location of the array or object to stream. Either a string
+                of dot-separated object keys (e.g. "history.detections"), or a
+                sequence of object keys and integer array indices. Defaults to
+                None, which streams the top-level value. Values before the
+                selected one are decoded one at a time and discarded.
+            chunk_size: Number of bytes read from the source at a time.
+                Defaults to 64 KiB.
+
+        Yields:
+            The elements of an array, or (key, value) tuples of an object, in
+            document order. Anything after the selected value is not read.
+
+        Raises:
+            ValueError: If the document is invalid, the path does not exist,
+                or the selected value is neither an array nor an object
+
+        Example:
+            >>> encoder = JsonEncoder()
+            >>> with open("detections.json", "rb") as f:
+            ...     for detection in encoder.iter_decode(f, "history.detections"):
+            ...         index(detection)
+            >>> list(encoder.iter_decode(b'{"tiles": {"a": 1, "b": 2}}', "tiles"))
+            [('a', 1), ('b', 2)]
+        """
+        if path is None:
+            steps: Sequence[Union[str, int]] = ()
+        elif isinstance(path, str):
+            steps = path.split(".") if path else ()
+        else:
+            steps = path
+        stream = _JsonStream(source, chunk_size, json.JSONDecoder(object_hook=self.object_hook))
+
+        try:
+            for step in steps:
+                if isinstance(step, int):
+                    for index, _ in enumerate(stream.items()):
+                        if index == step:
+                            break
+                        stream.value()
+                    else:
+                        raise ValueError(f"path {path!r} not found")
+                else:
+                    for key in stream.members():
+                        if key == step:
+                            break
+                        stream.value()
+                    else:
+                        raise ValueError(f"path {path!r} not found")
+
+            start = stream.peek()
+            if start == "[":
+                for _ in stream.items():
+                    yield stream.value()
+            elif start == "{":
+                for key in stream.members():
+                    yield key, stream.value()
+            else:
+                raise ValueError(f"value at path {path!r} is neither an array nor an object")
+        except ValueError as e:  # json.JSONDecodeError and UnicodeDecodeError are ValueErrors as well
+            raise ValueError(f"JSON decoding failed: {e}")
@@ -0,0 +1,190 @@
+"""Memoizing encoder for messages that are published repeatedly unchanged.
+
+Heartbeats, static calibration messages and status enums are often
+republished at a high rate with identical contents. `MemoizedEncoder`
+wraps any encoder and caches the encoded bytes, so republishing the same
+message costs a dictionary lookup instead of a serialization.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+from make87.encodings.base import Buffer, Encoder
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `MemoizedEncoder` cache, like `functools.lru_cache`'s `cache_info()`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class MemoizedEncoder(Encoder[T]):
+    """Encoder caching the encoded bytes of recently encoded objects.
+
+    By default, entries are keyed by object identity: encoding the very same
+    object again returns the cached bytes. As the encoder cannot see
+    in-place modifications, identity keys are only safe for objects that are
+    not modified after they were first encoded, unless a `version` function
+    reports modifications. Alternatively, a `key` function can derive the
+    cache key from the contents of the object.
+
+    Cached objects are kept alive by the cache, so their identity cannot be
+    reused by new objects while they are cached. Decoding is passed through
+    to the wrapped encoder unchanged.
+
+    Attributes:
+        inner: The wrapped encoder
+        maxsize: Maximum number of cached payloads
+        hits: Number of encodes served from the cache. Hits are counted
+            without locking, so concurrent encodes may undercount them.
+        misses: Number of encodes passed to the wrapped encoder
+    """
+
+    def __init__(
+        self,
+        inner: Encoder[T],
+        *,
+        key: Optional[Callable[[T], Hashable]] = None,
+        version: Optional[Callable[[T], Hashable]] = None,
+        maxsize: int = 128,
+    ) -> None:
+        """Initialize the memoizing encoder.
+
+        Args:
+            inner: The encoder producing the payloads
+            key: Function deriving the cache key from an object, e.g. a
+                status enum's value or a calibration id. Objects with equal
+                keys must encode to the same bytes. Defaults to None, which
+                keys entries by object identity.
+            version: Function returning a version of an object, e.g. a counter
+                the application increments on every modification. A cached
+                payload is only used while the version is unchanged. Defaults
+                to None, which treats objects as immutable.
+            maxsize: Maximum number of cached payloads. The least recently
+                used payload is evicted first. Defaults to 128.
+
+        Raises:
+            ValueError: If maxsize is below 1
+
+        Example:
+            >>> encoder = MemoizedEncoder(ProtobufEncoder(Heartbeat))
+            >>> heartbeat = Heartbeat(node="lidar", state=Heartbeat.OK)
+            >>> while True:
+            ...     publisher.put(encoder.encode(heartbeat))  # serialized once
+            >>>
+            >>> # Keyed by content
+            >>> encoder = MemoizedEncoder(JsonEncoder(), key=lambda status: status["state"])
+            >>>
+            >>> # Re-encoded after every modification
+            >>> encoder = MemoizedEncoder(JsonEncoder(), version=lambda grid: grid["revision"])
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.inner = inner
+        self.key = key
+        self.version = version
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Hashable, Tuple[Any, Hashable, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, obj: T) -> bytes:
+        """Serialize an object, returning cached bytes if it was encoded before.
+
+        Args:
+            obj: The object to serialize
+
+        Returns:
+            The serialized object as bytes
+
+        Raises:
+            ValueError: If the wrapped encoder fails
+            TypeError: If the `key` function returns an unhashable key
+        """
+        key = id(obj) if self.key is None else self.key(obj)
+        version = None if self.version is None else self.version(obj)
+        # Hits take no lock: the OrderedDict operations are atomic on their own.
+        entry = self._cache.get(key)
+        if entry is not None and (self.key is not None or entry[0] is obj) and entry[1] == version:
+            try:
+                self._cache.move_to_end(key)
+            except KeyError:
+                pass  # evicted by a concurrent encode
+            self.hits += 1
+            return entry[2]
+
+        payload = self.inner.encode(obj)
+        with self._lock:
+            self.misses += 1
+            # Identity keys keep the object alive, so its id is not reused while cached.
+            self._cache[key] = (obj if self.key is None else None, version, payload)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return payload
+
+    def decode(self, data: bytes) -> T:
+        """Deserialize bytes with the wrapped encoder.
+
+        Args:
+            data: The serialized object
+
+        Returns:
+            The deserialized object
+
+        Raises:
+            ValueError: If the wrapped encoder fails
+        """
+        return self.inner.decode(data)
+
+    def decode_from(self, data: Buffer) -> T:
+        """Deserialize any bytes-like buffer with the wrapped encoder.
+
+        Args:
+            data: The serialized object as bytes, bytearray or memoryview
+
+        Returns:
+            The deserialized object
+
+        Raises:
+            ValueError: If the wrapped encoder fails
+        """
+        return self.inner.decode_from(data)
+
+    def invalidate(self, obj: T) -> None:
+        """Drop the cached payload of an object, e.g. after modifying it in place.
+
+        Args:
+            obj: The object whose payload to drop
+        """
+        key = id(obj) if self.key is None else self.key(obj)
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def cache_clear(self) -> None:
+        """Drop all cached payloads and reset the hit and miss counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Get the cache statistics.
+
+        Returns:
+            The number of hits and misses, the maximum and the current number
+            of cached payloads
+
+        Example:
+            >>> encoder.cache_info()
+            CacheInfo(hits=9999, misses=1, maxsize=128, currsize=1)
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
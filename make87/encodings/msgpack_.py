@@ -0,0 +1,313 @@
+"""MessagePack encoder for compact schemaless payloads.
+
+This module provides a MessagePack-based encoder that converts Python
+objects to MessagePack bytes and vice versa, with the same custom
+serialization and deserialization hooks as `JsonEncoder`. Bytes,
+datetimes and NumPy scalars are serialized without hooks. Serialization
+is delegated to the `msgpack` library or to `msgspec`, whichever is
+installed; both produce the same bytes for these types.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+from make87.encodings.base import Buffer, Encoder, apply_object_hook
+from make87.encodings.native import to_native
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+T = TypeVar("T")
+
+
+class _MsgpackBackend:
+    """MessagePack backend using the `msgpack` library."""
+
+    name = "msgpack"
+
+    @staticmethod
+    def dumps_many(objs: Iterable[Any], default: Callable[[Any], Any]) -> List[bytes]:
+        packer = msgpack.Packer(default=default, use_bin_type=True, datetime=True)
+        return [packer.pack(obj) for obj in objs]
+
+    @staticmethod
+    def loads(data: Buffer, object_hook: Optional[Callable[[dict], Any]]) -> Any:
+        return msgpack.unpackb(data, object_hook=object_hook, raw=False, timestamp=3, strict_map_key=False)
+
+    @staticmethod
+    def loads_many(buffers: List[Buffer], object_hook: Optional[Callable[[dict], Any]]) -> List[Any]:
+        # MessagePack values are self-delimiting, so one streaming unpacker reads the concatenated payloads.
+        unpacker = msgpack.Unpacker(
+            None, object_hook=object_hook, raw=False, timestamp=3, strict_map_key=False, max_buffer_size=0
+        )
+        unpacker.feed(b"".join(buffers))
+        values = []
+        end = 0
+        for index, data in enumerate(buffers):
+            end += len(data)
+            try:
+                values.append(unpacker.unpack())
+            except msgpack.OutOfData:
+                raise ValueError(f"payload {index} is truncated")
+            if unpacker.tell() != end:
+                raise ValueError(f"payload {index} does not hold exactly one value")
+        return values
+
+
+class _MsgspecBackend:
+    """MessagePack backend using `msgspec.msgpack`.
+
+    UUIDs, enums and dataclasses are serialized natively by msgspec before
+    `default` is consulted. msgspec would serialize naive datetimes as ISO
+    8601 strings, so they are made UTC-aware beforehand, as `to_native`
+    does for the msgpack backend.
+    """
+
+    name = "msgspec"
+
+    @staticmethod
+    def dumps_many(objs: Iterable[Any], default: Callable[[Any], Any]) -> List[bytes]:
+        msgpack_encoder = msgspec.msgpack.Encoder(enc_hook=default)
+        return [msgpack_encoder.encode(_with_utc_datetimes(obj)) for obj in objs]
+
+    @staticmethod
+    def loads(data: Buffer, object_hook: Optional[Callable[[dict], Any]]) -> Any:
+        value = msgspec.msgpack.decode(data)
+        return value if object_hook is None else apply_object_hook(value, object_hook)
+
+    @staticmethod
+    def loads_many(buffers: List[Buffer], object_hook: Optional[Callable[[dict], Any]]) -> List[Any]:
+        msgpack_decoder = msgspec.msgpack.Decoder()
+        values = [msgpack_decoder.decode(data) for data in buffers]
+        return values if object_hook is None else [apply_object_hook(value, object_hook) for value in values]
+
+
+def _has_naive_datetime(obj: Any) -> bool:
+    """Check whether an object is, or holds in a dict, list or tuple, a naive datetime."""
+    if isinstance(obj, datetime):
+        return obj.tzinfo is None
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if _has_naive_datetime(key) or _has_naive_datetime(value):
+                return True
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            if _has_naive_datetime(value):
+                return True
+    return False
+
+
+def _with_utc_datetimes(obj: Any) -> Any:
+    """Make the naive datetimes in an object UTC-aware, copying only the containers that hold one."""
+    if not _has_naive_datetime(obj):
+        return obj
+    if isinstance(obj, datetime):
+        return obj.replace(tzinfo=timezone.utc)
+    if isinstance(obj, dict):
+        return {_with_utc_datetimes(key): _with_utc_datetimes(value) for key, value in obj.items()}
+    return [_with_utc_datetimes(value) for value in obj]
+
+
+_BACKENDS = {
+    "msgpack": (_MsgpackBackend, msgpack),
+    "msgspec": (_MsgspecBackend, msgspec),
+}
+_AUTO_PREFERENCE = ("msgpack", "msgspec")
+
+
+def available_msgpack_backends() -> List[str]:
+    """List the MessagePack backends that can be used in this environment.
+
+    Returns:
+        Names of the installed backends, in the order "auto" prefers them
+
+    Example:
+        >>> available_msgpack_backends()
+        ['msgpack', 'msgspec']
+    """
+    return [name for name in _AUTO_PREFERENCE if _BACKENDS[name][1] is not None]
+
+
+class MsgpackEncoder(Encoder[T]):
+    """MessagePack encoder for Python objects.
+
+    This encoder converts Python objects to MessagePack bytes and
+    deserializes MessagePack bytes back to Python objects. Besides the JSON
+    types, it handles bytes (as the MessagePack bin type), datetimes (as the
+    MessagePack timestamp extension, decoded as UTC datetimes) and NumPy
+    scalars (as plain numbers) without hooks. Naive datetimes are taken to
+    be UTC by both backends.
+
+    Attributes:
+        object_hook: Custom deserialization function for complex objects
+        default: Custom serialization function for complex objects
+        backend: Name of the library used for (de)serialization
+    """
+
+    def __init__(
+        self,
+        *,
+        object_hook: Optional[Callable[[dict], T]] = None,
+        default: Optional[Callable[[T], Any]] = None,
+        backend: str = "auto",
+    ) -> None:
+        """Initialize the MessagePack encoder with optional custom hooks.
+
+        Args:
+            object_hook: Custom deserialization function that will be called
+                with every decoded map (a dict), innermost first. The return
+                value will be used in place of the dict.
+            default: Custom serialization function that will be called for
+                objects that are not serializable natively. Should return a
+                serializable object or raise TypeError.
+            backend: Library to use, "msgpack" or "msgspec". Defaults to
+                "auto", which picks msgpack if it is installed, and msgspec
+                otherwise. Both produce the same bytes, but msgspec needs a
+                Python pass over every object to convert naive datetimes
+                the way msgpack does, which makes it encode slower than
+                msgpack, and it calls `object_hook` from a Python pass over
+                the decoded value instead of natively.
+
+        Raises:
+            ImportError: If neither msgpack nor msgspec is installed
+            ValueError: If the backend is unknown or not installed
+
+        Example:
+            >>> encoder = MsgpackEncoder()
+            >>> encoder.decode(encoder.encode({"stamp": datetime.now(timezone.utc), "image": b"..."}))
+            {'stamp': datetime.datetime(..., tzinfo=datetime.timezone.utc), 'image': b'...'}
+        """
+        if backend == "auto":
+            backends = available_msgpack_backends()
+            if not backends:
+                raise ImportError("MessagePack support is not installed. Install with: pip install make87[msgpack]")
+            backend = backends[0]
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown MessagePack backend {backend!r}. Choose one of: auto, {', '.join(_BACKENDS)}")
+        if _BACKENDS[backend][1] is None:
+            raise ValueError(
+                f"MessagePack backend {backend!r} is not installed. Install with: pip install make87[{backend}]"
+            )
+
+        self.object_hook = object_hook
+        self.default = default
+        self._backend = _BACKENDS[backend][0]
+
+    @property
+    def backend(self) -> str:
+        """Get the name of the library used by this encoder.
+
+        Returns:
+            One of "msgpack" or "msgspec"
+        """
+        return self._backend.name
+
+    def _default(self, obj: Any) -> Any:
+        return to_native(obj, self.default)
+
+    def encode(self, obj: T) -> bytes:
+        """Serialize a Python object to MessagePack bytes.
+
+        Args:
+            obj: The Python object to serialize
+
+        Returns:
+            MessagePack bytes representation of the object
+
+        Raises:
+            ValueError: If encoding fails due to unsupported object types
+                or other serialization errors
+
+        Example:
+            >>> encoder = MsgpackEncoder()
+            >>> encoder.encode({"key": "value", "number": 42})
+            b'\\x82\\xa3key\\xa5value\\xa6number*'
+        """
+        return self.encode_many((obj,))[0]
+
+    def decode(self, data: bytes) -> T:
+        """Deserialize MessagePack bytes to a Python object.
+
+        Args:
+            data: MessagePack bytes to deserialize
+
+        Returns:
+            The deserialized Python object
+
+        Raises:
+            ValueError: If decoding fails due to invalid or truncated data
+        """
+        return self.decode_from(data)
+
+    def decode_from(self, data: Buffer) -> T:
+        """Deserialize MessagePack from any bytes-like buffer, parsing it in place.
+
+        Args:
+            data: MessagePack data as bytes, bytearray or memoryview
+
+        Returns:
+            The deserialized Python object
+
+        Raises:
+            ValueError: If decoding fails due to invalid or truncated data
+
+        Example:
+            >>> encoder = MsgpackEncoder()
+            >>> encoder.decode_from(memoryview(b'\\x81\\xa3key\\xa5value'))
+            {'key': 'value'}
+        """
+        try:
+            return self._backend.loads(data, self.object_hook)
+        except Exception as e:
+            raise ValueError(f"MessagePack decoding failed: {e}")
+
+    def encode_many(self, objs: Iterable[T]) -> List[bytes]:
+        """Serialize a batch of Python objects to MessagePack bytes with one packer.
+
+        Args:
+            objs: The Python objects to serialize
+
+        Returns:
+            One MessagePack payload per object, in input order
+
+        Raises:
+            ValueError: If encoding fails for any object
+        """
+        try:
+            return self._backend.dumps_many(objs, self._default)
+        except Exception as e:
+            raise ValueError(f"MessagePack encoding failed: {e}")
+
+    def decode_many(self, buffers: Iterable[Buffer]) -> List[T]:
+        """Deserialize a batch of MessagePack payloads.
+
+        MessagePack values are self-delimiting, so with the msgpack backend
+        the payloads are concatenated and read by a single streaming
+        unpacker, which must end every value exactly at the end of its
+        payload. The msgspec backend decodes every payload with one reused
+        decoder.
+
+        Args:
+            buffers: MessagePack payloads, each holding one value
+
+        Returns:
+            One deserialized object per payload, in input order
+
+        Raises:
+            ValueError: If decoding fails for any payload
+        """
+        buffers = list(buffers)
+        if not buffers:
+            return []
+
+        try:
+            return self._backend.loads_many(buffers, self.object_hook)
+        except Exception as e:
+            raise ValueError(f"MessagePack decoding failed: {e}")
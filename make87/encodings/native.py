@@ -0,0 +1,39 @@
+"""Conversions shared by the binary schemaless encoders.
+
+MessagePack and CBOR serialize bytes and timezone-aware datetimes
+natively, but not naive datetimes or NumPy scalars, which the encoders
+convert with `to_native` before falling back to the user's `default` hook.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+
+def to_native(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Convert an object without a native binary representation.
+
+    Naive datetimes are taken to be UTC. NumPy scalars (e.g. `np.float32`,
+    `np.int64`, `np.bool_`) become the equivalent Python scalar, detected
+    without importing NumPy. Anything else is passed to `default`.
+
+    Args:
+        obj: The object the serializer could not handle
+        default: The user's serialization hook, or None
+
+    Returns:
+        A natively serializable replacement for the object
+
+    Raises:
+        TypeError: If the object cannot be converted and there is no `default` hook
+
+    Example:
+        >>> to_native(np.float32(0.5))
+        0.5
+    """
+    if isinstance(obj, datetime) and obj.tzinfo is None:
+        return obj.replace(tzinfo=timezone.utc)
+    if type(obj).__module__ == "numpy" and getattr(obj, "shape", None) == ():
+        return obj.item()
+    if default is not None:
+        return default(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
@@ -0,0 +1,296 @@
+"""Zero-copy encoder for NumPy arrays.
+
+This module provides an encoder for raw arrays such as camera frames and
+point clouds. Payloads consist of a compact fixed header describing each
+array (dtype, shape, memory order) followed by the raw array buffer, so
+decoding creates NumPy views over the received buffer instead of copying
+it. NumPy is imported on first use, keeping `make87.encodings` importable
+without it.
+
+Payload layout (all integers little endian):
+
+    record header   magic b"ND", version (u8), flags (u8), alignment (u16), array count (u16)
+    per array       dtype length (u8), ndim (u8), order (u8, 0 = C, 1 = Fortran), name length (u8),
+                    dtype string, name (UTF-8), shape (ndim x u64),
+                    zero padding up to the alignment, raw array data
+"""
+
+import struct
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from make87.encodings.base import Buffer, Encoder, WritableBuffer
+
+ArrayRecord = Union[Any, List[Any], Dict[str, Any]]  # An ndarray, a list of ndarrays, or ndarrays by name
+
+_MAGIC = b"ND"
+_VERSION = 1
+_FLAG_SEQUENCE = 0x01
+_FLAG_NAMED = 0x02
+_RECORD = struct.Struct("<2sBBHH")
+_ARRAY = struct.Struct("<BBBB")
+_ORDER_C = 0
+_ORDER_F = 1
+
+
+def _numpy():
+    """Import NumPy on first use.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy support is not installed. " "Install with: pip install make87[numpy]") from e
+    return numpy
+
+
+def _align(offset: int, alignment: int) -> int:
+    return (offset + alignment - 1) & ~(alignment - 1)
+
+
+class NdarrayEncoder(Encoder[ArrayRecord]):
+    """Encoder for NumPy arrays and records of several arrays.
+
+    Encodes a single ndarray, a list of ndarrays (e.g. image and depth), or
+    a dict of ndarrays by name. Decoding returns the same structure, with
+    every array being a view over the payload buffer. Arrays decoded from
+    read-only buffers such as bytes are read-only.
+
+    Attributes:
+        alignment: Byte alignment of each array's data, relative to the start of the payload
+    """
+
+    def __init__(self, *, alignment: int = 1) -> None:
+        """Initialize the ndarray encoder.
+
+        Args:
+            alignment: Byte alignment of each array's data relative to the start
+                of the payload. Must be a power of two up to 32768. Defaults to
+                1 (no padding). Aligning to e.g. 64 bytes keeps decoded arrays
+                suitable for SIMD and GPU uploads, provided the receive buffer
+                itself is aligned.
+
+        Raises:
+            ValueError: If the alignment is not a power of two or too large
+
+        Example:
+            >>> encoder = NdarrayEncoder(alignment=64)
+            >>> payload = encoder.encode({"image": image, "depth": depth})
+            >>> record = encoder.decode(payload)
+            >>> record["depth"].shape
+            (480, 640)
+        """
+        if alignment < 1 or alignment > 0x8000 or alignment & (alignment - 1):
+            raise ValueError(f"Alignment must be a power of two between 1 and 32768, got {alignment}")
+        self.alignment = alignment
+
+    def encoded_size(self, obj: ArrayRecord) -> int:
+        """Get the payload size of an array record, e.g. to size a buffer for `encode_into`.
+
+        Args:
+            obj: An ndarray, a list of ndarrays, or a dict of ndarrays by name
+
+        Returns:
+            The number of bytes `encode` produces for the record
+
+        Raises:
+            ValueError: If the record holds unsupported arrays
+        """
+        return self._layout(obj)[3]
+
+    def encode(self, obj: ArrayRecord) -> bytes:
+        """Serialize an array record to bytes.
+
+        Args:
+            obj: An ndarray, a list of ndarrays, or a dict of ndarrays by name
+
+        Returns:
+            Header followed by the raw array data
+
+        Raises:
+            ValueError: If the record holds unsupported arrays (object or
+                structured dtypes, more than 255 dimensions)
+
+        Example:
+            >>> encoder = NdarrayEncoder()
+            >>> payload = encoder.encode(np.zeros((480, 640, 3), dtype=np.uint8))
+        """
+        np = _numpy()
+        flags, names, layout, _ = self._layout(obj)
+        parts = self._headers(flags, names, layout)
+        for index, (array, _, order, _, _) in enumerate(layout):
+            # Contiguous arrays are joined as flat views, so their data is copied exactly once.
+            flat = np.ravel(array, order="F" if order == _ORDER_F else "C")
+            parts.insert(2 * index + 1, flat.view(np.uint8) if flat.size else b"")
+        return b"".join(parts)
+
+    def encode_into(self, obj: ArrayRecord, buffer: WritableBuffer) -> int:
+        """Serialize an array record directly into a caller-provided buffer.
+
+        Array data is copied once, straight from the source arrays into the
+        buffer. Non-contiguous arrays are written in C order.
+
+        Args:
+            obj: An ndarray, a list of ndarrays, or a dict of ndarrays by name
+            buffer: Writable buffer receiving the payload, starting at offset 0
+
+        Returns:
+            The number of bytes written to the buffer
+
+        Raises:
+            ValueError: If the buffer is too small or the record holds unsupported arrays
+
+        Example:
+            >>> encoder = NdarrayEncoder()
+            >>> buffer = bytearray(encoder.encoded_size(frame))
+            >>> size = encoder.encode_into(frame, buffer)
+        """
+        flags, names, layout, size = self._layout(obj)
+        target = memoryview(buffer).cast("B")
+        if target.nbytes < size:
+            raise ValueError(f"Buffer too small: need {size} bytes, got {target.nbytes}")
+        self._write(flags, names, layout, target)
+        return size
+
+    def decode(self, data: bytes) -> ArrayRecord:
+        """Deserialize an array record from bytes without copying the array data.
+
+        Args:
+            data: Payload produced by `encode`
+
+        Returns:
+            An ndarray, a list of ndarrays, or a dict of ndarrays by name, as encoded
+
+        Raises:
+            ValueError: If the payload is truncated or malformed
+        """
+        return self.decode_from(data)
+
+    def decode_from(self, data: Buffer) -> ArrayRecord:
+        """Deserialize an array record from any bytes-like buffer without copying.
+
+        Every array is created with `np.frombuffer` over the buffer and keeps
+        it alive. Arrays are writable only if the buffer is.
+
+        Args:
+            data: Payload produced by `encode`, as bytes, bytearray or memoryview
+
+        Returns:
+            An ndarray, a list of ndarrays, or a dict of ndarrays by name, as encoded
+
+        Raises:
+            ValueError: If the payload is truncated or malformed
+
+        Example:
+            >>> encoder = NdarrayEncoder()
+            >>> frame = encoder.decode_from(memoryview(sample.payload.to_bytes()))
+        """
+        np = _numpy()
+        view = memoryview(data).cast("B")
+        try:
+            magic, version, flags, alignment, count = _RECORD.unpack_from(view, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("not an ndarray payload")
+
+            arrays = []
+            names = []
+            offset = _RECORD.size
+            for _ in range(count):
+                dtype_length, ndim, order, name_length = _ARRAY.unpack_from(view, offset)
+                offset += _ARRAY.size
+                dtype = np.dtype(bytes(view[offset : offset + dtype_length]).decode("ascii"))
+                offset += dtype_length
+                names.append(bytes(view[offset : offset + name_length]).decode("utf-8"))
+                offset += name_length
+                shape = struct.unpack_from(f"<{ndim}Q", view, offset)
+                offset = _align(offset + 8 * ndim, alignment)
+
+                size = 1
+                for dim in shape:
+                    size *= dim
+                if offset + size * dtype.itemsize > view.nbytes:
+                    raise ValueError("payload is truncated")
+                array = np.frombuffer(view, dtype=dtype, count=size, offset=offset)
+                arrays.append(array.reshape(shape, order="F" if order == _ORDER_F else "C"))
+                offset += size * dtype.itemsize
+        except (struct.error, TypeError, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Ndarray decoding failed: {e}")
+
+        if flags & _FLAG_NAMED:
+            return dict(zip(names, arrays))
+        if flags & _FLAG_SEQUENCE:
+            return arrays
+        if len(arrays) != 1:
+            raise ValueError(f"Ndarray decoding failed: single-array payload holds {len(arrays)} arrays")
+        return arrays[0]
+
+    def _layout(self, obj: ArrayRecord) -> Tuple[int, List[bytes], List[Tuple], int]:
+        """Compute the flags, array headers and data offsets of a record."""
+        np = _numpy()
+        if isinstance(obj, dict):
+            flags = _FLAG_SEQUENCE | _FLAG_NAMED
+            names = [str(name).encode("utf-8") for name in obj]
+            arrays: Sequence[Any] = list(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            flags = _FLAG_SEQUENCE
+            names = [b""] * len(obj)
+            arrays = obj
+        else:
+            flags = 0
+            names = [b""]
+            arrays = [obj]
+        if len(arrays) > 0xFFFF:
+            raise ValueError(f"Ndarray records hold at most 65535 arrays, got {len(arrays)}")
+
+        layout = []
+        offset = _RECORD.size
+        for name, array in zip(names, arrays):
+            array = np.asarray(array)
+            dtype = array.dtype
+            if dtype.hasobject or dtype.fields is not None:
+                raise ValueError(f"Unsupported dtype {dtype}: only plain numeric, bool and string dtypes are supported")
+            if array.ndim > 0xFF or len(name) > 0xFF:
+                raise ValueError("Ndarray dimensions and names are limited to 255 entries/bytes")
+            dtype_str = dtype.str.encode("ascii")
+            order = _ORDER_F if array.flags.f_contiguous and not array.flags.c_contiguous else _ORDER_C
+            offset += _ARRAY.size + len(dtype_str) + len(name)
+            header_offset = offset
+            offset = _align(offset + 8 * array.ndim, self.alignment)
+            layout.append((array, dtype_str, order, header_offset, offset))
+            offset += array.nbytes
+        return flags, names, layout, offset
+
+    def _headers(self, flags: int, names: List[bytes], layout: List[Tuple]) -> List[bytes]:
+        """Build the bytes preceding each array's data, including the record header and padding."""
+        headers = []
+        position = 0
+        header = _RECORD.pack(_MAGIC, _VERSION, flags, self.alignment, len(layout))
+        for name, (array, dtype_str, order, header_offset, data_offset) in zip(names, layout):
+            header += _ARRAY.pack(len(dtype_str), array.ndim, order, len(name)) + dtype_str + name
+            header += struct.pack(f"<{array.ndim}Q", *array.shape)
+            header += bytes(data_offset - position - len(header))
+            headers.append(header)
+            position = data_offset + array.nbytes
+            header = b""
+        if not layout:
+            headers.append(header)
+        return headers
+
+    def _write(self, flags: int, names: List[bytes], layout: List[Tuple], buffer: WritableBuffer) -> None:
+        """Write a record computed by `_layout` into a buffer."""
+        np = _numpy()
+        headers = self._headers(flags, names, layout)
+        buffer[: len(headers[0])] = headers[0]
+        for index, (array, _, order, _, data_offset) in enumerate(layout):
+            target = np.ndarray(
+                array.shape,
+                dtype=array.dtype,
+                buffer=buffer,
+                offset=data_offset,
+                order="F" if order == _ORDER_F else "C",
+            )
+            target[...] = array
+            if index + 1 < len(headers):
+                position = data_offset + array.nbytes
+                buffer[position : position + len(headers[index + 1])] = headers[index + 1]
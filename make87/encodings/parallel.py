@@ -0,0 +1,293 @@
+"""Process-pool parallel decoding for CPU-heavy payloads.
+
+Decoding large YAML, JSON or protobuf payloads holds the GIL, so decoding
+in a subscriber callback blocks the callback thread and every other Python
+thread. `ParallelDecoder` fans decoding out to a pool of worker processes.
+Large payloads are handed to the workers through shared memory slots
+instead of being pickled; only the decoded objects travel back pickled.
+
+Every worker process holds its own copy of the wrapped encoder, so
+stateful encoders that rely on the order of the payloads they decode
+(e.g. `DeltaEncoder`) cannot be used.
+"""
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections import OrderedDict, deque
+from multiprocessing import shared_memory
+from typing import Callable, Deque, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from make87.encodings.base import Buffer, Encoder
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_MIN_SLOT_SIZE = 1024 * 1024
+_WORKER_SEGMENTS = 64
+
+# State of a worker process, set up by `_init_worker`.
+_worker_encoder: Optional[Encoder] = None
+_worker_segments: "OrderedDict[str, shared_memory.SharedMemory]" = OrderedDict()
+
+
+def _init_worker(encoder: Encoder) -> None:
+    global _worker_encoder
+    _worker_encoder = encoder
+
+
+def _decode_bytes(data: bytes) -> object:
+    return _worker_encoder.decode_from(data)
+
+
+def _decode_shared(name: str, size: int) -> object:
+    """Decode a payload from a shared memory slot, keeping recently used slots attached."""
+    segment = _worker_segments.get(name)
+    if segment is None:
+        segment = _worker_segments[name] = shared_memory.SharedMemory(name=name)
+        while len(_worker_segments) > _WORKER_SEGMENTS:
+            _, stale = _worker_segments.popitem(last=False)
+            try:
+                stale.close()
+            except BufferError:
+                pass  # still referenced by a decoded object; closed when garbage collected
+    else:
+        _worker_segments.move_to_end(name)
+    return _worker_encoder.decode_from(segment.buf[:size])
+
+
+class ParallelDecoder(Generic[T]):
+    """Decodes payloads with any encoder in a pool of worker processes.
+
+    Payloads are decoded concurrently, but results are always handed back
+    in submission order. At most `max_in_flight` payloads are decoded at a
+    time; submitting more blocks until the oldest one is done, which
+    propagates backpressure to the caller (e.g. a zenoh callback thread).
+
+    Attributes:
+        encoder: The wrapped encoder, copied into every worker process
+        workers: Number of worker processes
+        max_in_flight: Maximum number of payloads submitted but not yet decoded
+        shm_threshold: Payloads of at least this many bytes are passed
+            through shared memory instead of being pickled
+    """
+
+    def __init__(
+        self,
+        encoder: Encoder[T],
+        workers: Optional[int] = None,
+        *,
+        max_in_flight: Optional[int] = None,
+        shm_threshold: int = 64 * 1024,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        """Initialize the parallel decoder and start its worker processes.
+
+        Args:
+            encoder: Any make87 encoder. It is pickled into every worker
+                process, so it must be picklable (all built-in encoders are,
+                as long as custom hooks are module-level functions).
+            workers: Number of worker processes. Defaults to the number of CPUs.
+            max_in_flight: Maximum number of payloads being decoded at a time.
+                Defaults to twice the number of workers.
+            shm_threshold: Minimum payload size in bytes for passing the
+                payload through shared memory. Smaller payloads are cheaper
+                to pickle. Defaults to 64 KiB.
+            mp_context: Multiprocessing context used to start the workers.
+                Defaults to the platform's default start method.
+
+        Example:
+            >>> with ParallelDecoder(YamlEncoder(), workers=4) as decoder:
+            ...     for config in decoder.map(payloads):
+            ...         apply(config)
+        """
+        self.encoder = encoder
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.workers
+        self.shm_threshold = shm_threshold
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=mp_context, initializer=_init_worker, initargs=(encoder,)
+        )
+        self._window = threading.BoundedSemaphore(self.max_in_flight)
+        self._lock = threading.Lock()
+        self._slots: List[shared_memory.SharedMemory] = []
+        self._free_slots: List[int] = []
+        self._submitted = 0
+        self._delivered = 0
+        self._done: Dict[int, "concurrent.futures.Future[T]"] = {}
+        self._callbacks: Dict[int, Callable[["concurrent.futures.Future[T]"], None]] = {}
+        self._deliveries: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._delivery_thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(
+        self, data: Buffer, callback: Optional[Callable[["concurrent.futures.Future[T]"], None]] = None
+    ) -> "concurrent.futures.Future[T]":
+        """Submit a payload for decoding.
+
+        Blocks while `max_in_flight` payloads are being decoded. The payload
+        is copied (into shared memory or a pickle) before this returns, so
+        the caller may reuse its buffer right away.
+
+        Args:
+            data: The payload as bytes, bytearray or memoryview
+            callback: Called with the completed future of this payload. Callbacks
+                of all submissions run in submission order, one at a time,
+                from a background thread. Call `result()` on the future to get
+                the decoded object or the decoding error.
+
+        Returns:
+            A future resolving to the decoded object
+
+        Raises:
+            RuntimeError: If the decoder has been closed
+        """
+        if self._closed:
+            raise RuntimeError("ParallelDecoder is closed")
+        self._window.acquire()
+        slot = None
+        try:
+            size = memoryview(data).nbytes
+            if size >= self.shm_threshold:
+                slot = self._acquire_slot(size)
+                segment = self._slots[slot]
+                segment.buf[:size] = memoryview(data).cast("B")
+                future = self._executor.submit(_decode_shared, segment.name, size)
+            else:
+                future = self._executor.submit(_decode_bytes, bytes(data))
+        except BaseException:
+            if slot is not None:
+                self._release_slot(slot)
+            self._window.release()
+            raise
+
+        with self._lock:
+            sequence = self._submitted
+            self._submitted += 1
+            if callback is not None:
+                self._callbacks[sequence] = callback
+                if self._delivery_thread is None:
+                    self._delivery_thread = threading.Thread(target=self._deliver, daemon=True)
+                    self._delivery_thread.start()
+        future.add_done_callback(lambda f: self._complete(sequence, slot, f))
+        return future
+
+    def decode(self, data: Buffer) -> T:
+        """Decode a single payload in a worker process and wait for the result.
+
+        Args:
+            data: The payload as bytes, bytearray or memoryview
+
+        Returns:
+            The decoded object
+
+        Raises:
+            Exception: Whatever the wrapped encoder raised while decoding
+        """
+        return self.submit(data).result()
+
+    def map(self, buffers: Iterable[Buffer]) -> Iterator[T]:
+        """Decode payloads in parallel, yielding the results in input order.
+
+        At most `max_in_flight` payloads are read ahead of the result being
+        yielded, so `buffers` may be an unbounded stream.
+
+        Args:
+            buffers: The payloads as bytes, bytearrays or memoryviews
+
+        Yields:
+            The decoded objects, in input order
+
+        Raises:
+            Exception: Whatever the wrapped encoder raised while decoding,
+                when the failed payload's turn comes
+
+        Example:
+            >>> decoder = ParallelDecoder(JsonEncoder(), workers=4)
+            >>> for detections in decoder.map(sample.payload.to_bytes() for sample in subscriber):
+            ...     handle(detections)
+        """
+        pending: Deque["concurrent.futures.Future[T]"] = deque()
+        for data in buffers:
+            if len(pending) >= self.max_in_flight:
+                yield pending.popleft().result()
+            pending.append(self.submit(data))
+        while pending:
+            yield pending.popleft().result()
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the worker processes and free the shared memory slots.
+
+        Args:
+            wait: Whether to wait for submitted payloads to be decoded. Defaults to True.
+        """
+        self._closed = True
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        if self._delivery_thread is not None:
+            self._deliveries.put(None)
+            if wait:
+                self._delivery_thread.join()
+        with self._lock:
+            for segment in self._slots:
+                segment.close()
+                segment.unlink()
+            self._slots.clear()
+            self._free_slots.clear()
+
+    def __enter__(self) -> "ParallelDecoder[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _acquire_slot(self, size: int) -> int:
+        """Take a free shared memory slot that holds at least `size` bytes."""
+        with self._lock:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                # The window bounds the number of slots in use, so at most `max_in_flight` are created.
+                slot = len(self._slots)
+                self._slots.append(None)
+            segment = self._slots[slot]
+            if segment is None or segment.size < size:
+                if segment is not None:
+                    segment.close()
+                    segment.unlink()
+                capacity = max(_MIN_SLOT_SIZE, 1 << (size - 1).bit_length())
+                self._slots[slot] = shared_memory.SharedMemory(create=True, size=capacity)
+            return slot
+
+    def _release_slot(self, slot: int) -> None:
+        with self._lock:
+            self._free_slots.append(slot)
+
+    def _complete(self, sequence: int, slot: Optional[int], future: "concurrent.futures.Future[T]") -> None:
+        """Free the resources of a decoded payload and queue the callbacks that are due, in order."""
+        if slot is not None:
+            self._release_slot(slot)
+        self._window.release()
+        with self._lock:
+            self._done[sequence] = future
+            while self._delivered in self._done:
+                done = self._done.pop(self._delivered)
+                callback = self._callbacks.pop(self._delivered, None)
+                if callback is not None:
+                    self._deliveries.put((callback, done))
+                self._delivered += 1
+
+    def _deliver(self) -> None:
+        """Run queued callbacks one at a time, off the executor's result thread, so they may submit again."""
+        while True:
+            item = self._deliveries.get()
+            if item is None:
+                return
+            callback, future = item
+            try:
+                callback(future)
+            except Exception:
+                logger.exception("ParallelDecoder callback failed")
@@ -1,13 +1,15 @@
 """Protocol Buffers encoder with version compatibility.
 
-This module provides a Protocol Buffers-based encoder that automatically
-detects the installed protobuf version and imports the appropriate
+This module provides Protocol Buffers-based encoders that automatically
+detect the installed protobuf version and import the appropriate
 implementation. Supports protobuf versions 4, 5, and 6.
 """
 
 import importlib
 from packaging.version import Version
 
+from make87.encodings.protobuf.pool import MessagePool
+
 
 def _get_protobuf_major_version() -> int:
     """Get the major version of the installed protobuf library.
@@ -21,7 +23,7 @@ def _get_protobuf_major_version() -> int:
     try:
         import google.protobuf
     except ImportError as e:
-        raise ImportError("Protobuf support is not installed. " "Install with: pip install make87[protobuf]") from e
+        raise ImportError("Protobuf support is not installed. Install with: pip install make87[protobuf]") from e
 
     version = getattr(google.protobuf, "__version__", None)
     if version is None:
@@ -46,6 +48,8 @@ try:
         raise ImportError(f"Unsupported protobuf major version: {_major}")
 
     ProtobufEncoder = module.ProtobufEncoder
+    DelimitedProtobufEncoder = module.DelimitedProtobufEncoder
+    LazyMessage = module.LazyMessage
 except ImportError:
     # Only expose the error at import/use time
     def _raise_protobuf_import_error(*args, **kwargs):
@@ -54,6 +58,15 @@ except ImportError:
         Raises:
             ImportError: Always raised with installation instructions
         """
-        raise ImportError("Protobuf support is not installed. " "Install with: pip install make87[protobuf]")
+        raise ImportError("Protobuf support is not installed. Install with: pip install make87[protobuf]")
 
     ProtobufEncoder = _raise_protobuf_import_error
+    DelimitedProtobufEncoder = _raise_protobuf_import_error
+    LazyMessage = _raise_protobuf_import_error
+
+__all__ = [
+    "ProtobufEncoder",
+    "DelimitedProtobufEncoder",
+    "LazyMessage",
+    "MessagePool",
+]
@@ -0,0 +1,362 @@
+"""Lazily decoded protobuf messages.
+
+Subscribers that only inspect a field or two (e.g. `header.timestamp`)
+before dropping a message pay for a full parse of every payload, including
+large image or point cloud bytes fields. `LazyMessage` instead indexes the
+top-level fields of the wire format on first access, skipping over
+length-delimited values without reading them, and decodes only the fields
+that are accessed. Singular sub-messages are returned as lazy messages
+themselves. Anything the scanner does not handle (repeated and map fields,
+groups, methods other than the ones below, assignments) falls back to a
+full parse with the regular protobuf runtime.
+"""
+
+import struct
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import DecodeError, Message
+
+from make87.encodings.base import Buffer, unwrap_buffer
+
+T = TypeVar("T", bound=Message)
+
+_WIRE_VARINT = 0
+_WIRE_FIXED64 = 1
+_WIRE_LENGTH_DELIMITED = 2
+_WIRE_FIXED32 = 5
+
+_FIXED = {
+    FieldDescriptor.TYPE_DOUBLE: struct.Struct("<d"),
+    FieldDescriptor.TYPE_FLOAT: struct.Struct("<f"),
+    FieldDescriptor.TYPE_FIXED64: struct.Struct("<Q"),
+    FieldDescriptor.TYPE_SFIXED64: struct.Struct("<q"),
+    FieldDescriptor.TYPE_FIXED32: struct.Struct("<I"),
+    FieldDescriptor.TYPE_SFIXED32: struct.Struct("<i"),
+}
+_SIGNED_VARINT_BITS = {
+    FieldDescriptor.TYPE_INT32: 32,
+    FieldDescriptor.TYPE_INT64: 64,
+    FieldDescriptor.TYPE_ENUM: 32,
+}
+_ZIGZAG = (FieldDescriptor.TYPE_SINT32, FieldDescriptor.TYPE_SINT64)
+
+# Per message class: field name -> (field number, descriptor, sub-message class or None)
+_schemas: Dict[type, Dict[str, Tuple[int, FieldDescriptor, Optional[type]]]] = {}
+
+
+class _Unsupported(Exception):
+    """Raised internally when a field access needs a full parse."""
+
+
+def _is_repeated(field: FieldDescriptor) -> bool:
+    """Check whether a field is repeated; `label` is deprecated since protobuf 6."""
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is not None:
+        return is_repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _is_unknown_closed_enum_value(field: FieldDescriptor, value: int) -> bool:
+    """Check whether a value is not a member of a closed (proto2) enum field."""
+    enum_type = field.enum_type
+    is_closed = getattr(enum_type, "is_closed", None)
+    if is_closed is None:  # older protobuf releases
+        is_closed = enum_type.file.syntax == "proto2"
+    return is_closed and value not in enum_type.values_by_number
+
+
+def _schema(message_type: Type[Message]) -> Dict[str, Tuple[int, FieldDescriptor, Optional[type]]]:
+    """Get the lazily accessible fields of a message class."""
+    schema = _schemas.get(message_type)
+    if schema is None:
+        schema = {}
+        default = message_type()
+        for field in message_type.DESCRIPTOR.fields:
+            if _is_repeated(field) or field.type == FieldDescriptor.TYPE_GROUP:
+                continue
+            sub_type = type(getattr(default, field.name)) if field.type == FieldDescriptor.TYPE_MESSAGE else None
+            schema[field.name] = (field.number, field, sub_type)
+        _schemas[message_type] = schema
+    return schema
+
+
+def _read_varint(data: Buffer, offset: int) -> Tuple[int, int]:
+    """Read a varint, returning its value and the offset after it."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+        if shift >= 70:
+            raise DecodeError("Varint is too long.")
+
+
+def _index(data: Buffer, offset: int, end: int) -> Dict[int, List[Tuple[int, int, int]]]:
+    """Index the top-level fields of a serialized message in `data[offset:end]`.
+
+    Returns:
+        Field number -> list of (wire type, value start, value end), in wire order
+    """
+    fields: Dict[int, List[Tuple[int, int, int]]] = {}
+    try:
+        while offset < end:
+            tag = data[offset]
+            if tag < 0x80:
+                offset += 1
+            else:
+                tag, offset = _read_varint(data, offset)
+            wire_type = tag & 0x7
+            start = offset
+            if wire_type == _WIRE_VARINT:
+                while data[offset] & 0x80:
+                    offset += 1
+                offset += 1
+            elif wire_type == _WIRE_LENGTH_DELIMITED:
+                size = data[offset]
+                if size < 0x80:
+                    start = offset + 1
+                else:
+                    size, start = _read_varint(data, offset)
+                offset = start + size
+            elif wire_type == _WIRE_FIXED64:
+                offset += 8
+            elif wire_type == _WIRE_FIXED32:
+                offset += 4
+            else:
+                raise _Unsupported()
+            if offset > end:
+                raise DecodeError("Truncated message.")
+            occurrences = fields.get(tag >> 3)
+            if occurrences is None:
+                fields[tag >> 3] = [(wire_type, start, offset)]
+            else:
+                occurrences.append((wire_type, start, offset))
+    except IndexError:
+        raise DecodeError("Truncated message.")
+    return fields
+
+
+class LazyMessage(Generic[T]):
+    """Lazy view of a serialized protobuf message that decodes fields on access.
+
+    Singular scalar, string, bytes and enum fields are decoded from the wire
+    format when accessed. Singular sub-message fields are returned as
+    `LazyMessage` instances over the sub-message bytes. Every other
+    attribute, and any assignment, parses the full message once with the
+    regular protobuf runtime and is served from it from then on. For a
+    sub-message view, that parses the enclosing top-level message and
+    serves the view from its sub-message, so assignments through a view
+    (e.g. `message.header.frame_id = "base"`) modify the enclosing message.
+
+    The proxy keeps a reference to the payload buffer, which must not be
+    modified while the proxy is in use.
+
+    Example:
+        >>> message = encoder.decode_lazy(payload)
+        >>> if message.header.timestamp.seconds < cutoff:
+        ...     return  # the image bytes were never read
+        >>> full = message.ToMessage()
+    """
+
+    def __init__(self, message_type: Type[T], data: Buffer) -> None:
+        """Initialize a lazy view over a serialized message.
+
+        Args:
+            message_type: The protobuf Message class of the payload
+            data: The serialized message as bytes, bytearray or memoryview
+        """
+        data = unwrap_buffer(data)
+        if isinstance(data, memoryview):
+            data = data.cast("B")
+        self.__dict__.update(
+            _lazy_type=message_type,
+            _lazy_data=data,
+            _lazy_start=0,
+            _lazy_end=len(data),
+            _lazy_index=None,
+            _lazy_message=None,
+            _lazy_parent=None,
+            _lazy_name=None,
+        )
+
+    @classmethod
+    def _lazy_view(
+        cls, message_type: Type[Message], data: Buffer, start: int, end: int, parent: "LazyMessage", name: str
+    ) -> "LazyMessage":
+        """Create a lazy view over `data[start:end]`, the sub-message field `name` of `parent`, without slicing."""
+        view = cls.__new__(cls)
+        view.__dict__.update(
+            _lazy_type=message_type,
+            _lazy_data=data,
+            _lazy_start=start,
+            _lazy_end=end,
+            _lazy_index=None,
+            _lazy_message=None,
+            _lazy_parent=parent,
+            _lazy_name=name,
+        )
+        return view
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names missing from __dict__; copy and pickle probe dunders before __dict__ is filled.
+        if name.startswith("_lazy") or (name.startswith("__") and name.endswith("__")):
+            raise AttributeError(name)
+        if not self._lazy_parsed():
+            entry = _schema(self._lazy_type).get(name)
+            if entry is not None:
+                try:
+                    return self._lazy_field(*entry)
+                except _Unsupported:
+                    pass
+        return getattr(self.ToMessage(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.ToMessage(), name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        if isinstance(state["_lazy_data"], memoryview):
+            state["_lazy_data"] = bytes(state["_lazy_data"])  # memoryviews cannot be pickled
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyMessage):
+            other = other.ToMessage()
+        return self.ToMessage() == other
+
+    def __repr__(self) -> str:
+        return f"LazyMessage({self._lazy_type.__name__}, {self._lazy_end - self._lazy_start} bytes)"
+
+    def HasField(self, name: str) -> bool:
+        """Check whether a field with presence is set, without a full parse where possible.
+
+        Args:
+            name: Name of the field
+
+        Returns:
+            True if the field is set
+
+        Raises:
+            ValueError: If the field does not track presence
+        """
+        if not self._lazy_parsed():
+            entry = _schema(self._lazy_type).get(name)
+            if entry is not None and entry[1].has_presence and entry[1].containing_oneof is None:
+                try:
+                    return entry[0] in self._lazy_fields()
+                except _Unsupported:
+                    pass
+        return self.ToMessage().HasField(name)
+
+    def SerializeToString(self, **kwargs: Any) -> bytes:
+        """Serialize the message.
+
+        Returns the original payload as long as the message was not modified.
+
+        Returns:
+            The serialized message as bytes
+        """
+        if not kwargs and not self._lazy_parsed():
+            return bytes(self._lazy_payload())
+        return self.ToMessage().SerializeToString(**kwargs)
+
+    def ToMessage(self) -> T:
+        """Parse the full message.
+
+        The message is parsed once and cached. After this, all attribute
+        access is served from the parsed message. For a sub-message view,
+        this parses the enclosing message and returns its sub-message, so
+        modifying it modifies the enclosing message.
+
+        Returns:
+            The fully parsed protobuf message
+
+        Raises:
+            google.protobuf.message.DecodeError: If the payload cannot be parsed
+        """
+        message = self._lazy_message
+        if message is None:
+            parent = self._lazy_parent
+            if parent is None:
+                message = self._lazy_type.FromString(self._lazy_payload())
+            else:
+                message = getattr(parent.ToMessage(), self._lazy_name)
+            self.__dict__["_lazy_message"] = message
+        return message
+
+    def _lazy_parsed(self) -> bool:
+        """Check whether the message, or a message enclosing it, has been parsed and may have been modified."""
+        if self._lazy_message is not None:
+            return True
+        parent = self._lazy_parent
+        return parent is not None and parent._lazy_parsed()
+
+    def _lazy_payload(self) -> Buffer:
+        """Get the serialized message, slicing the shared buffer only if needed."""
+        data = self._lazy_data
+        if self._lazy_start == 0 and self._lazy_end == len(data):
+            return data
+        return memoryview(data)[self._lazy_start : self._lazy_end]
+
+    def _lazy_fields(self) -> Dict[int, List[Tuple[int, int, int]]]:
+        """Get the index of the top-level fields, scanning the payload on first use."""
+        index = self._lazy_index
+        if index is None:
+            index = _index(self._lazy_data, self._lazy_start, self._lazy_end)
+            self.__dict__["_lazy_index"] = index
+        return index
+
+    def _lazy_field(self, number: int, field: FieldDescriptor, sub_type: Optional[type]) -> Any:
+        """Decode a singular field from the wire format."""
+        index = self._lazy_fields()
+        occurrences = index.get(number)
+        data = self._lazy_data
+
+        oneof = field.containing_oneof
+        if oneof is not None and sum(other.number in index for other in oneof.fields) > 1:
+            raise _Unsupported()  # which member of the oneof wins depends on the wire order
+
+        if sub_type is not None:
+            if occurrences is None:
+                return LazyMessage._lazy_view(sub_type, b"", 0, 0, self, field.name)
+            if len(occurrences) == 1:
+                _, start, end = occurrences[0]
+                return LazyMessage._lazy_view(sub_type, data, start, end, self, field.name)
+            # Repeated occurrences of a sub-message are merged, which concatenation reproduces.
+            merged = b"".join(memoryview(data)[start:end] for _, start, end in occurrences)
+            return LazyMessage._lazy_view(sub_type, merged, 0, len(merged), self, field.name)
+
+        if occurrences is None:
+            return field.default_value
+        wire_type, start, end = occurrences[-1]  # the last occurrence wins for scalars
+
+        if field.type == FieldDescriptor.TYPE_STRING and wire_type == _WIRE_LENGTH_DELIMITED:
+            return str(memoryview(data)[start:end], "utf-8")
+        if field.type == FieldDescriptor.TYPE_BYTES and wire_type == _WIRE_LENGTH_DELIMITED:
+            return bytes(memoryview(data)[start:end])
+        if field.type in _FIXED and wire_type in (_WIRE_FIXED32, _WIRE_FIXED64):
+            return _FIXED[field.type].unpack_from(data, start)[0]
+        if wire_type == _WIRE_VARINT:
+            value, _ = _read_varint(data, start)
+            if field.type == FieldDescriptor.TYPE_BOOL:
+                return value != 0
+            if field.type in _ZIGZAG:
+                return (value >> 1) ^ -(value & 1)
+            bits = _SIGNED_VARINT_BITS.get(field.type)
+            if bits is not None:
+                value &= (1 << bits) - 1
+                if value >= 1 << (bits - 1):
+                    value -= 1 << bits
+                if field.type == FieldDescriptor.TYPE_ENUM and _is_unknown_closed_enum_value(field, value):
+                    raise _Unsupported()  # parsing moves the value to the unknown fields
+                return value
+            return value & (0xFFFFFFFF if field.type == FieldDescriptor.TYPE_UINT32 else 0xFFFFFFFFFFFFFFFF)
+        raise _Unsupported()
@@ -1,13 +1,17 @@
 """Protocol Buffers encoder implementation for protobuf version 5.
 
 This module provides the ProtobufEncoder class for serializing and deserializing
-Protocol Buffers messages to and from bytes, specifically for protobuf version 5.x.
+Protocol Buffers messages to and from bytes, and the DelimitedProtobufEncoder
+class for length-delimited message streams, specifically for protobuf version 5.x.
 """
 
-from typing import Type, TypeVar
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Type, TypeVar
 from google.protobuf.message import Message
 
-from make87.encodings.base import Encoder
+from make87.encodings.base import Buffer, Encoder, unwrap_buffer
+from make87.encodings.framing import Source, frame, iter_frames, write_frame
+from make87.encodings.protobuf.lazy import LazyMessage
+from make87.encodings.protobuf.pool import MessagePool
 
 T = TypeVar("T", bound=Message)
 
@@ -24,14 +28,19 @@ class ProtobufEncoder(Encoder[T]):
 
     Attributes:
         message_type: The protobuf Message class used for encoding/decoding
+        pool: Optional pool of reusable messages that `decode` parses into
     """
 
-    def __init__(self, message_type: Type[T]) -> None:
+    def __init__(self, message_type: Type[T], *, pool_size: int = 0) -> None:
         """Initialize the protobuf encoder with a specific message type.
 
         Args:
             message_type: The specific protobuf Message class to encode/decode.
                 This must be a subclass of google.protobuf.message.Message.
+            pool_size: Number of idle messages kept for reuse by `decode`.
+                Defaults to 0, which creates a new message per decode. With a
+                pool, decoded messages must be handed back with `release`
+                once the caller is done with them.
 
         Example:
             >>> from my_protos import MyMessage
@@ -41,8 +50,14 @@ class ProtobufEncoder(Encoder[T]):
             >>> message = MyMessage()
             >>> message.field = "value"
             >>> encoded = encoder.encode(message)
+            >>>
+            >>> # Recycle decoded messages on a high-rate topic
+            >>> encoder = ProtobufEncoder(MyMessage, pool_size=4)
+            >>> message = encoder.decode(encoded)
+            >>> encoder.release(message)
         """
         self.message_type = message_type
+        self.pool: Optional[MessagePool[T]] = MessagePool(message_type, pool_size) if pool_size > 0 else None
 
     def encode(self, obj: T) -> bytes:
         """Serialize a protobuf Message to bytes.
@@ -64,11 +79,14 @@ class ProtobufEncoder(Encoder[T]):
         """
         return obj.SerializeToString()
 
-    def decode(self, data: bytes) -> T:
+    def decode(self, data: bytes, into: Optional[T] = None) -> T:
         """Deserialize bytes to a protobuf Message.
 
         Args:
             data: The byte data to deserialize into a protobuf message
+            into: Optional message to parse into instead of a new one. Its
+                previous contents are cleared. If not given, the message is
+                taken from the pool when one is configured.
 
         Returns:
             The deserialized protobuf message instance
@@ -77,12 +95,301 @@ class ProtobufEncoder(Encoder[T]):
             google.protobuf.message.DecodeError: If the data cannot be parsed
                 as a valid protobuf message of the configured type
 
+        Note:
+            With the upb backend a message's memory grows every time it is
+            parsed into again, so a scratch message passed as `into` should
+            be replaced from time to time. The pool does this automatically.
+
         Example:
             >>> encoder = ProtobufEncoder(MyMessage)
             >>> data = b'\\x08\\x96\\x01'  # Some protobuf-encoded bytes
             >>> message = encoder.decode(data)
             >>> print(message.name)
+            >>>
+            >>> # Parse into a preallocated message
+            >>> scratch = MyMessage()
+            >>> encoder.decode(data, into=scratch)
         """
-        message = self.message_type()
+        message = self._target(into)
         message.ParseFromString(data)
         return message
+
+    def decode_from(self, data: Buffer, into: Optional[T] = None) -> T:
+        """Deserialize a protobuf Message from any bytes-like buffer.
+
+        Bytes and bytearrays are handed to the parser as-is. Memoryviews that
+        span a whole bytes or bytearray object are unwrapped first, since the
+        upb backend would otherwise copy them into a temporary bytes object.
+
+        Args:
+            data: The serialized message as bytes, bytearray or memoryview
+            into: Optional message to parse into instead of a new one. Its
+                previous contents are cleared. If not given, the message is
+                taken from the pool when one is configured.
+
+        Returns:
+            The deserialized protobuf message instance
+
+        Raises:
+            google.protobuf.message.DecodeError: If the data cannot be parsed
+                as a valid protobuf message of the configured type
+
+        Example:
+            >>> encoder = ProtobufEncoder(MyMessage)
+            >>> view = memoryview(receive_buffer)[offset:offset + size]
+            >>> message = encoder.decode_from(view)
+        """
+        message = self._target(into)
+        message.ParseFromString(unwrap_buffer(data))
+        return message
+
+    def decode_lazy(self, data: Buffer, *, min_size: int = 512 * 1024) -> LazyMessage[T]:
+        """Wrap a serialized protobuf Message in a lazily decoding view.
+
+        Nothing is parsed up front. Singular fields are decoded from the wire
+        format when accessed, so filter-then-drop subscribers never pay for
+        fields they do not read, such as large bytes fields. Other access
+        falls back to a full parse, see `LazyMessage`.
+
+        Reading a field lazily costs a few microseconds in Python, while the
+        native parser handles small payloads faster than that. Payloads below
+        `min_size` are therefore parsed in full right away and only wrapped.
+
+        Args:
+            data: The serialized message as bytes, bytearray or memoryview.
+                It must not be modified while the returned view is in use.
+            min_size: Payloads smaller than this many bytes are parsed in full.
+                Defaults to 512 KiB, around where lazy access starts to pay off
+                for a message with a large bytes field. Pass 0 to always decode lazily.
+
+        Returns:
+            A lazy view of the message
+
+        Raises:
+            google.protobuf.message.DecodeError: If a payload below `min_size`
+                cannot be parsed. Larger payloads raise on field access instead.
+
+        Example:
+            >>> encoder = ProtobufEncoder(MyImage)
+            >>> message = encoder.decode_lazy(payload)
+            >>> if message.header.entity_path != "/camera/front":
+            ...     return
+            >>> image = message.ToMessage()
+        """
+        message = LazyMessage(self.message_type, data)
+        if len(data) < min_size:
+            message.ToMessage()
+        return message
+
+    def release(self, message: T) -> None:
+        """Hand a decoded message back to the pool for reuse.
+
+        The caller must not use the message, or any sub-message or container
+        obtained from it, after releasing it. Without a pool this is a no-op.
+
+        Args:
+            message: A message previously returned by `decode` or `decode_from`
+
+        Example:
+            >>> encoder = ProtobufEncoder(MyMessage, pool_size=4)
+            >>> message = encoder.decode(data)
+            >>> handle(message)
+            >>> encoder.release(message)
+        """
+        if self.pool is not None:
+            self.pool.release(message)
+
+    def _target(self, into: Optional[T]) -> T:
+        """Get the message instance that the next decode parses into.
+
+        Args:
+            into: Caller-supplied message, if any
+
+        Returns:
+            The caller's message, a pooled message, or a new message
+        """
+        if into is not None:
+            return into
+        if self.pool is not None:
+            return self.pool.acquire()
+        return self.message_type()
+
+    def encode_many(self, objs: Iterable[T]) -> List[bytes]:
+        """Serialize a batch of protobuf Messages to bytes.
+
+        The serializer is looked up once on the message class and mapped over
+        the batch, avoiding a per-message attribute lookup and method binding.
+
+        Args:
+            objs: The protobuf message instances to serialize
+
+        Returns:
+            One serialized payload per message, in input order
+
+        Raises:
+            TypeError: If an object is not an instance of the configured message type
+
+        Example:
+            >>> encoder = ProtobufEncoder(MyMessage)
+            >>> payloads = encoder.encode_many([MyMessage(name="a"), MyMessage(name="b")])
+        """
+        return list(map(self.message_type.SerializeToString, objs))
+
+    def decode_many(self, buffers: Iterable[Buffer]) -> List[T]:
+        """Deserialize a batch of payloads to protobuf Messages.
+
+        Messages are created and parsed in one step through the class-level
+        `FromString` constructor, mapped over the batch.
+
+        Args:
+            buffers: The serialized messages as bytes, bytearray or memoryview
+
+        Returns:
+            One deserialized message per payload, in input order
+
+        Raises:
+            google.protobuf.message.DecodeError: If any payload cannot be parsed
+                as a valid protobuf message of the configured type
+
+        Example:
+            >>> encoder = ProtobufEncoder(MyMessage)
+            >>> messages = encoder.decode_many(payloads)
+        """
+        return list(map(self.message_type.FromString, map(unwrap_buffer, buffers)))
+
+
+class DelimitedProtobufEncoder(Encoder[List[T]]):
+    """Encoder for length-delimited streams of protobuf messages.
+
+    This encoder packs many messages of one type into a single payload, each
+    preceded by its size as a varint. The wire format is the same as
+    protobuf's `writeDelimitedTo`/`parseDelimitedFrom`, so streams can be
+    exchanged with other protobuf implementations.
+
+    Type Parameters:
+        T: The specific protobuf Message class contained in the stream
+
+    Attributes:
+        message_type: The protobuf Message class used for encoding/decoding
+    """
+
+    def __init__(self, message_type: Type[T]) -> None:
+        """Initialize the delimited encoder with a specific message type.
+
+        Args:
+            message_type: The protobuf Message class of every message in the stream.
+                This must be a subclass of google.protobuf.message.Message.
+
+        Example:
+            >>> from my_protos import MyMessage
+            >>> encoder = DelimitedProtobufEncoder(MyMessage)
+            >>> payload = encoder.encode([MyMessage(name="a"), MyMessage(name="b")])
+        """
+        self.message_type = message_type
+
+    def encode(self, obj: Iterable[T]) -> bytes:
+        """Serialize protobuf Messages to one length-delimited stream.
+
+        Args:
+            obj: The protobuf message instances to serialize
+
+        Returns:
+            The length-delimited stream as bytes
+
+        Raises:
+            TypeError: If an object is not an instance of the configured message type
+
+        Example:
+            >>> encoder = DelimitedProtobufEncoder(MyMessage)
+            >>> payload = encoder.encode(messages)
+            >>> publisher.put(payload)
+        """
+        return frame(map(self.message_type.SerializeToString, obj))
+
+    def decode(self, data: bytes) -> List[T]:
+        """Deserialize a length-delimited stream to a list of protobuf Messages.
+
+        Args:
+            data: The length-delimited stream
+
+        Returns:
+            The deserialized messages, in stream order
+
+        Raises:
+            ValueError: If the stream ends in the middle of a message
+            google.protobuf.message.DecodeError: If a message cannot be parsed
+                as a valid protobuf message of the configured type
+
+        Example:
+            >>> encoder = DelimitedProtobufEncoder(MyMessage)
+            >>> messages = encoder.decode(payload)
+        """
+        return list(self.iter_decode(data))
+
+    def decode_from(self, data: Buffer) -> List[T]:
+        """Deserialize a length-delimited stream from any bytes-like buffer.
+
+        Args:
+            data: The length-delimited stream as bytes, bytearray or memoryview
+
+        Returns:
+            The deserialized messages, in stream order
+
+        Raises:
+            ValueError: If the stream ends in the middle of a message
+            google.protobuf.message.DecodeError: If a message cannot be parsed
+                as a valid protobuf message of the configured type
+        """
+        return list(self.iter_decode(data))
+
+    def iter_decode(self, source: Source) -> Iterator[T]:
+        """Incrementally deserialize the messages of a length-delimited stream.
+
+        Only one message is held at a time, so arbitrarily long streams and
+        files can be processed without reading them into memory first.
+
+        Args:
+            source: The length-delimited stream as bytes, bytearray, memoryview
+                or a readable binary file-like object
+
+        Yields:
+            The deserialized messages, in stream order
+
+        Raises:
+            ValueError: If the stream ends in the middle of a message
+            google.protobuf.message.DecodeError: If a message cannot be parsed
+                as a valid protobuf message of the configured type
+
+        Example:
+            >>> encoder = DelimitedProtobufEncoder(MyMessage)
+            >>> with open("recording.bin", "rb") as f:
+            ...     for message in encoder.iter_decode(f):
+            ...         print(message.name)
+        """
+        from_string = self.message_type.FromString
+        for payload in iter_frames(source):
+            yield from_string(payload)
+
+    def write_to(self, obj: Iterable[T], stream: BinaryIO) -> int:
+        """Serialize protobuf Messages as a length-delimited stream to a file.
+
+        Messages are written one at a time, so the whole stream is never held
+        in memory.
+
+        Args:
+            obj: The protobuf message instances to serialize
+            stream: A writable binary file-like object
+
+        Returns:
+            The number of bytes written
+
+        Raises:
+            TypeError: If an object is not an instance of the configured message type
+
+        Example:
+            >>> encoder = DelimitedProtobufEncoder(MyMessage)
+            >>> with open("recording.bin", "wb") as f:
+            ...     encoder.write_to(messages, f)
+        """
+        serialize = self.message_type.SerializeToString
+        return sum(write_frame(stream, serialize(message)) for message in obj)
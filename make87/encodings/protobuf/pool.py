@@ -0,0 +1,115 @@
+"""Bounded pool of reusable protobuf message instances.
+
+This module provides the MessagePool class used by `ProtobufEncoder` to
+parse incoming payloads into recycled message objects instead of creating a
+new message per sample. It only relies on the generic `Message` API and
+works with every supported protobuf major version.
+"""
+
+from collections import deque
+from typing import Callable, Deque, Dict, Generic, Set, TypeVar
+
+T = TypeVar("T")
+
+
+class MessagePool(Generic[T]):
+    """Thread-safe, bounded pool of reusable protobuf messages.
+
+    Messages are handed out with `acquire` and given back with `release`.
+    At most `maxsize` idle messages are kept; surplus releases are dropped
+    and left to the garbage collector.
+
+    The upb backend (protobuf >= 4.21) does not free a message's arena when
+    it is cleared or parsed into again, so a recycled message keeps growing
+    with every reuse. Each pooled message is therefore retired after
+    `max_reuses` acquisitions, which bounds that growth.
+
+    Type Parameters:
+        T: The protobuf Message class held by the pool
+
+    Attributes:
+        message_type: The protobuf Message class held by the pool
+        maxsize: Maximum number of idle messages kept for reuse
+        max_reuses: Number of acquisitions after which a message is retired
+    """
+
+    def __init__(self, message_type: Callable[[], T], maxsize: int, max_reuses: int = 100) -> None:
+        """Initialize an empty message pool.
+
+        Args:
+            message_type: The protobuf Message class to pool
+            maxsize: Maximum number of idle messages kept for reuse
+            max_reuses: Number of acquisitions after which a message is
+                retired instead of being returned to the pool
+
+        Raises:
+            ValueError: If maxsize or max_reuses is not positive
+
+        Example:
+            >>> pool = MessagePool(MyMessage, maxsize=8)
+            >>> message = pool.acquire()
+            >>> message.ParseFromString(payload)
+            >>> pool.release(message)
+        """
+        if maxsize < 1:
+            raise ValueError(f"Pool size must be positive, got {maxsize}")
+        if max_reuses < 1:
+            raise ValueError(f"max_reuses must be positive, got {max_reuses}")
+        self.message_type = message_type
+        self.maxsize = maxsize
+        self.max_reuses = max_reuses
+        # deque.pop/append, set and dict item access are atomic under the GIL, so no lock is needed.
+        self._idle: Deque[T] = deque()
+        self._idle_ids: Set[int] = set()
+        self._uses: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        """Get the number of idle messages currently held by the pool.
+
+        Returns:
+            The number of messages available for reuse
+        """
+        return len(self._idle)
+
+    def acquire(self) -> T:
+        """Take a message from the pool, creating one if the pool is empty.
+
+        The returned message may still hold the contents of its previous
+        use; parse into it with `ParseFromString`, which clears it first.
+
+        Returns:
+            A message instance owned by the caller until it is released
+        """
+        try:
+            message = self._idle.pop()
+            self._idle_ids.discard(id(message))
+        except IndexError:
+            message = self.message_type()
+            if len(self._uses) >= 4 * self.maxsize:
+                # Messages that are never released would otherwise pile up here.
+                self._uses.clear()
+        key = id(message)
+        self._uses[key] = self._uses.get(key, 0) + 1
+        return message
+
+    def release(self, message: T) -> None:
+        """Return a message to the pool for reuse.
+
+        The caller must not use the message, or anything obtained from its
+        fields, after releasing it. Messages that were not acquired from this
+        pool, have reached `max_reuses`, or exceed `maxsize` are dropped.
+        Releasing a message that is already idle in the pool does nothing,
+        so it cannot be handed out twice.
+
+        Args:
+            message: A message previously returned by `acquire`
+        """
+        key = id(message)
+        uses = self._uses.get(key)
+        if uses is None or key in self._idle_ids:
+            return
+        if uses < self.max_reuses and len(self._idle) < self.maxsize:
+            self._idle_ids.add(key)
+            self._idle.append(message)
+        else:
+            del self._uses[key]
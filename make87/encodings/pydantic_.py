@@ -0,0 +1,133 @@
+"""Pydantic encoder for serializing models to JSON.
+
+This module provides an encoder for pydantic models and any other type
+pydantic can validate (e.g. `List[Model]`). JSON parsing, validation and
+serialization run in pydantic-core straight on the payload bytes, using one
+cached `TypeAdapter` per type.
+"""
+
+import threading
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import TypeAdapter
+
+from make87.encodings.base import Buffer, Encoder, unwrap_buffer
+
+T = TypeVar("T")
+
+_adapters: Dict[Any, TypeAdapter] = {}
+_lock = threading.Lock()
+
+
+def get_type_adapter(type_: Any) -> TypeAdapter:
+    """Get the shared `TypeAdapter` of a type.
+
+    Building an adapter compiles the type's validator and serializer, which
+    is far more expensive than using it, so adapters are created once per
+    type and cached for the lifetime of the process.
+
+    Args:
+        type_: A pydantic model class or any type supported by `TypeAdapter`
+
+    Returns:
+        The cached adapter of the type
+    """
+    adapter = _adapters.get(type_)
+    if adapter is None:
+        with _lock:
+            adapter = _adapters.get(type_)
+            if adapter is None:
+                adapter = _adapters[type_] = TypeAdapter(type_)
+    return adapter
+
+
+class PydanticEncoder(Encoder[T]):
+    """JSON encoder for pydantic models.
+
+    This encoder serializes pydantic models (or any type supported by
+    `TypeAdapter`) to UTF-8 encoded JSON bytes and validates JSON bytes back
+    into instances of the type, entirely in pydantic-core.
+
+    Attributes:
+        model_type: The type this encoder serializes and validates
+        adapter: The shared TypeAdapter of the type
+    """
+
+    def __init__(self, model_type: Type[T], *, by_alias: bool = False) -> None:
+        """Initialize the pydantic encoder for a type.
+
+        Args:
+            model_type: A pydantic model class, or any type supported by
+                `TypeAdapter` such as `List[Model]`
+            by_alias: Whether to serialize fields by their alias. Defaults to False.
+
+        Example:
+            >>> class Pose(BaseModel):
+            ...     x: float
+            ...     y: float
+            >>> encoder = PydanticEncoder(Pose)
+            >>> encoder.decode(encoder.encode(Pose(x=1, y=2)))
+            Pose(x=1.0, y=2.0)
+        """
+        self.model_type = model_type
+        self.by_alias = by_alias
+        self.adapter = get_type_adapter(model_type)
+
+    def encode(self, obj: T) -> bytes:
+        """Serialize an instance to UTF-8 encoded JSON bytes.
+
+        Args:
+            obj: The instance to serialize
+
+        Returns:
+            UTF-8 encoded JSON bytes
+
+        Raises:
+            ValueError: If serialization fails
+        """
+        try:
+            return self.adapter.dump_json(obj, by_alias=self.by_alias)
+        except Exception as e:
+            raise ValueError(f"Pydantic encoding failed: {e}")
+
+    def decode(self, data: bytes) -> T:
+        """Deserialize UTF-8 encoded JSON bytes to an instance of the type.
+
+        Args:
+            data: UTF-8 encoded JSON bytes
+
+        Returns:
+            The decoded instance
+
+        Raises:
+            ValueError: If the JSON is invalid, or validation fails
+        """
+        return self.decode_from(data)
+
+    def decode_from(self, data: Buffer) -> T:
+        """Deserialize UTF-8 encoded JSON from any bytes-like buffer.
+
+        Bytes and bytearrays are parsed in place. Other buffers are copied
+        into bytes once, as pydantic-core only reads str, bytes or bytearray.
+
+        Args:
+            data: UTF-8 encoded JSON as bytes, bytearray or memoryview
+
+        Returns:
+            The decoded instance
+
+        Raises:
+            ValueError: If the JSON is invalid, or validation fails
+
+        Example:
+            >>> encoder = PydanticEncoder(Pose)
+            >>> encoder.decode_from(memoryview(b'{"x": 1, "y": 2}'))
+            Pose(x=1.0, y=2.0)
+        """
+        data = unwrap_buffer(data)
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        try:
+            return self.adapter.validate_json(data)
+        except Exception as e:
+            raise ValueError(f"Pydantic decoding failed: {e}")
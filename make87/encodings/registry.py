@@ -0,0 +1,183 @@
+"""Registry resolving interface encodings to ready-to-use encoders.
+
+Topic and endpoint configs carry an `encoding` name and a `message_type`.
+This module maps such a pair to an encoder instance that is created once
+and cached, so interface wrappers and applications can share encoders
+instead of constructing them per call. Protobuf message classes are only
+imported when an encoder for them is first requested.
+"""
+
+import importlib
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from make87.encodings.base import Encoder
+
+DEFAULT_ENCODING = "protobuf"
+
+EncoderFactory = Callable[[Optional[str]], Encoder]
+
+_factories: Dict[str, EncoderFactory] = {}
+_aliases: Dict[str, str] = {}
+_encoders: Dict[Tuple[str, Optional[str]], Encoder] = {}
+_lock = threading.Lock()
+
+
+def register_encoding(name: str, factory: EncoderFactory, *, aliases: Tuple[str, ...] = ()) -> None:
+    """Register a factory creating encoders for an encoding name.
+
+    Registering an existing name replaces its factory and drops the
+    encoders cached for it.
+
+    Args:
+        name: Encoding name as used in the interface config, e.g. "protobuf"
+        factory: Callable creating an encoder from the message type name
+            (None if the config has none)
+        aliases: Further names resolving to the same encoding
+
+    Example:
+        >>> register_encoding("json-compact", lambda message_type: JsonEncoder(backend="orjson"))
+    """
+    name = _normalize(name)
+    with _lock:
+        _factories[name] = factory
+        for alias in aliases:
+            _aliases[_normalize(alias)] = name
+        for key in [key for key in _encoders if key[0] == name]:
+            del _encoders[key]
+
+
+def registered_encodings() -> List[str]:
+    """List the registered encoding names, without aliases.
+
+    Returns:
+        The registered encoding names
+    """
+    return list(_factories)
+
+
+def get_encoder(encoding: Optional[str] = None, message_type: Optional[str] = None) -> Encoder:
+    """Get the cached encoder for an encoding and message type.
+
+    The encoder is created on first request and returned from the cache on
+    every later request with the same arguments.
+
+    Args:
+        encoding: Encoding name from the interface config, case-insensitive.
+            Defaults to None, which selects protobuf, the encoding of make87
+            messages.
+        message_type: Message type name from the interface config, e.g.
+            "make87_messages.text.text_plain.PlainText". Required for
+            protobuf, ignored by schemaless encodings such as JSON and YAML.
+
+    Returns:
+        The shared encoder instance
+
+    Raises:
+        ValueError: If the encoding is unknown, or the encoder cannot be created
+            (e.g. the message type cannot be resolved)
+
+    Example:
+        >>> encoder = get_encoder(config.encoding, config.message_type)
+        >>> payload = encoder.encode(message)
+    """
+    name = _normalize(encoding or DEFAULT_ENCODING)
+    name = _aliases.get(name, name)
+    key = (name, message_type)
+    encoder = _encoders.get(key)
+    if encoder is not None:
+        return encoder
+
+    factory = _factories.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown encoding {encoding!r}. Choose one of: {', '.join(_factories)}")
+    with _lock:
+        encoder = _encoders.get(key)
+        if encoder is None:
+            encoder = _encoders[key] = factory(message_type)
+    return encoder
+
+
+def clear_encoder_cache() -> None:
+    """Drop all cached encoder instances."""
+    with _lock:
+        _encoders.clear()
+
+
+def resolve_message_type(name: str) -> type:
+    """Import a message class from its dotted type name.
+
+    make87 message types name the proto module without the `_pb2` suffix of
+    the generated Python module (e.g. "make87_messages.text.text_plain.PlainText"
+    lives in `make87_messages.text.text_plain_pb2`). Both spellings are
+    accepted, as are nested messages ("pkg.module.Outer.Inner").
+
+    Args:
+        name: Dotted message type name
+
+    Returns:
+        The message class
+
+    Raises:
+        ValueError: If no importable module contains the message class
+    """
+    parts = name.split(".")
+    for split in range(len(parts) - 1, 0, -1):
+        module_name = ".".join(parts[:split])
+        for candidate in (f"{module_name}_pb2", module_name):
+            try:
+                module = importlib.import_module(candidate)
+            except ImportError:
+                continue
+            value = module
+            try:
+                for attribute in parts[split:]:
+                    value = getattr(value, attribute)
+            except AttributeError:
+                continue
+            if isinstance(value, type):
+                return value
+    raise ValueError(f"Cannot resolve message type {name!r}.")
+
+
+def _normalize(name: str) -> str:
+    return name.strip().lower()
+
+
+def _protobuf_encoder(message_type: Optional[str]) -> Encoder:
+    from make87.encodings.protobuf import ProtobufEncoder
+
+    if not message_type:
+        raise ValueError("Protobuf encoding requires a message type.")
+    return ProtobufEncoder(message_type=resolve_message_type(message_type))
+
+
+def _json_encoder(message_type: Optional[str]) -> Encoder:
+    from make87.encodings.json_ import JsonEncoder
+
+    return JsonEncoder()
+
+
+def _yaml_encoder(message_type: Optional[str]) -> Encoder:
+    from make87.encodings.yaml_ import YamlEncoder
+
+    return YamlEncoder()
+
+
+def _msgpack_encoder(message_type: Optional[str]) -> Encoder:
+    from make87.encodings.msgpack_ import MsgpackEncoder
+
+    return MsgpackEncoder()
+
+
+def _cbor_encoder(message_type: Optional[str]) -> Encoder:
+    from make87.encodings.cbor import CborEncoder
+
+    return CborEncoder()
+
+
+register_encoding("protobuf", _protobuf_encoder, aliases=("proto", "application/protobuf"))
+register_encoding("json", _json_encoder, aliases=("application/json",))
+register_encoding("yaml", _yaml_encoder, aliases=("yml", "application/yaml"))
+register_encoding("msgpack", _msgpack_encoder, aliases=("application/msgpack", "application/x-msgpack"))
+register_encoding("cbor", _cbor_encoder, aliases=("application/cbor",))
@@ -2,17 +2,25 @@
 
 This module provides a YAML-based encoder that converts Python objects
 to UTF-8 encoded YAML bytes and vice versa, with support for custom
-loaders and dumpers. Falls back to an import error if PyYAML is not installed.
+loaders and dumpers. When PyYAML is built with libyaml, the C-accelerated
+safe loader and dumper are used by default. Falls back to an import error
+if PyYAML is not installed.
 """
 
 try:
+    import re
     import yaml
-    from typing import Optional, TypeVar
+    from typing import Iterable, List, Optional, TypeVar
 
-    from make87.encodings.base import Encoder
+    from make87.encodings.base import Buffer, Encoder, unwrap_buffer
 
     T = TypeVar("T")
 
+    LIBYAML_AVAILABLE: bool = bool(getattr(yaml, "__with_libyaml__", False))  # Whether PyYAML was built with libyaml
+
+    # Document markers and directives, which would shift the document boundaries of a joined stream
+    _DOCUMENT_SYNTAX = re.compile(rb"^(?:(?:---|\.\.\.)(?:[ \t\r\n]|$)|%)", re.MULTILINE)
+
     class YamlEncoder(Encoder[T]):
         """YAML encoder for Python objects.
 
@@ -25,27 +33,54 @@ try:
             dumper: YAML dumper class used for serialization
         """
 
-        def __init__(self, *, loader: Optional[type] = None, dumper: Optional[type] = None) -> None:
+        def __init__(
+            self,
+            *,
+            loader: Optional[type] = None,
+            dumper: Optional[type] = None,
+            use_libyaml: Optional[bool] = None,
+        ) -> None:
             """Initialize the YAML encoder with optional custom loader and dumper.
 
             Args:
                 loader: Custom YAML loader class for deserialization.
-                    Defaults to yaml.SafeLoader for security.
+                    Defaults to yaml.CSafeLoader if libyaml is available,
+                    otherwise yaml.SafeLoader.
                 dumper: Custom YAML dumper class for serialization.
-                    Defaults to yaml.SafeDumper for security.
+                    Defaults to yaml.CSafeDumper if libyaml is available,
+                    otherwise yaml.SafeDumper.
+                use_libyaml: Whether the default loader and dumper use the
+                    libyaml C implementation. Defaults to None, which uses
+                    libyaml whenever it is available. Ignored for an explicitly
+                    passed loader or dumper.
+
+            Raises:
+                ValueError: If use_libyaml is True but PyYAML was built without libyaml
 
             Example:
                 >>> # Simple encoder with safe defaults
                 >>> encoder = YamlEncoder()
                 >>>
+                >>> # Force the pure-Python implementation
+                >>> encoder = YamlEncoder(use_libyaml=False)
+                >>>
                 >>> # With custom loader/dumper
                 >>> encoder = YamlEncoder(
                 ...     loader=yaml.FullLoader,
                 ...     dumper=yaml.SafeDumper
                 ... )
             """
-            self.loader = loader or yaml.SafeLoader
-            self.dumper = dumper or yaml.SafeDumper
+            if use_libyaml is None:
+                use_libyaml = LIBYAML_AVAILABLE
+            elif use_libyaml and not LIBYAML_AVAILABLE:
+                raise ValueError("PyYAML was built without libyaml, C loader and dumper are not available.")
+
+            if use_libyaml:
+                self.loader = loader or yaml.CSafeLoader
+                self.dumper = dumper or yaml.CSafeDumper
+            else:
+                self.loader = loader or yaml.SafeLoader
+                self.dumper = dumper or yaml.SafeDumper
 
         def encode(self, obj: T) -> bytes:
             """Serialize a Python object to UTF-8 encoded YAML bytes.
@@ -72,13 +107,16 @@ try:
                 key: value
             """
             try:
-                return yaml.dump(obj, Dumper=self.dumper).encode("utf-8")
+                return yaml.dump(obj, Dumper=self.dumper, encoding="utf-8")
             except Exception as e:
                 raise ValueError(f"YAML encoding failed: {e}")
 
         def decode(self, data: bytes) -> T:
             """Deserialize UTF-8 encoded YAML bytes to a Python object.
 
+            Bytes are handed to the parser as-is, without decoding them to
+            a str first.
+
             Args:
                 data: UTF-8 encoded YAML bytes to deserialize
 
@@ -96,11 +134,78 @@ try:
                 >>> print(decoded)
                 {'key': 'value', 'items': [1, 2, 3]}
             """
+            return self.decode_from(data)
+
+        def decode_from(self, data: Buffer) -> T:
+            """Deserialize UTF-8 encoded YAML from any bytes-like buffer.
+
+            Bytes, and memoryviews spanning a bytes object, are parsed
+            directly. Other buffers are copied into bytes once, as PyYAML
+            only reads str, bytes or file objects.
+
+            Args:
+                data: UTF-8 encoded YAML as bytes, bytearray or memoryview
+
+            Returns:
+                The deserialized Python object
+
+            Raises:
+                ValueError: If YAML decoding fails due to invalid YAML data
+                    or encoding issues
+
+            Example:
+                >>> encoder = YamlEncoder()
+                >>> decoded = encoder.decode_from(memoryview(b'key: value\\n'))
+                >>> print(decoded)
+                {'key': 'value'}
+            """
             try:
-                return yaml.load(data.decode("utf-8"), Loader=self.loader)
+                data = unwrap_buffer(data)
+                if not isinstance(data, (bytes, str)):
+                    data = bytes(data)
+                return yaml.load(data, Loader=self.loader)
             except Exception as e:
                 raise ValueError(f"YAML decoding failed: {e}")
 
+        def decode_many(self, buffers: Iterable[Buffer]) -> List[T]:
+            """Deserialize a batch of UTF-8 encoded YAML payloads.
+
+            Payloads without document markers or directives of their own are
+            joined into one multi-document stream and parsed by a single
+            loader; the document separators between them end any value left
+            open by a malformed payload, so every document comes from exactly
+            one payload. If any payload has its own markers or directives, or
+            the stream does not parse, every payload is decoded on its own so
+            that errors point at the offending payload.
+
+            Args:
+                buffers: UTF-8 encoded YAML payloads, each holding one document
+
+            Returns:
+                One deserialized object per payload, in input order
+
+            Raises:
+                ValueError: If YAML decoding fails for any payload
+
+            Example:
+                >>> encoder = YamlEncoder()
+                >>> encoder.decode_many([b'a: 1\\n', b'- 2\\n'])
+                [{'a': 1}, [2]]
+            """
+            buffers = list(buffers)
+            if not buffers:
+                return []
+
+            if not any(_DOCUMENT_SYNTAX.search(data) for data in buffers):
+                try:
+                    documents = list(yaml.load_all(b"\n---\n".join(buffers), Loader=self.loader))
+                    if len(documents) == len(buffers):
+                        return documents
+                except Exception:
+                    pass
+
+            return [self.decode_from(data) for data in buffers]
+
 except ImportError:
 
     def _raise_yaml_import_error(*args, **kwargs):
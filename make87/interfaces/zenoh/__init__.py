@@ -1,4 +1,6 @@
 from make87.interfaces.zenoh.interface import ZenohInterface
+from make87.interfaces.zenoh.aio import AioQueryable, AioSubscriber
+from make87.interfaces.zenoh.typed import TypedPublisher, TypedSubscriber
 from make87.interfaces.zenoh.model import (
     Priority,
     Reliability,
@@ -10,10 +12,18 @@ from make87.interfaces.zenoh.model import (
     ZenohPublisherConfig,
     ZenohQuerierConfig,
     ZenohQueryableConfig,
+    BatchingConfig,
+    ShmConfig,
 )
+from make87.interfaces.zenoh.batching import Batcher, iter_payloads
+from make87.interfaces.zenoh.shm import is_shm
 
 __all__ = [
     "ZenohInterface",
+    "TypedPublisher",
+    "TypedSubscriber",
+    "AioSubscriber",
+    "AioQueryable",
     "Priority",
     "Reliability",
     "CongestionControl",
@@ -24,4 +34,9 @@ __all__ = [
     "ZenohPublisherConfig",
     "ZenohQuerierConfig",
     "ZenohQueryableConfig",
+    "BatchingConfig",
+    "Batcher",
+    "iter_payloads",
+    "ShmConfig",
+    "is_shm",
 ]
@@ -0,0 +1,264 @@
+"""asyncio support for Zenoh subscribers, queryables and queries.
+
+Zenoh delivers samples, queries and replies on its own threads. This
+module hands them over to an asyncio event loop without a thread hop per
+message: items are buffered as they arrive, and the loop is woken with a
+single `call_soon_threadsafe` per batch of items that arrive before it
+gets to run.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Generic, List, Optional, TypeVar
+
+import zenoh
+
+from make87.interfaces.zenoh.model import HandlerChannel, RingChannel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_CAPACITY = 256
+
+# Missing from older eclipse-zenoh releases; there, cancelled queries run to completion and their replies are dropped.
+_CancellationToken = getattr(zenoh, "CancellationToken", None)
+
+
+class _LoopBridge(Generic[T]):
+    """Bounded buffer filled from any thread and drained on an event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, channel: Optional[HandlerChannel]) -> None:
+        self.capacity = channel.capacity if channel is not None else DEFAULT_CAPACITY
+        self.dropped = 0
+        self._drop_oldest = isinstance(channel, RingChannel)
+        self._loop = loop
+        self._items: Deque[T] = deque()
+        self._lock = threading.Lock()
+        self._wakeup_scheduled = False
+        self._waiter: Optional[asyncio.Future] = None
+        self._closed = False
+
+    def put(self, item: T) -> None:
+        """Buffer an item, waking the loop unless a wakeup is already pending. Called from Zenoh threads."""
+        with self._lock:
+            if len(self._items) >= self.capacity:
+                self.dropped += 1
+                if not self._drop_oldest:
+                    return
+                self._items.popleft()
+            self._items.append(item)
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            pass  # the loop is closed; nobody is waiting any more
+
+    def close(self) -> None:
+        """Stop the iteration once the buffered items are consumed. Called on the loop."""
+        with self._lock:
+            self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        with self._lock:
+            self._wakeup_scheduled = False
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def get(self) -> T:
+        """Take the oldest item, waiting for one if the buffer is empty.
+
+        Raises:
+            StopAsyncIteration: If the bridge is closed and empty
+        """
+        while True:
+            with self._lock:
+                if self._items:
+                    return self._items.popleft()
+                if self._closed:
+                    raise StopAsyncIteration
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+
+class _AioReceiver(Generic[T]):
+    """Async iterator over the items a Zenoh entity receives through a callback."""
+
+    def __init__(self, declare: Callable[[Callable[[T], None]], Any], channel: Optional[HandlerChannel] = None) -> None:
+        self._bridge: _LoopBridge[T] = _LoopBridge(asyncio.get_running_loop(), channel)
+        self._entity = declare(self._bridge.put)
+
+    @property
+    def capacity(self) -> int:
+        """Get the maximum number of items buffered for the loop."""
+        return self._bridge.capacity
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of items dropped because the buffer was full."""
+        return self._bridge.dropped
+
+    def close(self) -> None:
+        """Undeclare the Zenoh entity. Iteration stops once the buffered items are consumed."""
+        self._entity.undeclare()
+        self._bridge.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._bridge.get()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AioSubscriber(_AioReceiver[zenoh.Sample]):
+    """Zenoh subscriber yielding samples in an `async for` loop.
+
+    Samples are buffered until the loop consumes them. The buffer holds at
+    most `capacity` samples; like the channels of `get_subscriber`, a FIFO
+    channel drops new samples while it is full, and a ring channel drops
+    the oldest buffered sample to make room.
+    """
+
+    def __init__(self, session: zenoh.Session, key_expr: str, channel: Optional[HandlerChannel] = None) -> None:
+        """Declare the subscriber. Must be called with a running event loop.
+
+        Args:
+            session: The Zenoh session to subscribe with
+            key_expr: The key expression to subscribe to
+            channel: Channel configuration bounding the sample buffer.
+                Defaults to None, which uses a FIFO channel with a capacity
+                of 256, like Zenoh's default handler.
+
+        Raises:
+            RuntimeError: If no event loop is running
+
+        Example:
+            >>> async with AioSubscriber(session, "sensors/**") as subscriber:
+            ...     async for sample in subscriber:
+            ...         print(sample.payload.to_bytes())
+        """
+        super().__init__(lambda callback: session.declare_subscriber(key_expr, callback), channel)
+
+
+class AioQueryable(_AioReceiver[zenoh.Query]):
+    """Zenoh queryable yielding queries in an `async for` loop.
+
+    Queries are buffered like the samples of `AioSubscriber`. A query is
+    answered once it is dropped, so reply to it and call `query.drop()`, or
+    let `serve` do so.
+    """
+
+    def __init__(self, session: zenoh.Session, key_expr: str, channel: Optional[HandlerChannel] = None) -> None:
+        """Declare the queryable. Must be called with a running event loop.
+
+        Args:
+            session: The Zenoh session to declare the queryable with
+            key_expr: The key expression to serve
+            channel: Channel configuration bounding the query buffer.
+                Defaults to None, which uses a FIFO channel with a capacity
+                of 256, like Zenoh's default handler.
+
+        Raises:
+            RuntimeError: If no event loop is running
+        """
+        super().__init__(lambda callback: session.declare_queryable(key_expr, callback), channel)
+
+    async def serve(self, handler: Callable[[zenoh.Query], Awaitable[Any]]) -> None:
+        """Serve queries until the queryable is closed or the serving task is cancelled.
+
+        Every query is handled in its own task, so a handler waiting on I/O
+        does not hold up other queries. The query is dropped, which finalizes
+        it, when its handler returns. Handler errors are logged.
+
+        Args:
+            handler: Coroutine function replying to a query, e.g. with `query.reply(...)`
+
+        Example:
+            >>> async def handle(query):
+            ...     result = await lookup(query.payload.to_bytes())
+            ...     query.reply(query.key_expr, result)
+            >>> await AioQueryable(session, "api/lookup").serve(handle)
+        """
+        tasks = set()
+        try:
+            async for query in self:
+                task = asyncio.ensure_future(_answer(handler, query))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def _answer(handler: Callable[[zenoh.Query], Awaitable[Any]], query: zenoh.Query) -> None:
+    try:
+        await handler(query)
+    except Exception:
+        logger.exception("AioQueryable handler failed")
+    finally:
+        query.drop()
+
+
+async def query(session: zenoh.Session, selector: str, **kwargs: Any) -> List[zenoh.Reply]:
+    """Send a query and wait for all of its replies without blocking the event loop.
+
+    Replies are collected on Zenoh's threads, and the loop is woken once,
+    when the query is complete. Cancelling the awaiting task cancels the query
+    on eclipse-zenoh releases providing `zenoh.CancellationToken`.
+
+    Args:
+        session: The Zenoh session to query with
+        selector: The selector to query
+        **kwargs: Further arguments of `zenoh.Session.get`, e.g. `payload`,
+            `timeout` (in seconds) or `priority`
+
+    Returns:
+        The replies, in the order they were received
+
+    Example:
+        >>> replies = await query(session, "api/lookup", payload=b"key", timeout=2.0)
+        >>> results = [reply.ok.payload.to_bytes() for reply in replies if reply.ok is not None]
+    """
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    replies: List[zenoh.Reply] = []
+
+    def on_done() -> None:
+        try:
+            loop.call_soon_threadsafe(_resolve, done, replies)
+        except RuntimeError:
+            pass  # the loop is closed; nobody is waiting any more
+
+    handler = zenoh.handlers.Callback(replies.append, on_done)
+    if _CancellationToken is None:
+        session.get(selector, handler, **kwargs)
+        return await done
+    token = _CancellationToken()
+    session.get(selector, handler, cancellation_token=token, **kwargs)
+    try:
+        return await done
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
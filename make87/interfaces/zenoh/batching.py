@@ -0,0 +1,175 @@
+"""Micro-batching of small messages into framed Zenoh payloads.
+
+Publishing many small messages costs one Zenoh put each. `Batcher`
+coalesces messages into one payload in the varint length-delimited format
+of `make87.encodings.framing` and publishes it as soon as the batch is
+full or its oldest message has waited long enough. Batched payloads carry
+the `BATCH_ATTACHMENT` attachment, so subscribers can tell them apart from
+single messages and split them with `iter_payloads`.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Iterator, List, Optional
+
+import zenoh
+
+from make87.encodings.base import Buffer
+from make87.encodings.framing import frame, iter_frames
+from make87.interfaces.zenoh.model import BatchingConfig
+
+logger = logging.getLogger(__name__)
+
+BATCH_ATTACHMENT = b"make87:batch"
+
+
+def is_batch(sample: zenoh.Sample) -> bool:
+    """Check whether a sample holds a batch of messages.
+
+    Args:
+        sample: A received Zenoh sample
+
+    Returns:
+        True if the sample was published by a `Batcher` holding several messages
+    """
+    attachment = sample.attachment
+    return attachment is not None and attachment.to_bytes() == BATCH_ATTACHMENT
+
+
+def iter_payloads(sample: zenoh.Sample) -> Iterator[Buffer]:
+    """Iterate over the message payloads of a sample, splitting batches.
+
+    Args:
+        sample: A received Zenoh sample, batched or not
+
+    Yields:
+        The payload of every message in the sample, as memoryview slices of
+        the sample payload for batches
+
+    Raises:
+        ValueError: If a batch is truncated
+
+    Example:
+        >>> def handle(sample):
+        ...     for payload in iter_payloads(sample):
+        ...         print(encoder.decode_from(payload))
+        >>> subscriber = interface.get_subscriber("input_topic", handle)
+    """
+    data = sample.payload.to_bytes()
+    if is_batch(sample):
+        yield from iter_frames(data)
+    else:
+        yield data
+
+
+class Batcher:
+    """Coalesces payloads and publishes them in batches.
+
+    A batch is published once it holds `max_messages` messages or
+    `max_bytes` bytes, or `linger_ms` after its first message was added,
+    whichever comes first. Batches are published in order. A batch holding
+    a single message is published as is, without framing or attachment.
+
+    Attributes:
+        config: The batching limits
+        batches: Number of payloads published
+        messages: Number of messages published
+    """
+
+    def __init__(self, put: Callable[..., None], config: BatchingConfig) -> None:
+        """Initialize the batcher.
+
+        Args:
+            put: Publishes a payload, called with the payload and an optional
+                `attachment` keyword argument, e.g. `zenoh.Publisher.put`
+            config: The batching limits
+
+        Example:
+            >>> batcher = Batcher(publisher.put, BatchingConfig(max_messages=32, linger_ms=2))
+            >>> for reading in readings:
+            ...     batcher.add(encoder.encode(reading))
+            >>> batcher.close()
+        """
+        self.config = config
+        self.batches = 0
+        self.messages = 0
+        self._put = put
+        self._max_messages = config.max_messages
+        self._max_bytes = config.max_bytes
+        self._linger = config.linger_ms / 1000
+        self._payloads: List[Buffer] = []
+        self._size = 0
+        self._deadline: Optional[float] = None
+        self._lock = threading.Lock()
+        self._linger_changed = threading.Condition(self._lock)
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, payload: Buffer) -> None:
+        """Add a payload to the current batch, publishing the batch if it is full.
+
+        Args:
+            payload: The encoded message. It must not be modified until the
+                batch is published.
+
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Batcher is closed")
+            self._payloads.append(payload)
+            self._size += len(payload)
+            if len(self._payloads) >= self._max_messages or self._size >= self._max_bytes:
+                self._flush_locked()
+            elif self._deadline is None:
+                self._deadline = time.monotonic() + self._linger
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._linger_loop, name="Batcher", daemon=True)
+                    self._thread.start()
+                self._linger_changed.notify()
+
+    def flush(self) -> None:
+        """Publish the current batch right away, if it holds any messages."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Publish the current batch and stop the linger timer."""
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
+            self._linger_changed.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _flush_locked(self) -> None:
+        # Publishing under the lock keeps batches in order across the caller and the linger thread.
+        payloads = self._payloads
+        self._deadline = None
+        if not payloads:
+            return
+        self._payloads = []
+        self._size = 0
+        if len(payloads) == 1:
+            self._put(payloads[0])
+        else:
+            self._put(frame(payloads), attachment=BATCH_ATTACHMENT)
+        self.batches += 1
+        self.messages += len(payloads)
+
+    def _linger_loop(self) -> None:
+        with self._lock:
+            while not self._closed:
+                if self._deadline is None:
+                    self._linger_changed.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._linger_changed.wait(remaining)
+                    continue
+                try:
+                    self._flush_locked()
+                except Exception:
+                    logger.exception("Batcher failed to publish a batch")
@@ -7,11 +7,18 @@ subscribers, queriers, and queryables with configurable QoS settings.
 
 import json
 import logging
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, List, Optional, TypeVar, Union
 import zenoh
 import socket
+import tempfile
 from functools import cached_property
+from make87.encodings.base import Encoder
+from make87.encodings.registry import get_encoder
 from make87.interfaces.base import InterfaceBase
+from make87.internal.models.application_env_config import AccessPoint
+from make87.interfaces.zenoh import aio
+from make87.interfaces.zenoh.session_pool import acquire_session, is_pooled, release_session
+from make87.interfaces.zenoh.typed import TypedPublisher, TypedSubscriber
 from make87.interfaces.zenoh.model import (
     ZenohPublisherConfig,
     ZenohSubscriberConfig,
@@ -21,6 +28,10 @@ from make87.interfaces.zenoh.model import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+LISTEN_PORT = 7447
+
 
 class ZenohInterface(InterfaceBase):
     """Concrete Zenoh implementation of the make87 messaging interface.
@@ -49,32 +60,74 @@ class ZenohInterface(InterfaceBase):
 
         Note:
             The configuration automatically sets up:
-            - Listen endpoints on port 7447 if available
-            - Connect endpoints based on configured peers
+            - Listen endpoints on port 7447 if available, over TCP on all
+              interfaces and over a Unix socket for processes on the same node
+            - Connect endpoints based on configured peers: peers on the same
+              node are tried over the Unix socket and loopback listener of
+              port 7447 first, unless this process holds that listener
+              itself, and over the VPN last; remote peers over the VPN
+            - Shared memory if a peer runs on the same node or a publisher
+              is configured to publish from shared memory
         """
+        cfg = self._build_zenoh_config(listen=True)
+        # A session of this process sharing the configuration may be the one holding the port.
+        if is_port_in_use(LISTEN_PORT) and not is_pooled(cfg):
+            cfg = self._build_zenoh_config(listen=False)
+        return cfg
+
+    def _build_zenoh_config(self, listen: bool) -> zenoh.Config:
         cfg = zenoh.Config()
 
-        if not is_port_in_use(7447):
-            cfg.insert_json5("listen/endpoints", json.dumps(["tcp/0.0.0.0:7447"]))
+        if listen:
+            cfg.insert_json5("listen/endpoints", json.dumps(listen_endpoints(LISTEN_PORT)))
 
-        endpoints = {
-            f"tcp/{x.vpn_ip}:{x.vpn_port}"
-            for x in list(self.interface_config.requesters.values()) + list(self.interface_config.subscribers.values())
-        }
+        peers = list(self.interface_config.requesters.values()) + list(self.interface_config.subscribers.values())
+        # Ordered and deduplicated, so Zenoh tries the fastest link to a peer first.
+        # While this process listens on the local endpoints itself, dialing them would only reach itself.
+        endpoints = dict.fromkeys(endpoint for x in peers for endpoint in peer_endpoints(x, local=not listen))
         cfg.insert_json5("connect/endpoints", json.dumps(list(endpoints)))
+
+        # Zenoh only exchanges shared memory with peers on the same host, whatever the link they connect over.
+        if any(x.same_node for x in peers) or any(
+            ZenohPublisherConfig.model_validate(x.model_extra).shm is not None
+            for x in self.interface_config.publishers.values()
+        ):
+            cfg.insert_json5("transport/shared_memory/enabled", json.dumps(True))
         return cfg
 
     @cached_property
     def session(self) -> zenoh.Session:
         """Get or create the Zenoh session.
 
-        Lazily creates and caches a Zenoh session using the configured
-        Zenoh configuration.
+        Lazily acquires a Zenoh session for the configured Zenoh
+        configuration from the process-wide session pool, so interfaces
+        with the same configuration share one session, with one set of
+        transports and listening sockets. The session is closed when the
+        last interface sharing it is closed.
 
         Returns:
             Active zenoh.Session instance for communication
         """
-        return zenoh.open(self.zenoh_config)
+        return acquire_session(self.zenoh_config)
+
+    def close(self) -> None:
+        """Release the interface's Zenoh session, closing it unless other interfaces share it.
+
+        Accessing `session` afterwards acquires a session again.
+
+        Example:
+            >>> with ZenohInterface(name="zenoh") as interface:
+            ...     interface.get_publisher("HELLO_WORLD_MESSAGE").put(b"hello")
+        """
+        session = self.__dict__.pop("session", None)
+        if session is not None:
+            release_session(session)
+
+    def __enter__(self) -> "ZenohInterface":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def get_publisher(self, name: str) -> zenoh.Publisher:
         """Create a Zenoh publisher for the specified interface name.
@@ -106,6 +159,40 @@ class ZenohInterface(InterfaceBase):
             reliability=qos_config.reliability.to_zenoh() if qos_config.reliability else None,
         )
 
+    def get_typed_publisher(self, name: str, encoder: Optional[Encoder[T]] = None) -> TypedPublisher[T]:
+        """Create a publisher that encodes objects before publishing them.
+
+        Args:
+            name: The name of the publisher interface as defined in configuration
+            encoder: Encoder serializing published objects. Defaults to None,
+                which uses the shared encoder for the `encoding` and
+                `message_type` of the topic configuration.
+
+        Returns:
+            TypedPublisher wrapping a publisher configured like `get_publisher`
+
+        Raises:
+            ValueError: If no encoder is given and none can be created from
+                the topic configuration
+
+        Note:
+            If the publisher configuration enables batching, messages are
+            coalesced into batches, which typed subscribers split again.
+            Call `flush()` or `undeclare()` to publish a pending batch. If it
+            enables shared memory, large payloads are published from a
+            shared-memory pool to subscribers on the same host.
+
+        Example:
+            >>> interface = ZenohInterface("my_interface")
+            >>> publisher = interface.get_typed_publisher("HELLO_WORLD_MESSAGE")
+            >>> publisher.put(PlainText(header=header, body="Hello, World!"))
+        """
+        iface_config = self.get_interface_type_by_name(name=name, iface_type="PUB")
+        qos_config = ZenohPublisherConfig.model_validate(iface_config.model_extra)
+        if encoder is None:
+            encoder = get_encoder(iface_config.encoding, iface_config.message_type)
+        return TypedPublisher(self.get_publisher(name), encoder, batching=qos_config.batching, shm=qos_config.shm)
+
     def get_subscriber(
         self,
         name: str,
@@ -148,6 +235,64 @@ class ZenohInterface(InterfaceBase):
             handler=handler,
         )
 
+    def get_typed_subscriber(
+        self,
+        name: str,
+        handler: Callable[[T], Any],
+        encoder: Optional[Encoder[T]] = None,
+        workers: int = 1,
+        ordered: bool = True,
+        processes: bool = False,
+    ) -> TypedSubscriber[T]:
+        """Create a subscriber that decodes samples on a worker pool and hands the objects to a handler.
+
+        Args:
+            name: The name of the subscriber interface as defined in configuration
+            handler: Called with every decoded object
+            encoder: Encoder deserializing received payloads. Defaults to None,
+                which uses the shared encoder for the `encoding` and
+                `message_type` of the topic configuration.
+            workers: Number of samples decoded concurrently. Defaults to 1.
+            ordered: Whether samples of the same key are handled in the order
+                they were received. Defaults to True.
+            processes: Whether to decode in worker processes instead of
+                threads, for CPU-heavy decoding. The encoder must then be
+                picklable. Defaults to False.
+
+        Returns:
+            TypedSubscriber receiving on the configured topic key
+
+        Raises:
+            ValueError: If no encoder is given and none can be created from
+                the topic configuration
+
+        Note:
+            The channel handler of the subscriber configuration bounds the
+            queue of samples waiting to be decoded: a FIFO channel drops new
+            samples while it is full, a ring channel drops the oldest ones.
+
+        Example:
+            >>> interface = ZenohInterface("my_interface")
+            >>> def handle_config(config):
+            ...     print(f"Received: {config}")
+            >>> subscriber = interface.get_typed_subscriber("config_topic", handle_config, workers=4)
+        """
+        iface_config = self.get_interface_type_by_name(name=name, iface_type="SUB")
+        qos_config = ZenohSubscriberConfig.model_validate(iface_config.model_extra)
+        if encoder is None:
+            encoder = get_encoder(iface_config.encoding, iface_config.message_type)
+
+        return TypedSubscriber(
+            self.session,
+            iface_config.topic_key,
+            encoder,
+            handler,
+            workers=workers,
+            ordered=ordered,
+            processes=processes,
+            channel=qos_config.handler,
+        )
+
     def get_querier(
         self,
         name: str,
@@ -224,6 +369,167 @@ class ZenohInterface(InterfaceBase):
             handler=handler,
         )
 
+    def aio_subscriber(self, name: str) -> aio.AioSubscriber:
+        """Create a subscriber yielding samples in an `async for` loop.
+
+        Must be called from a coroutine, i.e. with a running event loop.
+
+        Args:
+            name: The name of the subscriber interface as defined in configuration
+
+        Returns:
+            AioSubscriber receiving on the configured topic key
+
+        Note:
+            The channel handler of the subscriber configuration bounds the
+            number of samples buffered for the event loop.
+
+        Example:
+            >>> interface = ZenohInterface("my_interface")
+            >>> async for sample in interface.aio_subscriber("input_topic"):
+            ...     print(f"Received: {sample.payload.to_bytes()}")
+        """
+        iface_config = self.get_interface_type_by_name(name=name, iface_type="SUB")
+        qos_config = ZenohSubscriberConfig.model_validate(iface_config.model_extra)
+
+        return aio.AioSubscriber(self.session, iface_config.topic_key, channel=qos_config.handler)
+
+    def aio_queryable(self, name: str) -> aio.AioQueryable:
+        """Create a queryable yielding queries in an `async for` loop.
+
+        Must be called from a coroutine, i.e. with a running event loop.
+
+        Args:
+            name: The name of the queryable interface as defined in configuration
+
+        Returns:
+            AioQueryable serving the configured endpoint key
+
+        Note:
+            The channel handler of the queryable configuration bounds the
+            number of queries buffered for the event loop.
+
+        Example:
+            >>> interface = ZenohInterface("my_interface")
+            >>> async def handle_query(query):
+            ...     query.reply(query.key_expr, "response data")
+            >>> await interface.aio_queryable("api_server").serve(handle_query)
+        """
+        iface_config = self.get_interface_type_by_name(name=name, iface_type="PRV")
+        qos_config = ZenohQueryableConfig.model_validate(iface_config.model_extra)
+
+        return aio.AioQueryable(self.session, iface_config.endpoint_key, channel=qos_config.handler)
+
+    async def aio_query(
+        self, name: str, payload: Optional[Union[bytes, bytearray, str]] = None, timeout: Optional[float] = None
+    ) -> List[zenoh.Reply]:
+        """Query the endpoint of a querier interface and wait for all replies.
+
+        Args:
+            name: The name of the querier interface as defined in configuration
+            payload: Optional query payload
+            timeout: Maximum time to wait for replies, in seconds. Defaults to
+                None, which uses Zenoh's default query timeout.
+
+        Returns:
+            The replies, in the order they were received
+
+        Note:
+            The query is sent with the QoS settings of the querier configuration.
+
+        Example:
+            >>> interface = ZenohInterface("my_interface")
+            >>> replies = await interface.aio_query("api_client", b"request", timeout=2.0)
+        """
+        iface_config = self.get_interface_type_by_name(name=name, iface_type="REQ")
+        qos_config = ZenohQuerierConfig.model_validate(iface_config.model_extra)
+
+        return await aio.query(
+            self.session,
+            iface_config.endpoint_key,
+            payload=payload,
+            timeout=timeout,
+            congestion_control=qos_config.congestion_control.to_zenoh() if qos_config.congestion_control else None,
+            priority=qos_config.priority.to_zenoh() if qos_config.priority else None,
+            express=qos_config.express,
+        )
+
+
+def unixsock_endpoint(port: int) -> str:
+    """Get the Unix socket endpoint of a Zenoh peer listening on a port.
+
+    The socket path is derived from the port, so peers on the same node find
+    each other's socket without further configuration.
+
+    Args:
+        port: The TCP port the peer listens on
+
+    Returns:
+        The Zenoh endpoint of the peer's Unix socket
+
+    Example:
+        >>> unixsock_endpoint(7447)
+        'unixsock-stream//tmp/make87-zenoh-7447.sock'
+    """
+    return f"unixsock-stream/{tempfile.gettempdir()}/make87-zenoh-{port}.sock"
+
+
+def listen_endpoints(port: int) -> List[str]:
+    """Get the endpoints a Zenoh peer listens on.
+
+    Args:
+        port: The TCP port to listen on
+
+    Returns:
+        A TCP endpoint on all interfaces, which covers both the VPN and the
+        loopback interface, followed by a Unix socket endpoint where Unix
+        sockets are supported
+
+    Example:
+        >>> listen_endpoints(7447)
+        ['tcp/0.0.0.0:7447', 'unixsock-stream//tmp/make87-zenoh-7447.sock']
+    """
+    endpoints = [f"tcp/0.0.0.0:{port}"]
+    if hasattr(socket, "AF_UNIX"):
+        endpoints.append(unixsock_endpoint(port))
+    return endpoints
+
+
+def peer_endpoints(peer: AccessPoint, local: bool = True) -> List[str]:
+    """Get the endpoints to connect to a Zenoh peer over, fastest first.
+
+    A peer's `vpn_port` is the port it is reachable at over the VPN, which
+    need not be the port it listens on. Peers on the same node that share
+    this process's network namespace and temporary directory listen on
+    `LISTEN_PORT`, so they are tried over the Unix socket and loopback
+    listener of that port first, which keeps local traffic off the VPN.
+    As same-node apps usually run in separate containers that share
+    neither, the VPN address is always tried last. Remote peers are only
+    reached over their VPN address.
+
+    Args:
+        peer: The peer's access point
+        local: Whether to try the local endpoints of same-node peers.
+            Defaults to True. Pass False while this process listens on
+            `LISTEN_PORT` itself, as the local endpoints then lead back to it.
+
+    Returns:
+        The Zenoh endpoints of the peer
+
+    Example:
+        >>> peer_endpoints(AccessPoint(vpn_ip="10.0.0.5", vpn_port=9000, same_node=False, ...))
+        ['tcp/10.0.0.5:9000']
+        >>> peer_endpoints(AccessPoint(vpn_ip="10.0.0.5", vpn_port=9000, same_node=True, ...))
+        ['unixsock-stream//tmp/make87-zenoh-7447.sock', 'tcp/127.0.0.1:7447', 'tcp/10.0.0.5:9000']
+    """
+    vpn_endpoint = f"tcp/{peer.vpn_ip}:{peer.vpn_port}"
+    if not peer.same_node or not local:
+        return [vpn_endpoint]
+    endpoints = [f"tcp/127.0.0.1:{LISTEN_PORT}", vpn_endpoint]
+    if hasattr(socket, "AF_UNIX"):
+        endpoints.insert(0, unixsock_endpoint(LISTEN_PORT))
+    return endpoints
+
 
 def is_port_in_use(port: int, host: str = "0.0.0.0") -> bool:
     """Check if a network port is currently in use.
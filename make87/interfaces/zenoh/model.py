@@ -207,6 +207,39 @@ class ZenohSubscriberConfig(BaseModel):
     handler: Optional[HandlerChannel] = None
 
 
+class BatchingConfig(BaseModel):
+    """Micro-batching configuration for Zenoh publishers.
+
+    Messages are coalesced into one framed payload, which is published as
+    soon as any of the limits is reached.
+
+    Attributes:
+        max_messages: Maximum number of messages per batch
+        max_bytes: Maximum total size of the batched messages in bytes
+        linger_ms: Maximum time a message waits for its batch to fill, in milliseconds
+    """
+
+    max_messages: int = 64
+    max_bytes: int = 64 * 1024
+    linger_ms: float = 5.0
+
+
+class ShmConfig(BaseModel):
+    """Shared-memory configuration for Zenoh publishers.
+
+    Payloads of at least `threshold` bytes are written to a shared-memory
+    pool. Subscribers on the same host read them from the pool, while
+    remote subscribers receive them over the network as usual.
+
+    Attributes:
+        pool_size: Size of the shared-memory pool in bytes
+        threshold: Minimum payload size in bytes for publishing through shared memory
+    """
+
+    pool_size: int = 256 * 1024 * 1024
+    threshold: int = 64 * 1024
+
+
 class ZenohPublisherConfig(BaseModel):
     """Configuration for Zenoh publishers.
 
@@ -215,12 +248,16 @@ class ZenohPublisherConfig(BaseModel):
         priority: Message priority level
         express: Whether to use express delivery (bypass some routing)
         reliability: Message delivery reliability mode
+        batching: Optional micro-batching of published messages
+        shm: Optional shared-memory publishing for subscribers on the same host
     """
 
     congestion_control: Optional[CongestionControl] = None
     priority: Optional[Priority] = None
     express: Optional[bool] = None
     reliability: Optional[Reliability] = None
+    batching: Optional[BatchingConfig] = None
+    shm: Optional[ShmConfig] = None
 
 
 class ZenohQuerierConfig(BaseModel):
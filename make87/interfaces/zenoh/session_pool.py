@@ -0,0 +1,98 @@
+"""Process-wide pool of Zenoh sessions shared between interfaces.
+
+Every Zenoh session opens its own transports to its peers and, when it
+listens, its own listening sockets. `acquire_session` hands out one shared
+session per distinct configuration instead, counting how many users hold
+it, and `release_session` closes it when its last user releases it.
+"""
+
+import threading
+from typing import Dict
+
+import zenoh
+
+
+class _PooledSession:
+    """A shared session and the number of users holding it."""
+
+    __slots__ = ("key", "session", "refs")
+
+    def __init__(self, key: str, session: zenoh.Session) -> None:
+        self.key = key
+        self.session = session
+        self.refs = 1
+
+
+_sessions: Dict[str, _PooledSession] = {}
+_by_id: Dict[int, _PooledSession] = {}
+_lock = threading.Lock()
+
+
+def acquire_session(config: zenoh.Config) -> zenoh.Session:
+    """Get the shared session for a configuration, opening it on first request.
+
+    Sessions are shared between configurations that are equal setting by
+    setting. Every call must be paired with a call to `release_session`.
+
+    Args:
+        config: The Zenoh configuration
+
+    Returns:
+        The open session for the configuration
+
+    Raises:
+        zenoh.ZError: If the session cannot be opened
+
+    Example:
+        >>> session = acquire_session(config)
+        >>> session.put("status", b"ready")
+        >>> release_session(session)
+    """
+    key = str(config)
+    with _lock:
+        entry = _sessions.get(key)
+        if entry is not None and not entry.session.is_closed():
+            entry.refs += 1
+            return entry.session
+        # Opened under the lock, so concurrent callers do not open the same configuration twice.
+        session = zenoh.open(config)
+        if entry is not None:
+            del _by_id[id(entry.session)]
+        entry = _sessions[key] = _PooledSession(key, session)
+        _by_id[id(session)] = entry
+    return session
+
+
+def release_session(session: zenoh.Session) -> None:
+    """Release a session obtained from `acquire_session`, closing it when its last user releases it.
+
+    Releasing a session that is no longer held in the pool, e.g. because
+    it was closed directly and replaced by a new session, does nothing.
+
+    Args:
+        session: The session to release
+    """
+    with _lock:
+        entry = _by_id.get(id(session))
+        if entry is None or entry.session is not session:
+            return
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+        del _by_id[id(session)]
+        del _sessions[entry.key]
+    session.close()
+
+
+def is_pooled(config: zenoh.Config) -> bool:
+    """Check whether an open session for a configuration is held in the pool.
+
+    Args:
+        config: The Zenoh configuration
+
+    Returns:
+        True if `acquire_session` would return an already open session
+    """
+    with _lock:
+        entry = _sessions.get(str(config))
+        return entry is not None and not entry.session.is_closed()
@@ -0,0 +1,116 @@
+"""Shared-memory payloads for Zenoh peers on the same host.
+
+Zenoh exchanges payloads held in shared memory between peers on the same
+host without sending them through the network stack; only a reference to
+the shared-memory chunk travels over the link. This module allocates
+publisher payloads from a shared-memory pool and tells subscribers which
+samples arrived that way.
+
+Shared memory requires Zenoh built with its shared-memory feature, as the
+`eclipse-zenoh` wheels are, and a release providing
+`ShmProvider.default_backend` and `ZBytes.as_shm`.
+"""
+
+import threading
+from typing import Callable, Dict
+
+import zenoh
+
+from make87.encodings.base import Buffer
+from make87.interfaces.zenoh.model import ShmConfig
+
+try:
+    import zenoh.shm as zenoh_shm
+except ImportError:
+    zenoh_shm = None
+else:
+    if not hasattr(zenoh_shm.ShmProvider, "default_backend"):
+        zenoh_shm = None  # older releases expose a different shared-memory API
+
+_as_shm = getattr(zenoh.ZBytes, "as_shm", None)
+
+_providers: Dict[int, "zenoh_shm.ShmProvider"] = {}
+_lock = threading.Lock()
+
+
+def is_shm(sample: zenoh.Sample) -> bool:
+    """Check whether a sample was received through shared memory.
+
+    Args:
+        sample: A received Zenoh sample
+
+    Returns:
+        True if the payload is held in shared memory, i.e. it was published
+        from a shared-memory pool by a peer on the same host. Always False
+        if Zenoh has no shared-memory support.
+
+    Example:
+        >>> def handle(sample):
+        ...     print("shm" if is_shm(sample) else "network", len(sample.payload))
+    """
+    return _as_shm is not None and _as_shm(sample.payload) is not None
+
+
+def get_shm_provider(pool_size: int) -> "zenoh_shm.ShmProvider":
+    """Get the process-wide shared-memory provider with a pool of the given size.
+
+    Args:
+        pool_size: Size of the shared-memory pool in bytes
+
+    Returns:
+        The provider, created on first request
+
+    Raises:
+        ImportError: If Zenoh was built without shared-memory support or is too old
+    """
+    if zenoh_shm is None:
+        raise ImportError("Zenoh shared-memory support is not available. Install a recent eclipse-zenoh build with it.")
+    provider = _providers.get(pool_size)
+    if provider is None:
+        with _lock:
+            provider = _providers.get(pool_size)
+            if provider is None:
+                provider = _providers[pool_size] = zenoh_shm.ShmProvider.default_backend(pool_size)
+    return provider
+
+
+def shm_put(put: Callable[..., None], config: ShmConfig) -> Callable[..., None]:
+    """Wrap a put function so that large payloads are published from shared memory.
+
+    Payloads of at least `config.threshold` bytes are copied into a chunk
+    of the shared-memory pool, which Zenoh then publishes without copying
+    it again. Smaller payloads, and payloads that do not fit into the pool
+    while subscribers still hold earlier chunks, are published as given.
+
+    Args:
+        put: Publishes a payload, e.g. `zenoh.Publisher.put`
+        config: The shared-memory configuration
+
+    Returns:
+        A put function taking the same arguments as `put`
+
+    Raises:
+        ImportError: If Zenoh was built without shared-memory support
+
+    Example:
+        >>> put = shm_put(publisher.put, ShmConfig(pool_size=128 * 1024 * 1024))
+        >>> put(encoder.encode(frame))
+    """
+    provider = get_shm_provider(config.pool_size)
+    threshold = config.threshold
+    policy = zenoh_shm.GarbageCollect()
+
+    def put_shm(payload: Buffer, **kwargs) -> None:
+        size = len(payload)
+        if size >= threshold:
+            try:
+                chunk = provider.alloc(size, policy)
+            except zenoh.ZError:
+                pass  # the pool is exhausted; publish through the network stack
+            else:
+                chunk[:] = payload if isinstance(payload, (bytes, bytearray)) else bytes(payload)
+                put(zenoh.ZBytes(chunk), **kwargs)
+                return
+        put(payload, **kwargs)
+
+    return put_shm
@@ -0,0 +1,335 @@
+"""Typed Zenoh publishers and subscribers.
+
+This module provides wrappers that fuse a make87 encoder with a Zenoh
+publisher or subscriber, so applications put and receive Python objects
+instead of encoding and decoding payloads by hand.
+"""
+
+import logging
+import multiprocessing
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+
+import zenoh
+
+from make87.encodings.base import Encoder
+from make87.interfaces.zenoh.batching import Batcher, iter_payloads
+from make87.interfaces.zenoh.model import BatchingConfig, HandlerChannel, RingChannel, ShmConfig
+from make87.interfaces.zenoh.shm import shm_put
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_CAPACITY = 256
+
+
+class TypedPublisher(Generic[T]):
+    """Zenoh publisher that encodes objects before publishing them.
+
+    Zenoh copies every payload it is handed into its own buffers, so a
+    payload is handed over as is, without intermediate copies. Encoders
+    that serialize directly into a caller-provided buffer (e.g.
+    `NdarrayEncoder`, `ArrowEncoder`) encode into one buffer that is reused
+    for every put, instead of allocating a fresh payload per message. The
+    buffer is sized to the last payload, so it is reused as long as the
+    payload size stays the same, as it does for camera frames or point
+    clouds of fixed resolution.
+
+    With batching, messages are coalesced by a `Batcher` into framed
+    payloads, which `TypedSubscriber` splits back into single messages.
+    With shared memory, large payloads (or batches) are copied into a
+    shared-memory chunk instead, which Zenoh hands to subscribers on the
+    same host without copying it through the network stack.
+
+    Attributes:
+        publisher: The underlying Zenoh publisher
+        encoder: The encoder serializing published objects
+        batcher: The batcher coalescing messages, if batching is enabled
+    """
+
+    def __init__(
+        self,
+        publisher: zenoh.Publisher,
+        encoder: Encoder[T],
+        batching: Optional[BatchingConfig] = None,
+        shm: Optional[ShmConfig] = None,
+    ) -> None:
+        """Initialize the typed publisher.
+
+        Args:
+            publisher: The Zenoh publisher to publish payloads with
+            encoder: The encoder serializing published objects
+            batching: Batching limits. Defaults to None, which publishes
+                every message on its own.
+            shm: Shared-memory configuration. Defaults to None, which
+                publishes payloads from process memory.
+
+        Raises:
+            ImportError: If shared memory is configured but Zenoh was built without it
+
+        Example:
+            >>> publisher = TypedPublisher(session.declare_publisher("camera/front"), NdarrayEncoder())
+            >>> publisher.put(frame)
+        """
+        self.publisher = publisher
+        self.encoder = encoder
+        publish = publisher.put if shm is None else shm_put(publisher.put, shm)
+        self.batcher = Batcher(publish, batching) if batching is not None else None
+        self._encode = encoder.encode
+        self._put = publish if self.batcher is None else self.batcher.add
+        # Only encoders writing straight into the buffer save an allocation; the default copies.
+        # Batched payloads are kept until their batch is published, so they cannot share a buffer.
+        self._buffer: Optional[bytearray] = (
+            bytearray() if type(encoder).encode_into is not Encoder.encode_into and self.batcher is None else None
+        )
+        self._lock = threading.Lock()
+
+    def put(self, obj: T) -> None:
+        """Encode an object and publish it.
+
+        Args:
+            obj: The object to publish
+
+        Raises:
+            ValueError: If the object cannot be encoded
+
+        Example:
+            >>> publisher = interface.get_typed_publisher("HELLO_WORLD_MESSAGE")
+            >>> publisher.put(PlainText(header=header, body="Hello, World!"))
+        """
+        if self._buffer is None:
+            self._put(self._encode(obj))
+            return
+
+        with self._lock:
+            buffer = self._buffer
+            try:
+                size = self.encoder.encode_into(obj, buffer)
+            except ValueError:
+                # The buffer is too small (or the object cannot be encoded, which `encode` raises again).
+                payload = self._encode(obj)
+                self._put(payload)
+                self._buffer = bytearray(len(payload))
+                return
+            if size < len(buffer):
+                del buffer[size:]
+            self._put(buffer)
+
+    def flush(self) -> None:
+        """Publish the current batch right away. Does nothing without batching."""
+        if self.batcher is not None:
+            self.batcher.flush()
+
+    def undeclare(self) -> None:
+        """Publish the current batch, if any, and undeclare the underlying Zenoh publisher."""
+        if self.batcher is not None:
+            self.batcher.close()
+        self.publisher.undeclare()
+
+    def __enter__(self) -> "TypedPublisher[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.undeclare()
+
+
+class _Pending:
+    """A sample taken by a worker, awaiting delivery in key order."""
+
+    __slots__ = ("done", "values")
+
+    def __init__(self) -> None:
+        self.done = False
+        self.values: List[Any] = []
+
+
+class TypedSubscriber(Generic[T]):
+    """Zenoh subscriber that decodes samples on a worker pool.
+
+    Received samples are queued on Zenoh's callback thread and decoded by
+    `workers` threads, or by as many worker processes, which sidesteps the
+    GIL for CPU-heavy decoders such as YAML or large protobuf messages.
+    Decoded objects are passed to the handler.
+
+    The queue of samples waiting for a worker holds at most `capacity`
+    samples. Like the channels of `get_subscriber`, a FIFO channel drops new
+    samples while the queue is full, and a ring channel drops the oldest
+    queued sample to make room.
+
+    With `ordered`, samples of the same key expression are handed to the
+    handler one at a time, in the order they were received, even though
+    they are decoded concurrently. Samples of different keys, and all
+    samples without `ordered`, are handled concurrently from the worker
+    threads. Samples that fail to decode are logged and skipped. Batches
+    published with batching enabled are split, so the handler is called
+    once per message.
+
+    Attributes:
+        subscriber: The underlying Zenoh subscriber
+        encoder: The encoder deserializing received payloads
+        handler: Called with every decoded object
+        workers: Number of decoding threads (or processes)
+        ordered: Whether samples of the same key are handled in receive order
+        capacity: Maximum number of samples waiting for a worker
+        dropped: Number of samples dropped because the queue was full
+    """
+
+    def __init__(
+        self,
+        session: zenoh.Session,
+        key_expr: str,
+        encoder: Encoder[T],
+        handler: Callable[[T], Any],
+        *,
+        workers: int = 1,
+        ordered: bool = True,
+        processes: bool = False,
+        channel: Optional[HandlerChannel] = None,
+    ) -> None:
+        """Initialize the typed subscriber, start its workers and declare the Zenoh subscriber.
+
+        Args:
+            session: The Zenoh session to subscribe with
+            key_expr: The key expression to subscribe to
+            encoder: The encoder deserializing received payloads
+            handler: Called with every decoded object
+            workers: Number of samples decoded concurrently. Defaults to 1.
+            ordered: Whether samples of the same key are handled in the order
+                they were received. Defaults to True.
+            processes: Whether to decode in worker processes instead of
+                threads. The workers are started with the "spawn" method, as
+                forking after Zenoh's runtime threads started can deadlock, so
+                the encoder must be picklable (see `ParallelDecoder`).
+                Defaults to False.
+            channel: Channel configuration bounding the queue of received
+                samples. Defaults to None, which uses a FIFO channel with a
+                capacity of 256, like Zenoh's default handler.
+
+        Raises:
+            ValueError: If workers is below 1
+
+        Example:
+            >>> subscriber = TypedSubscriber(session, "camera/*/config", YamlEncoder(), apply_config, workers=4)
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.encoder = encoder
+        self.handler = handler
+        self.workers = workers
+        self.ordered = ordered
+        self.capacity = channel.capacity if channel is not None else DEFAULT_CAPACITY
+        self.dropped = 0
+        self._drop_oldest = isinstance(channel, RingChannel)
+        self._queue: Deque[Tuple[str, zenoh.Sample]] = deque()
+        self._pending: Dict[str, Deque[_Pending]] = {}
+        self._delivering: Set[str] = set()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._closed = False
+
+        self._parallel = None
+        if processes:
+            from make87.encodings.parallel import ParallelDecoder
+
+            self._parallel = ParallelDecoder(encoder, workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            self._decode = self._parallel.decode
+        else:
+            self._decode = encoder.decode_from
+
+        self._threads: List[threading.Thread] = []
+        for index in range(workers):
+            thread = threading.Thread(target=self._work, name=f"TypedSubscriber-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.subscriber = session.declare_subscriber(key_expr, self._on_sample)
+
+    def close(self) -> None:
+        """Undeclare the Zenoh subscriber and stop the workers once the queued samples are handled."""
+        self.subscriber.undeclare()
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+        for thread in self._threads:
+            thread.join()
+        if self._parallel is not None:
+            self._parallel.close()
+
+    def __enter__(self) -> "TypedSubscriber[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _on_sample(self, sample: zenoh.Sample) -> None:
+        """Queue a received sample, on Zenoh's callback thread."""
+        key = str(sample.key_expr) if self.ordered else ""
+        with self._lock:
+            if len(self._queue) >= self.capacity:
+                self.dropped += 1
+                if not self._drop_oldest:
+                    return
+                self._queue.popleft()
+            self._queue.append((key, sample))
+            self._not_empty.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+                key, sample = self._queue.popleft()
+                if self.ordered:
+                    # Taken under the lock, so entries line up in receive order.
+                    entry = _Pending()
+                    self._pending.setdefault(key, deque()).append(entry)
+
+            values = self._decode_sample(sample)
+
+            if not self.ordered:
+                for value in values:
+                    self._handle(value)
+                continue
+
+            with self._lock:
+                entry.done, entry.values = True, values
+                if key in self._delivering:
+                    continue  # the worker delivering this key picks the entry up
+                self._delivering.add(key)
+            self._deliver(key)
+
+    def _deliver(self, key: str) -> None:
+        """Hand the decoded entries at the head of a key's queue to the handler, in order."""
+        while True:
+            with self._lock:
+                pending = self._pending[key]
+                if not pending or not pending[0].done:
+                    self._delivering.discard(key)
+                    if not pending:
+                        del self._pending[key]
+                    return
+                entry = pending.popleft()
+            for value in entry.values:
+                self._handle(value)
+
+    def _decode_sample(self, sample: zenoh.Sample) -> List[T]:
+        """Decode every message of a sample, skipping messages that fail to decode."""
+        values = []
+        try:
+            for payload in iter_payloads(sample):
+                try:
+                    values.append(self._decode(payload))
+                except Exception:
+                    logger.exception("TypedSubscriber failed to decode a sample")
+        except ValueError:
+            logger.exception("TypedSubscriber received a truncated batch")
+        return values
+
+    def _handle(self, value: T) -> None:
+        try:
+            self.handler(value)
+        except Exception:
+            logger.exception("TypedSubscriber handler failed")
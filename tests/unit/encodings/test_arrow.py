@@ -0,0 +1,67 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from make87.encodings import ArrowEncoder  # noqa: E402
+
+
+@pytest.fixture
+def table():
+    return pa.table({"robot_id": list(range(100)), "battery": [i / 100 for i in range(100)]})
+
+
+@pytest.fixture(params=[None, "zstd"])
+def encoder(request):
+    return ArrowEncoder(compression=request.param)
+
+
+def test_round_trip_table(encoder, table):
+    assert encoder.decode(encoder.encode(table)).equals(table)
+
+
+def test_round_trip_record_batch(encoder, table):
+    batch = table.to_batches()[0]
+    assert encoder.decode(encoder.encode(batch)).equals(table)
+
+
+def test_multiple_batches(encoder, table):
+    batches = table.to_batches(max_chunksize=30)
+    payload = encoder.encode(batches)
+    decoded = list(encoder.iter_decode(payload))
+    assert len(decoded) == 4
+    assert pa.Table.from_batches(decoded).equals(table)
+    assert encoder.decode(payload).equals(table)
+
+
+def test_decode_is_zero_copy(table):
+    encoder = ArrowEncoder()
+    payload = bytearray(encoder.encode(table))
+    decoded = encoder.decode_from(memoryview(payload))
+    column = decoded.column("robot_id").chunk(0)
+    start = pa.py_buffer(payload).address
+    assert start <= column.buffers()[1].address < start + len(payload)
+
+
+def test_encode_into(encoder, table):
+    buffer = bytearray(64 * 1024)
+    size = encoder.encode_into(table, buffer)
+    assert encoder.decode_from(memoryview(buffer)[:size]).equals(table)
+    with pytest.raises(ValueError):
+        encoder.encode_into(table, bytearray(64))
+
+
+def test_encode_empty_sequence(encoder):
+    with pytest.raises(ValueError):
+        encoder.encode([])
+
+
+def test_decode_invalid(encoder):
+    with pytest.raises(ValueError):
+        encoder.decode(b"not arrow")
+    with pytest.raises(ValueError):
+        list(encoder.iter_decode(b"not arrow"))
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError):
+        ArrowEncoder(compression="gzip")
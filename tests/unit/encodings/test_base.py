@@ -0,0 +1,24 @@
+import pytest
+
+from make87.encodings.base import unwrap_buffer, write_into
+
+
+def test_write_into():
+    buffer = bytearray(8)
+    assert write_into(b"abc", buffer) == 3
+    assert bytes(buffer[:3]) == b"abc"
+
+
+def test_write_into_too_small():
+    with pytest.raises(ValueError):
+        write_into(b"abcdef", bytearray(2))
+
+
+def test_unwrap_full_view():
+    data = bytearray(b"abcdef")
+    assert unwrap_buffer(memoryview(data)) is data
+
+
+def test_unwrap_keeps_slices():
+    view = memoryview(b"abcdef")[1:]
+    assert unwrap_buffer(view) is view
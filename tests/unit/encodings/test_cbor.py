@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("cbor2")
+
+from make87.encodings import CborEncoder  # noqa: E402
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _default(obj):
+    if isinstance(obj, Point):
+        return {"__point__": [obj.x, obj.y]}
+    raise TypeError
+
+
+def _object_hook(d):
+    return Point(*d["__point__"]) if "__point__" in d else d
+
+
+def test_round_trip():
+    encoder = CborEncoder()
+    obj = {"key": "value", "items": [1, 2.5, None, True], "nested": {"a": {}}, 3: "int key"}
+    assert encoder.decode(encoder.encode(obj)) == obj
+
+
+def test_native_types():
+    np = pytest.importorskip("numpy")
+    encoder = CborEncoder()
+    stamp = datetime(2024, 4, 5, 12, 30, 1, 250000, tzinfo=timezone.utc)
+    obj = {"image": b"\x00\xff", "stamp": stamp, "naive": datetime(2024, 1, 1), "score": np.float32(0.5)}
+    decoded = encoder.decode(encoder.encode(obj))
+    assert decoded["image"] == b"\x00\xff"
+    assert decoded["stamp"] == stamp
+    assert decoded["naive"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert decoded["score"] == 0.5
+    assert encoder.decode(encoder.encode([np.int64(7), np.bool_(True)])) == [7, True]
+
+
+def test_hooks():
+    encoder = CborEncoder(object_hook=_object_hook, default=_default)
+    decoded = encoder.decode(encoder.encode({"p": Point(1, 2)}))
+    assert (decoded["p"].x, decoded["p"].y) == (1, 2)
+
+
+def test_unsupported_type():
+    with pytest.raises(ValueError, match="CBOR encoding failed"):
+        CborEncoder().encode(Point(1, 2))
+
+
+def test_decode_from_memoryview():
+    encoder = CborEncoder()
+    data = b"xx" + encoder.encode({"key": "value"}) + b"xx"
+    assert encoder.decode_from(memoryview(data)[2:-2]) == {"key": "value"}
+    assert encoder.decode_from(bytearray(encoder.encode([1, 2]))) == [1, 2]
+
+
+def test_decode_invalid():
+    with pytest.raises(ValueError, match="CBOR decoding failed"):
+        CborEncoder().decode(b"\x82\x01")
@@ -0,0 +1,94 @@
+import pytest
+
+from make87.encodings import CompressedEncoder, JsonEncoder
+from make87.encodings.compressed import CompressionDictionary, available_compression_algorithms, train_dictionary
+
+DICTIONARY_ALGORITHMS = [a for a in available_compression_algorithms() if a != "lzma"]
+
+
+def _message(i):
+    return {"header": {"entity_path": "/camera/front", "reference_id": i}, "label": f"object_{i % 7}", "score": i}
+
+
+@pytest.fixture(params=available_compression_algorithms())
+def algorithm(request):
+    return request.param
+
+
+def test_round_trip(algorithm):
+    encoder = CompressedEncoder(JsonEncoder(), algorithm=algorithm)
+    obj = {"items": ["sensor_reading"] * 200}
+    payload = encoder.encode(obj)
+    assert payload[0] != 0
+    assert len(payload) < len(JsonEncoder().encode(obj))
+    assert encoder.decode(payload) == obj
+
+
+def test_small_payload_is_stored_raw(algorithm):
+    encoder = CompressedEncoder(JsonEncoder(), algorithm=algorithm, min_size=64)
+    payload = encoder.encode({"a": 1})
+    assert payload == b"\x00" + JsonEncoder().encode({"a": 1})
+    assert encoder.decode_from(memoryview(payload)) == {"a": 1}
+
+
+def test_incompressible_payload_is_stored_raw(algorithm):
+    encoder = CompressedEncoder(JsonEncoder(), algorithm=algorithm, min_size=0)
+    assert encoder.encode("x")[0] == 0
+
+
+def test_decodes_other_algorithms(algorithm):
+    obj = {"items": ["sensor_reading"] * 200}
+    payload = CompressedEncoder(JsonEncoder(), algorithm=algorithm).encode(obj)
+    assert CompressedEncoder(JsonEncoder(), algorithm="zlib").decode(payload) == obj
+
+
+def test_encode_many(algorithm):
+    encoder = CompressedEncoder(JsonEncoder(), algorithm=algorithm)
+    objs = [{"a": 1}, {"items": ["sensor_reading"] * 200}]
+    assert encoder.decode_many(encoder.encode_many(objs)) == objs
+
+
+@pytest.mark.parametrize("algorithm", DICTIONARY_ALGORITHMS)
+def test_dictionary_round_trip(algorithm):
+    inner = JsonEncoder()
+    dictionary = train_dictionary([inner.encode(_message(i)) for i in range(1000)], algorithm=algorithm, size=4096)
+    plain = CompressedEncoder(inner, algorithm=algorithm, min_size=0)
+    encoder = CompressedEncoder(inner, algorithm=algorithm, min_size=0, dictionary=dictionary)
+
+    payload = encoder.encode(_message(5000))
+    assert payload[0] & 0x10
+    assert int.from_bytes(payload[1:5], "little") == dictionary.dict_id
+    assert len(payload) < len(plain.encode(_message(5000)))
+    assert encoder.decode(payload) == _message(5000)
+
+    with pytest.raises(ValueError, match="dictionary id"):
+        plain.decode(payload)
+
+
+def test_dictionary_restored_from_bytes():
+    dictionary = train_dictionary([b"abc" * 100], algorithm="zlib")
+    restored = CompressionDictionary("zlib", dictionary.data)
+    assert restored.dict_id == dictionary.dict_id
+
+
+def test_dictionary_algorithm_mismatch():
+    dictionary = train_dictionary([b"abc" * 100], algorithm="zlib")
+    with pytest.raises(ValueError):
+        CompressedEncoder(JsonEncoder(), algorithm="lzma", dictionary=dictionary)
+    with pytest.raises(ValueError):
+        train_dictionary([b"abc"], algorithm="lzma")
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        CompressedEncoder(JsonEncoder(), algorithm="brotli")
+
+
+def test_invalid_payload():
+    encoder = CompressedEncoder(JsonEncoder())
+    with pytest.raises(ValueError):
+        encoder.decode(b"")
+    with pytest.raises(ValueError):
+        encoder.decode(b"\x0f123")
+    with pytest.raises(ValueError):
+        encoder.decode(b"\x01not deflate")
@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from make87.encodings import DeltaEncoder, JsonEncoder
+from make87.encodings.base import Encoder
+from make87.encodings.delta import MissingKeyframeError, diff, patch
+
+
+class BytesEncoder(Encoder[bytes]):
+    def encode(self, obj: bytes) -> bytes:
+        return bytes(obj)
+
+    def decode(self, data: bytes) -> bytes:
+        return bytes(data)
+
+
+def _grid(size=4096, changes=(), seed=0):
+    grid = bytearray(random.Random(seed).randbytes(size))
+    for offset, value in changes:
+        grid[offset] = value
+    return bytes(grid)
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        (b"", b""),
+        (b"", b"abc"),
+        (b"abc", b""),
+        (b"abcdef", b"abcdef"),
+        (b"abcdef", b"abXdef"),
+        (b"abcdef", b"abcdefgh"),
+        (b"abcdef", b"xxabcdef"),
+        (b"abcdef", b"ab"),
+        (_grid(), _grid(changes=[(0, 1), (100, 2), (4095, 3)])),
+        (_grid(), _grid(2000)),
+        (_grid(), _grid(seed=1)),
+        (b"\0" * 100 + b"\1" + b"\0" * 100, b"\0" * 100 + b"\2" + b"\0" * 300),
+    ],
+)
+def test_diff_patch_round_trip(old, new):
+    assert patch(old, diff(old, new)) == new
+    assert patch(memoryview(old), diff(bytearray(old), memoryview(new), block_size=1)) == new
+
+
+def test_diff_of_scattered_changes_is_small():
+    old = _grid(1 << 20)
+    new = _grid(1 << 20, changes=[(10, 0), (500_000, 0), (1_000_000, 0)])
+    assert len(diff(old, new)) < 200
+
+
+def test_keyframes_and_deltas():
+    encoder = DeltaEncoder(BytesEncoder(), keyframe_interval=3)
+    decoder = DeltaEncoder(BytesEncoder())
+    grids = [_grid(changes=[(i, i)]) for i in range(7)]
+    payloads = [encoder.encode(grid) for grid in grids]
+
+    assert [p[0] for p in payloads] == [0, 1, 1, 0, 1, 1, 0]
+    assert all(len(p) < 100 for i, p in enumerate(payloads) if i % 3)
+    assert [decoder.decode(p) for p in payloads] == grids
+
+
+def test_lost_deltas_do_not_break_later_deltas():
+    encoder = DeltaEncoder(BytesEncoder())
+    decoder = DeltaEncoder(BytesEncoder())
+    payloads = [encoder.encode(_grid(changes=[(i, i)])) for i in range(5)]
+    decoder.decode(payloads[0])
+    assert decoder.decode_from(memoryview(payloads[4])) == _grid(changes=[(4, 4)])
+
+
+def test_missing_keyframe():
+    requests = []
+    encoder = DeltaEncoder(BytesEncoder())
+    decoder = DeltaEncoder(BytesEncoder(), on_missing_keyframe=requests.append)
+    encoder.encode(_grid())
+
+    with pytest.raises(MissingKeyframeError) as info:
+        decoder.decode(encoder.encode(_grid(changes=[(1, 1)])))
+    assert info.value.stream_id == encoder.stream_id
+    assert info.value.keyframe_sequence == 0
+    assert requests == [info.value]
+
+    encoder.force_keyframe()
+    payload = encoder.encode(_grid(changes=[(2, 2)]))
+    assert payload[0] == 0
+    assert decoder.decode(payload) == _grid(changes=[(2, 2)])
+    assert decoder.decode(encoder.encode(_grid(changes=[(3, 3)]))) == _grid(changes=[(3, 3)])
+
+
+def test_large_change_is_sent_as_keyframe():
+    encoder = DeltaEncoder(BytesEncoder(), max_delta_ratio=0.5)
+    encoder.encode(_grid())
+    assert encoder.encode(_grid(seed=1))[0] == 0
+
+
+def test_decoder_tracks_several_streams():
+    first, second = DeltaEncoder(JsonEncoder()), DeltaEncoder(JsonEncoder())
+    decoder = DeltaEncoder(JsonEncoder())
+    config = {"params": {f"p{i}": i for i in range(200)}}
+    payloads = [first.encode(config), second.encode(config)]
+    config["params"]["p7"] = 8
+    payloads += [first.encode(config), second.encode(config)]
+
+    assert payloads[2][0] == 1 and payloads[3][0] == 1
+    assert [decoder.decode(p) for p in payloads][2:] == [config, config]
+
+
+def test_malformed_payload():
+    decoder = DeltaEncoder(BytesEncoder())
+    with pytest.raises(ValueError, match="Delta decoding failed"):
+        decoder.decode(b"\x00\x01")
+    with pytest.raises(ValueError, match="Delta decoding failed"):
+        decoder.decode(b"\x07\x00\x00\x00\x00\x00")
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        DeltaEncoder(BytesEncoder(), keyframe_interval=0)
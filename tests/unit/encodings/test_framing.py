@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+from make87.encodings.framing import decode_varint, encode_varint, frame, iter_frames, read_varint, write_frame
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**32, 2**64 - 1])
+def test_varint_round_trip(value):
+    encoded = encode_varint(value)
+    assert decode_varint(encoded) == (value, len(encoded))
+    assert read_varint(io.BytesIO(encoded)) == value
+
+
+def test_decode_truncated_varint():
+    with pytest.raises(ValueError):
+        decode_varint(b"\x80\x80")
+
+
+def test_read_varint_at_end():
+    assert read_varint(io.BytesIO(b"")) is None
+
+
+def test_iter_frames_buffer():
+    payloads = [b"first", b"", b"x" * 300]
+    assert [bytes(p) for p in iter_frames(frame(payloads))] == payloads
+
+
+def test_iter_frames_stream():
+    stream = io.BytesIO()
+    for payload in (b"first", b"x" * 300):
+        write_frame(stream, payload)
+    stream.seek(0)
+    assert list(iter_frames(stream)) == [b"first", b"x" * 300]
+
+
+def test_iter_frames_truncated():
+    with pytest.raises(ValueError):
+        list(iter_frames(frame([b"payload"])[:-1]))
@@ -0,0 +1,179 @@
+import io
+import json
+import random
+import tracemalloc
+
+import pytest
+
+from make87.encodings import JsonEncoder
+from make87.encodings.json_ import available_json_backends
+
+
+@pytest.fixture(params=available_json_backends())
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def encoder(backend):
+    return JsonEncoder(backend=backend)
+
+
+def test_round_trip(encoder):
+    obj = {"key": "value", "items": [1, 2, 3]}
+    assert encoder.decode(encoder.encode(obj)) == obj
+
+
+def test_encode_into(encoder):
+    obj = {"key": "value"}
+    buffer = bytearray(64)
+    size = encoder.encode_into(obj, buffer)
+    assert bytes(buffer[:size]) == encoder.encode(obj)
+
+
+def test_encode_into_buffer_too_small(encoder):
+    with pytest.raises(ValueError):
+        encoder.encode_into({"key": "value"}, bytearray(4))
+
+
+def test_decode_from_memoryview(encoder):
+    data = b'xx{"key": "value"}xx'
+    assert encoder.decode_from(memoryview(data)[2:-2]) == {"key": "value"}
+
+
+def test_decode_from_invalid(encoder):
+    with pytest.raises(ValueError):
+        encoder.decode_from(memoryview(b"{not json"))
+
+
+def test_encode_many(encoder):
+    objs = [{"a": 1}, [1, 2], "text"]
+    assert encoder.encode_many(objs) == [encoder.encode(obj) for obj in objs]
+
+
+def test_decode_many(encoder):
+    objs = [{"a": 1}, [1, 2], "text", None]
+    assert encoder.decode_many(encoder.encode_many(objs)) == objs
+
+
+def test_decode_many_object_hook(backend):
+    encoder = JsonEncoder(object_hook=lambda d: tuple(sorted(d)), backend=backend)
+    assert encoder.decode_many([b'{"b": 1, "a": 2}', b"[3]"]) == [("a", "b"), [3]]
+
+
+def test_decode_many_rejects_split_values(encoder):
+    with pytest.raises(ValueError):
+        encoder.decode_many([b"1, 2", b"3"])
+
+
+def test_decode_many_rejects_values_spanning_payloads(encoder):
+    with pytest.raises(ValueError):
+        encoder.decode_many([b"1,2", b"[3", b"4]"])
+
+
+def test_decode_many_empty(encoder):
+    assert encoder.decode_many([]) == []
+
+
+def test_default_backend_is_stdlib():
+    assert JsonEncoder().backend == "stdlib"
+
+
+def test_auto_backend():
+    assert JsonEncoder(backend="auto").backend == available_json_backends()[0]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        JsonEncoder(backend="simplejson")
+
+
+def test_object_hook_order(backend):
+    calls = []
+
+    def hook(d):
+        calls.append(sorted(d))
+        return {"wrapped": len(calls)}
+
+    encoder = JsonEncoder(object_hook=hook, backend=backend)
+    decoded = encoder.decode(b'{"outer": {"inner": {}}, "items": [{"a": 1}]}')
+    assert calls == [[], ["inner"], ["a"], ["items", "outer"]]
+    assert decoded == {"wrapped": 4}
+
+
+def test_default(backend):
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    encoder = JsonEncoder(default=lambda obj: {"x": obj.x, "y": obj.y}, backend=backend)
+    assert encoder.decode(encoder.encode({"p": Point(1, 2)})) == {"p": {"x": 1, "y": 2}}
+
+
+def test_default_for_datetime(backend):
+    import datetime
+
+    if backend == "msgspec":
+        pytest.skip("msgspec serializes datetimes natively")
+    encoder = JsonEncoder(default=lambda obj: "custom", backend=backend)
+    assert encoder.decode(encoder.encode([datetime.datetime(2024, 1, 1)])) == ["custom"]
+
+
+def test_non_str_keys(backend):
+    encoder = JsonEncoder(backend=backend)
+    assert encoder.decode(encoder.encode({1: "a"})) == {"1": "a"}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+def test_iter_decode(chunk_size):
+    doc = {"meta": {"skip": [1, {"x": "y"}]}, "history": {"detections": [1, 22.5, {"a": "é"}, [3], True, None, "s"]}}
+    data = json.dumps(doc).encode("utf-8")
+    encoder = JsonEncoder()
+    assert (
+        list(encoder.iter_decode(io.BytesIO(data), "history.detections", chunk_size=chunk_size))
+        == (doc["history"]["detections"])
+    )
+    assert list(encoder.iter_decode(memoryview(data), ["history", "detections", 2], chunk_size=chunk_size)) == [
+        ("a", "é")
+    ]
+    assert list(encoder.iter_decode(data, chunk_size=chunk_size)) == [
+        ("meta", doc["meta"]),
+        ("history", doc["history"]),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+def test_iter_decode_float_array(chunk_size):
+    rng = random.Random(0)
+    cloud = [rng.uniform(-10, 10) for _ in range(200)] + [-2.5, 1e-07, -3.25e12, 0.0, 5]
+    data = json.dumps({"cloud": cloud}).encode("utf-8")
+    assert list(JsonEncoder().iter_decode(io.BytesIO(data), "cloud", chunk_size=chunk_size)) == cloud
+
+
+def test_iter_decode_top_level_array():
+    encoder = JsonEncoder(object_hook=lambda d: d.get("id", d))
+    assert list(encoder.iter_decode(b' [ {"id": 1}, {"id": 2} ] ')) == [1, 2]
+    assert list(encoder.iter_decode(b"[]")) == []
+
+
+@pytest.mark.parametrize(
+    "data, path",
+    [(b"[1,", None), (b"[1 2]", None), (b'{"a": []}', "b"), (b'{"a": []}', ["a", 0]), (b"5", None)],
+)
+def test_iter_decode_invalid(data, path):
+    with pytest.raises(ValueError, match="JSON decoding failed"):
+        list(JsonEncoder().iter_decode(data, path))
+
+
+def test_iter_decode_memory_grows_with_element_size():
+    element = {"label": "object", "box": list(range(50))}
+    data = b'{"items": [' + b",".join([json.dumps(element).encode()] * 20_000) + b"]}"
+    source = io.BytesIO(data)
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in JsonEncoder().iter_decode(source, "items"))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert count == 20_000
+    assert peak < len(data) / 10
@@ -0,0 +1,92 @@
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from make87.encodings import JsonEncoder, MemoizedEncoder, ProtobufEncoder
+from make87.encodings.memoize import CacheInfo
+
+
+class CountingEncoder(JsonEncoder):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def encode(self, obj):
+        self.calls += 1
+        return super().encode(obj)
+
+
+def test_identity_key():
+    inner = CountingEncoder()
+    encoder = MemoizedEncoder(inner)
+    heartbeat = {"node": "lidar", "state": "ok"}
+    payloads = [encoder.encode(heartbeat) for _ in range(5)]
+    assert payloads == [JsonEncoder().encode(heartbeat)] * 5
+    assert inner.calls == 1
+    assert encoder.cache_info() == CacheInfo(hits=4, misses=1, maxsize=128, currsize=1)
+
+    encoder.encode(dict(heartbeat))  # equal but not identical
+    assert inner.calls == 2
+
+
+def test_identity_key_keeps_objects_alive():
+    encoder = MemoizedEncoder(JsonEncoder())
+    for i in range(10):
+        # Without the cache holding them, the temporaries could share an id.
+        assert encoder.decode(encoder.encode({"i": i})) == {"i": i}
+
+
+def test_version():
+    inner = CountingEncoder()
+    encoder = MemoizedEncoder(inner, version=lambda grid: grid["revision"])
+    grid = {"revision": 1, "cells": [0, 0]}
+    encoder.encode(grid)
+    encoder.encode(grid)
+    grid["cells"][0] = 1
+    grid["revision"] += 1
+    assert encoder.decode(encoder.encode(grid)) == grid
+    assert inner.calls == 2
+
+
+def test_user_key():
+    inner = CountingEncoder()
+    encoder = MemoizedEncoder(inner, key=lambda status: status["state"])
+    encoder.encode({"state": "ok"})
+    encoder.encode({"state": "ok"})
+    encoder.encode({"state": "error"})
+    assert inner.calls == 2
+    assert encoder.cache_info().hits == 1
+
+
+def test_lru_eviction():
+    inner = CountingEncoder()
+    encoder = MemoizedEncoder(inner, key=lambda obj: obj, maxsize=2)
+    for value in ("a", "b", "a", "c", "a", "b"):
+        encoder.encode(value)
+    # "b" was evicted by "c", as "a" was used more recently.
+    assert inner.calls == 4
+    assert encoder.cache_info().currsize == 2
+
+
+def test_invalidate_and_clear():
+    inner = CountingEncoder()
+    encoder = MemoizedEncoder(inner)
+    obj = {"a": 1}
+    encoder.encode(obj)
+    encoder.invalidate(obj)
+    encoder.encode(obj)
+    assert inner.calls == 2
+    encoder.cache_clear()
+    assert encoder.cache_info() == CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+
+
+def test_protobuf_with_version():
+    encoder = MemoizedEncoder(ProtobufEncoder(Timestamp), version=lambda m: m.nanos)
+    stamp = Timestamp(seconds=1, nanos=2)
+    assert encoder.encode(stamp) is encoder.encode(stamp)
+    stamp.nanos = 3
+    assert encoder.decode_from(memoryview(encoder.encode(stamp))) == stamp
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        MemoizedEncoder(JsonEncoder(), maxsize=0)
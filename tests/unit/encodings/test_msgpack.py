@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from make87.encodings import MsgpackEncoder
+from make87.encodings.msgpack_ import available_msgpack_backends
+
+pytestmark = pytest.mark.skipif(not available_msgpack_backends(), reason="no MessagePack backend installed")
+
+
+@pytest.fixture(params=available_msgpack_backends())
+def backend(request):
+    return request.param
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _default(obj):
+    if isinstance(obj, Point):
+        return {"__point__": [obj.x, obj.y]}
+    raise TypeError
+
+
+def _object_hook(d):
+    return Point(*d["__point__"]) if "__point__" in d else d
+
+
+def test_round_trip(backend):
+    encoder = MsgpackEncoder(backend=backend)
+    obj = {"key": "value", "items": [1, 2.5, None, True], "nested": {"a": {}}, 3: "int key"}
+    payload = encoder.encode(obj)
+    assert len(payload) < len(b'{"key": "value", "items": [1, 2.5, null, true], "nested": {"a": {}}, "3": "int key"}')
+    assert encoder.decode(payload) == obj
+
+
+def test_native_types(backend):
+    np = pytest.importorskip("numpy")
+    encoder = MsgpackEncoder(backend=backend)
+    stamp = datetime(2024, 4, 5, 12, 30, 1, 250000, tzinfo=timezone.utc)
+    obj = {"image": b"\x00\xff", "stamp": stamp, "naive": datetime(2024, 1, 1), "score": np.float32(0.5)}
+    decoded = encoder.decode(encoder.encode(obj))
+    assert decoded["image"] == b"\x00\xff"
+    assert decoded["stamp"] == stamp
+    assert decoded["naive"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert decoded["score"] == 0.5
+    assert encoder.decode(encoder.encode([np.int64(7), np.bool_(True)])) == [7, True]
+
+
+def test_hooks(backend):
+    encoder = MsgpackEncoder(object_hook=_object_hook, default=_default, backend=backend)
+    decoded = encoder.decode(encoder.encode({"p": Point(1, 2)}))
+    assert (decoded["p"].x, decoded["p"].y) == (1, 2)
+
+
+def test_unsupported_type(backend):
+    with pytest.raises(ValueError, match="MessagePack encoding failed"):
+        MsgpackEncoder(backend=backend).encode(Point(1, 2))
+
+
+def test_decode_from_memoryview(backend):
+    encoder = MsgpackEncoder(backend=backend)
+    data = b"xx" + encoder.encode({"key": "value"}) + b"xx"
+    assert encoder.decode_from(memoryview(data)[2:-2]) == {"key": "value"}
+
+
+def test_decode_invalid(backend):
+    with pytest.raises(ValueError, match="MessagePack decoding failed"):
+        MsgpackEncoder(backend=backend).decode(b"\x92\x01")
+
+
+def test_many(backend):
+    encoder = MsgpackEncoder(backend=backend)
+    objs = [{"a": 1}, [1, 2], "x", None]
+    payloads = encoder.encode_many(objs)
+    assert payloads == [encoder.encode(obj) for obj in objs]
+    assert encoder.decode_many(payloads) == objs
+    assert encoder.decode_many([memoryview(p) for p in payloads]) == objs
+    assert encoder.decode_many([]) == []
+
+
+def test_decode_many_reports_bad_payload(backend):
+    encoder = MsgpackEncoder(backend=backend)
+    with pytest.raises(ValueError, match="MessagePack decoding failed"):
+        encoder.decode_many([encoder.encode(1), b"\x92\x01\x02\x03"])
+
+
+def test_decode_many_rejects_values_spanning_payloads(backend):
+    encoder = MsgpackEncoder(backend=backend)
+    with pytest.raises(ValueError, match="MessagePack decoding failed"):
+        encoder.decode_many([b"\x92\x01", b"\x02\x03"])
+
+
+def test_backends_produce_the_same_bytes():
+    if len(available_msgpack_backends()) < 2:
+        pytest.skip("needs both msgpack and msgspec")
+    obj = {"key": "value", "items": [1, 2.5, None, True, b"\x00"], "stamp": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+    assert MsgpackEncoder(backend="msgpack").encode(obj) == MsgpackEncoder(backend="msgspec").encode(obj)
+    naive = {"stamps": [datetime(2024, 1, 1), (datetime(2024, 1, 2, 3, 4, 5, 6),)], datetime(2024, 1, 3): 1}
+    assert MsgpackEncoder(backend="msgpack").encode(naive) == MsgpackEncoder(backend="msgspec").encode(naive)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        MsgpackEncoder(backend="unknown")
@@ -0,0 +1,97 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from make87.encodings import NdarrayEncoder
+
+
+@pytest.fixture(params=[1, 64])
+def encoder(request):
+    return NdarrayEncoder(alignment=request.param)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12, dtype=np.float32).reshape(3, 4),
+        np.arange(12, dtype=">i8").reshape(3, 4),
+        np.asfortranarray(np.arange(24, dtype=np.uint16).reshape(2, 3, 4)),
+        np.arange(20, dtype=np.float64).reshape(4, 5)[:, ::2],
+        np.zeros((0, 3), dtype=np.uint8),
+        np.array(3.5),
+        np.array([True, False]),
+    ],
+)
+def test_round_trip(encoder, array):
+    decoded = encoder.decode(encoder.encode(array))
+    assert decoded.dtype == array.dtype
+    np.testing.assert_array_equal(decoded, array)
+
+
+def test_decode_does_not_copy(encoder):
+    payload = bytearray(encoder.encode(np.arange(1000, dtype=np.float32)))
+    decoded = encoder.decode_from(memoryview(payload))
+    assert np.shares_memory(decoded, np.frombuffer(payload, dtype=np.uint8))
+    assert decoded.flags.writeable
+    assert not encoder.decode(bytes(payload)).flags.writeable
+
+
+def test_fortran_order_is_preserved(encoder):
+    array = np.asfortranarray(np.ones((3, 4)))
+    assert encoder.decode(encoder.encode(array)).flags.f_contiguous
+
+
+def test_alignment():
+    encoder = NdarrayEncoder(alignment=64)
+    payload = bytearray(encoder.encode([np.ones(3, dtype=np.uint8), np.ones(5, dtype=np.float64)]))
+    base = np.frombuffer(payload, dtype=np.uint8).ctypes.data
+    for array in encoder.decode_from(payload):
+        assert (array.ctypes.data - base) % 64 == 0
+
+
+def test_multi_array_records(encoder):
+    image = np.zeros((4, 6, 3), dtype=np.uint8)
+    depth = np.ones((4, 6), dtype=np.uint16)
+    decoded = encoder.decode(encoder.encode([image, depth]))
+    assert isinstance(decoded, list) and len(decoded) == 2
+    np.testing.assert_array_equal(decoded[1], depth)
+
+    decoded = encoder.decode(encoder.encode({"image": image, "depth": depth}))
+    assert list(decoded) == ["image", "depth"]
+    np.testing.assert_array_equal(decoded["image"], image)
+
+
+def test_encode_into(encoder):
+    record = {"image": np.ones((4, 6), dtype=np.uint8)}
+    buffer = bytearray(encoder.encoded_size(record) + 10)
+    size = encoder.encode_into(record, buffer)
+    assert bytes(buffer[:size]) == encoder.encode(record)
+    with pytest.raises(ValueError):
+        encoder.encode_into(record, bytearray(size - 1))
+
+
+def test_unsupported_dtypes(encoder):
+    with pytest.raises(ValueError):
+        encoder.encode(np.array([object()]))
+    with pytest.raises(ValueError):
+        encoder.encode(np.zeros(2, dtype=[("x", "f4"), ("y", "f4")]))
+
+
+def test_invalid_payload(encoder):
+    payload = encoder.encode(np.arange(10))
+    with pytest.raises(ValueError):
+        encoder.decode(payload[:-1])
+    with pytest.raises(ValueError):
+        encoder.decode(b"XX" + payload[2:])
+
+
+def test_invalid_alignment():
+    with pytest.raises(ValueError):
+        NdarrayEncoder(alignment=3)
+
+
+def test_numpy_is_imported_lazily():
+    code = "import sys, make87.encodings; assert 'numpy' not in sys.modules"
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True)
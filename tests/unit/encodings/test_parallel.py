@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+
+from make87.encodings import JsonEncoder, ParallelDecoder, YamlEncoder
+
+
+@pytest.fixture
+def decoder():
+    decoder = ParallelDecoder(JsonEncoder(), workers=2, max_in_flight=3, shm_threshold=256)
+    yield decoder
+    decoder.close()
+
+
+def _payloads():
+    encoder = JsonEncoder()
+    # Mix of pickled (small) and shared memory (large) payloads of varying decode cost.
+    return [encoder.encode({"index": i, "items": list(range((i % 4) * 500))}) for i in range(20)]
+
+
+def test_map_preserves_order(decoder):
+    payloads = _payloads()
+    results = list(decoder.map(memoryview(p) for p in payloads))
+    assert [r["index"] for r in results] == list(range(20))
+    assert results == [JsonEncoder().decode(p) for p in payloads]
+
+
+def test_decode(decoder):
+    assert decoder.decode(b'{"a": 1}') == {"a": 1}
+    assert decoder.decode(bytearray(JsonEncoder().encode(list(range(1000))))) == list(range(1000))
+
+
+def test_callbacks_run_in_submission_order(decoder):
+    received = []
+    finished = threading.Event()
+
+    def callback(future):
+        received.append(future.result()["index"])
+        if len(received) == 20:
+            finished.set()
+
+    for payload in _payloads():
+        decoder.submit(payload, callback)
+    assert finished.wait(30)
+    assert received == list(range(20))
+
+
+def test_decoding_errors_are_raised_in_order(decoder):
+    results = decoder.map([b'{"a": 1}', b"{not json", b'{"a": 2}'])
+    assert next(results) == {"a": 1}
+    with pytest.raises(ValueError, match="JSON decoding failed"):
+        next(results)
+
+
+def test_window_is_bounded(decoder):
+    futures = [decoder.submit(p) for p in _payloads()]
+    assert [f.result()["index"] for f in futures] == list(range(20))
+    assert len(decoder._slots) <= decoder.max_in_flight
+
+
+def test_close():
+    decoder = ParallelDecoder(YamlEncoder(), workers=1, shm_threshold=0)
+    with decoder:
+        assert decoder.decode(b"a: 1\n") == {"a": 1}
+    assert not decoder._slots
+    with pytest.raises(RuntimeError):
+        decoder.submit(b"a: 1\n")
@@ -0,0 +1,248 @@
+import copy
+import io
+import pickle
+
+import pytest
+from google.protobuf.descriptor_pb2 import FieldDescriptorProto
+from google.protobuf.message import DecodeError
+from google.protobuf.source_context_pb2 import SourceContext
+from google.protobuf.struct_pb2 import Struct, Value
+from google.protobuf.type_pb2 import Field, Type
+from google.protobuf.wrappers_pb2 import (
+    BoolValue,
+    BytesValue,
+    DoubleValue,
+    FloatValue,
+    Int32Value,
+    Int64Value,
+    StringValue,
+    UInt64Value,
+)
+
+from make87.encodings import DelimitedProtobufEncoder, ProtobufEncoder
+from make87.encodings.protobuf import MessagePool
+
+
+@pytest.fixture
+def encoder():
+    return ProtobufEncoder(message_type=BytesValue)
+
+
+def test_round_trip(encoder):
+    message = BytesValue(value=b"\x00\x01\x02")
+    assert encoder.decode(encoder.encode(message)) == message
+
+
+def test_encode_into(encoder):
+    message = BytesValue(value=b"payload")
+    buffer = bytearray(64)
+    size = encoder.encode_into(message, buffer)
+    assert bytes(buffer[:size]) == message.SerializeToString()
+
+
+def test_encode_into_buffer_too_small(encoder):
+    with pytest.raises(ValueError):
+        encoder.encode_into(BytesValue(value=b"x" * 32), bytearray(8))
+
+
+def test_decode_from_memoryview(encoder):
+    message = BytesValue(value=b"payload")
+    buffer = bytearray(b"\xff" * 4) + message.SerializeToString()
+    assert encoder.decode_from(memoryview(buffer)[4:]) == message
+
+
+def test_struct_round_trip():
+    encoder = ProtobufEncoder(message_type=Struct)
+    message = Struct()
+    message.update({"key": "value", "number": 42})
+    assert encoder.decode_from(encoder.encode(message)) == message
+
+
+def test_encode_decode_many(encoder):
+    messages = [BytesValue(value=bytes([i]) * i) for i in range(5)]
+    payloads = encoder.encode_many(messages)
+    assert payloads == [m.SerializeToString() for m in messages]
+    assert encoder.decode_many([memoryview(p) for p in payloads]) == messages
+
+
+def test_delimited_round_trip():
+    encoder = DelimitedProtobufEncoder(message_type=BytesValue)
+    messages = [BytesValue(value=b"a"), BytesValue(), BytesValue(value=b"c" * 300)]
+    assert encoder.decode(encoder.encode(messages)) == messages
+
+
+def test_delimited_wire_format():
+    encoder = DelimitedProtobufEncoder(message_type=BytesValue)
+    message = BytesValue(value=b"abc")
+    serialized = message.SerializeToString()
+    assert encoder.encode([message]) == bytes([len(serialized)]) + serialized
+
+
+def test_delimited_iter_decode_stream():
+    encoder = DelimitedProtobufEncoder(message_type=BytesValue)
+    messages = [BytesValue(value=bytes([i])) for i in range(10)]
+    stream = io.BytesIO()
+    encoder.write_to(messages, stream)
+    stream.seek(0)
+    assert list(encoder.iter_decode(stream)) == messages
+
+
+def test_decode_into(encoder):
+    target = BytesValue(value=b"old")
+    decoded = encoder.decode(BytesValue(value=b"new").SerializeToString(), into=target)
+    assert decoded is target
+    assert target.value == b"new"
+
+
+def test_decode_pooled():
+    encoder = ProtobufEncoder(message_type=BytesValue, pool_size=2)
+    first = encoder.decode(BytesValue(value=b"a").SerializeToString())
+    encoder.release(first)
+    second = encoder.decode_from(memoryview(BytesValue(value=b"b").SerializeToString()))
+    assert second is first
+    assert second.value == b"b"
+
+
+def test_pool_bounds():
+    pool = MessagePool(BytesValue, maxsize=1, max_reuses=2)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert len(pool) == 1
+    assert pool.acquire() is first
+    pool.release(first)
+    assert len(pool) == 0  # retired after two uses
+
+
+def test_pool_ignores_double_release():
+    pool = MessagePool(BytesValue, maxsize=2)
+    message = pool.acquire()
+    pool.release(message)
+    pool.release(message)
+    assert len(pool) == 1
+    first, second = pool.acquire(), pool.acquire()
+    assert first is message
+    assert second is not message
+    pool.release(first)
+    assert len(pool) == 1
+
+
+def test_pool_ignores_foreign_messages():
+    pool = MessagePool(BytesValue, maxsize=2)
+    pool.release(BytesValue())
+    assert len(pool) == 0
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        Int64Value(value=-5),
+        Int32Value(value=-7),
+        UInt64Value(value=2**63 + 1),
+        FloatValue(value=1.5),
+        DoubleValue(value=-2.25),
+        BoolValue(value=True),
+        StringValue(value="grüße"),
+        BytesValue(value=b"\x00\x01"),
+        Field(kind=Field.TYPE_STRING, number=3, name="label", packed=True),
+    ],
+)
+def test_decode_lazy_scalars(message):
+    lazy = ProtobufEncoder(type(message)).decode_lazy(message.SerializeToString(), min_size=0)
+    for field, value in message.ListFields():
+        assert getattr(lazy, field.name) == value
+    assert lazy._lazy_message is None
+
+
+def test_decode_lazy_sub_messages():
+    message = Type(name="Image", source_context=SourceContext(file_name="image.proto"), fields=[Field(name="data")])
+    lazy = ProtobufEncoder(Type).decode_lazy(memoryview(message.SerializeToString()), min_size=0)
+    assert lazy.source_context.file_name == "image.proto"
+    assert lazy.HasField("source_context")
+    assert lazy._lazy_message is None
+
+    assert lazy.fields[0].name == "data"  # repeated fields need a full parse
+    assert lazy.ToMessage() == message
+    assert lazy == message
+
+
+def test_decode_lazy_defaults_and_merging():
+    encoder = ProtobufEncoder(Type)
+    assert encoder.decode_lazy(b"", min_size=0).name == ""
+    assert encoder.decode_lazy(b"", min_size=0).source_context.file_name == ""
+    assert not encoder.decode_lazy(b"", min_size=0).HasField("source_context")
+
+    payload = Type(name="a", source_context=SourceContext(file_name="x")).SerializeToString()
+    payload += Type(name="b", syntax=1).SerializeToString()
+    expected = Type.FromString(payload)
+    lazy = encoder.decode_lazy(payload, min_size=0)
+    assert (lazy.name, lazy.syntax, lazy.source_context.file_name) == (expected.name, 1, "x")
+
+
+def test_decode_lazy_oneof():
+    payload = Value(number_value=1.0).SerializeToString() + Value(string_value="s").SerializeToString()
+    lazy = ProtobufEncoder(Value).decode_lazy(payload, min_size=0)
+    assert lazy.number_value == 0.0
+    assert lazy.string_value == "s"
+    assert lazy.WhichOneof("kind") == "string_value"
+
+
+def test_decode_lazy_unknown_closed_enum_value():
+    # FieldDescriptorProto is proto2, so its enum fields are closed: unknown values become unknown fields.
+    type_field = FieldDescriptorProto.DESCRIPTOR.fields_by_name["type"]
+    data = FieldDescriptorProto(name="x", label=FieldDescriptorProto.LABEL_OPTIONAL).SerializeToString()
+    data += bytes([type_field.number << 3, 99])
+    expected = FieldDescriptorProto.FromString(data)
+    lazy = ProtobufEncoder(FieldDescriptorProto).decode_lazy(data, min_size=0)
+    assert lazy.label == FieldDescriptorProto.LABEL_OPTIONAL
+    assert lazy._lazy_message is None
+    assert lazy.type == expected.type == FieldDescriptorProto.TYPE_DOUBLE
+    assert lazy.HasField("type") == expected.HasField("type") is False
+
+
+def test_decode_lazy_serialize_and_modify():
+    payload = StringValue(value="a").SerializeToString()
+    lazy = ProtobufEncoder(StringValue).decode_lazy(payload, min_size=0)
+    assert lazy.SerializeToString() == payload
+    lazy.value = "b"
+    assert lazy.value == "b"
+    assert StringValue.FromString(lazy.SerializeToString()).value == "b"
+
+
+def test_decode_lazy_modify_sub_message():
+    message = Type(name="Image", source_context=SourceContext(file_name="image.proto"))
+    lazy = ProtobufEncoder(Type).decode_lazy(message.SerializeToString(), min_size=0)
+    source_context = lazy.source_context
+    lazy.source_context.file_name = "X"
+    assert lazy.ToMessage().source_context.file_name == "X"
+    assert Type.FromString(lazy.SerializeToString()).source_context.file_name == "X"
+    assert source_context.file_name == "X"  # views taken before the write see it too
+    assert SourceContext.FromString(source_context.SerializeToString()).file_name == "X"
+
+
+def test_decode_lazy_modify_unset_sub_message():
+    lazy = ProtobufEncoder(Type).decode_lazy(Type(name="Image").SerializeToString(), min_size=0)
+    lazy.source_context.file_name = "X"
+    assert lazy.HasField("source_context")
+    assert Type.FromString(lazy.SerializeToString()).source_context.file_name == "X"
+
+
+def test_decode_lazy_copy_and_pickle():
+    message = Type(name="Image", source_context=SourceContext(file_name="image.proto"))
+    lazy = ProtobufEncoder(Type).decode_lazy(memoryview(message.SerializeToString()), min_size=0)
+    assert copy.copy(lazy).name == "Image"
+    assert copy.deepcopy(lazy) == message
+    assert pickle.loads(pickle.dumps(lazy.source_context)).file_name == "image.proto"
+    assert pickle.loads(pickle.dumps(lazy)) == message
+
+
+def test_decode_lazy_truncated():
+    payload = StringValue(value="abc").SerializeToString()[:-1]
+    with pytest.raises(DecodeError):
+        ProtobufEncoder(StringValue).decode_lazy(payload, min_size=0).value
+
+
+def test_decode_lazy_small_payload_is_parsed():
+    lazy = ProtobufEncoder(StringValue).decode_lazy(StringValue(value="a").SerializeToString())
+    assert lazy._lazy_message is not None
+    assert lazy.value == "a"
@@ -0,0 +1,120 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Union
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from make87.encodings import PydanticEncoder
+from make87.encodings.pydantic_ import get_type_adapter
+
+
+class Header(BaseModel):
+    timestamp: float
+    entity_path: str
+
+
+class Event(BaseModel):
+    time: datetime
+
+
+class Detection(BaseModel):
+    label: str
+    score: float
+
+    @field_validator("score")
+    @classmethod
+    def _check_score(cls, value):
+        if not 0 <= value <= 1:
+            raise ValueError("score out of range")
+        return value
+
+
+class Frame(BaseModel):
+    header: Header
+    detections: List[Detection]
+    by_label: Dict[str, Detection] = {}
+    parent: Optional["Frame"] = None
+    camera: str = Field(default="front", alias="cameraName")
+
+
+class Pose(BaseModel):
+    x: float
+
+
+class Twist(BaseModel):
+    v: float
+
+
+class Tagged(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+
+
+def _frame():
+    header = Header(timestamp=1712345678.5, entity_path="/camera")
+    detection = Detection(label="cat", score=0.5)
+    return Frame(
+        header=header,
+        detections=[detection],
+        by_label={"cat": detection},
+        parent=Frame(header=header, detections=[]),
+    )
+
+
+def test_round_trip():
+    encoder = PydanticEncoder(Frame)
+    frame = _frame()
+    decoded = encoder.decode(encoder.encode(frame))
+    assert isinstance(decoded.detections[0], Detection)
+    assert isinstance(decoded.by_label["cat"], Detection)
+    assert isinstance(decoded.parent, Frame)
+    assert decoded.model_dump() == frame.model_dump()
+
+
+def test_decode_from_buffers():
+    encoder = PydanticEncoder(Pose)
+    assert encoder.decode_from(memoryview(b'xx{"x": 1.5}')[2:]).x == 1.5
+    assert encoder.decode_from(bytearray(b'{"x": 1.5}')).x == 1.5
+
+
+def test_generic_types():
+    encoder = PydanticEncoder(List[Union[Pose, Twist]])
+    decoded = encoder.decode(b'[{"x": 1}, {"v": 2}]')
+    assert [type(item) for item in decoded] == [Pose, Twist]
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        PydanticEncoder(Detection).decode(b'{"label": "cat", "score": 2}')
+    with pytest.raises(ValueError):
+        PydanticEncoder(Pose).decode(b'{"x": "not a number"}')
+
+
+def test_coercion():
+    payload = PydanticEncoder(Event).encode(Event(time=datetime(2024, 1, 1, tzinfo=timezone.utc)))
+    assert PydanticEncoder(Event).decode(payload).time == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_defaults_and_extra_fields():
+    decoded = PydanticEncoder(Frame).decode(b'{"header": {"timestamp": 1.0, "entity_path": "/a"}, "detections": []}')
+    assert decoded.camera == "front"
+    assert decoded.by_label == {}
+    tagged = PydanticEncoder(Tagged).decode(b'{"name": "cat", "color": "black"}')
+    assert tagged.model_extra == {"color": "black"}
+    assert PydanticEncoder(Tagged).encode(tagged) == b'{"name":"cat","color":"black"}'
+
+
+def test_invalid_json():
+    with pytest.raises(ValueError):
+        PydanticEncoder(Pose).decode(b"{")
+
+
+def test_type_adapter_is_cached():
+    assert get_type_adapter(Pose) is get_type_adapter(Pose)
+    assert PydanticEncoder(Pose).adapter is PydanticEncoder(Pose, by_alias=True).adapter
+
+
+def test_by_alias():
+    payload = PydanticEncoder(Frame, by_alias=True).encode(_frame())
+    assert b'"cameraName"' in payload
@@ -0,0 +1,75 @@
+import pytest
+from google.protobuf.struct_pb2 import Struct
+from google.protobuf.wrappers_pb2 import BytesValue
+
+from make87.encodings import JsonEncoder, ProtobufEncoder, YamlEncoder, get_encoder, register_encoding
+from make87.encodings.registry import clear_encoder_cache, registered_encodings, resolve_message_type
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_encoder_cache()
+    yield
+    clear_encoder_cache()
+
+
+def test_protobuf_by_default():
+    encoder = get_encoder(None, "google.protobuf.wrappers.BytesValue")
+    assert isinstance(encoder, ProtobufEncoder)
+    assert encoder.message_type is BytesValue
+
+
+def test_encoder_is_cached():
+    encoder = get_encoder("protobuf", "google.protobuf.struct.Struct")
+    assert get_encoder("PROTO", "google.protobuf.struct.Struct") is encoder
+    assert get_encoder("protobuf", "google.protobuf.wrappers.BytesValue") is not encoder
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("google.protobuf.struct.Struct", Struct),
+        ("google.protobuf.struct_pb2.Struct", Struct),
+        ("google.protobuf.struct.Struct.FieldsEntry", Struct.FieldsEntry),
+    ],
+)
+def test_resolve_message_type(name, expected):
+    assert resolve_message_type(name) is expected
+
+
+def test_resolve_unknown_message_type():
+    with pytest.raises(ValueError):
+        resolve_message_type("make87_messages_missing.text.PlainText")
+    with pytest.raises(ValueError):
+        get_encoder("protobuf", "google.protobuf.struct.Missing")
+    with pytest.raises(ValueError):
+        get_encoder("protobuf")
+
+
+def test_schemaless_encodings():
+    assert isinstance(get_encoder("json", "ignored"), JsonEncoder)
+    assert isinstance(get_encoder("yml"), YamlEncoder)
+
+
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        get_encoder("avro", "a.B")
+
+
+def test_register_encoding():
+    register_encoding("test-json", lambda message_type: JsonEncoder(backend="stdlib"), aliases=("tj",))
+    try:
+        encoder = get_encoder("tj")
+        assert encoder.backend == "stdlib"
+        assert "test-json" in registered_encodings()
+    finally:
+        register_encoding("test-json", lambda message_type: JsonEncoder())
+
+
+def test_schemaless_binary_encodings():
+    pytest.importorskip("msgpack")
+    pytest.importorskip("cbor2")
+    from make87.encodings import CborEncoder, MsgpackEncoder
+
+    assert isinstance(get_encoder("application/msgpack"), MsgpackEncoder)
+    assert isinstance(get_encoder("cbor"), CborEncoder)
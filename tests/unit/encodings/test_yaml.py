@@ -0,0 +1,72 @@
+import pytest
+import yaml
+
+from make87.encodings import YamlEncoder
+from make87.encodings.yaml_ import LIBYAML_AVAILABLE
+
+
+@pytest.fixture(params=[True, False] if LIBYAML_AVAILABLE else [False])
+def encoder(request):
+    return YamlEncoder(use_libyaml=request.param)
+
+
+def test_round_trip(encoder):
+    obj = {"key": "value", "items": [1, 2, 3]}
+    assert encoder.decode(encoder.encode(obj)) == obj
+
+
+def test_encode_into(encoder):
+    obj = {"key": "value"}
+    buffer = bytearray(64)
+    size = encoder.encode_into(obj, memoryview(buffer))
+    assert bytes(buffer[:size]) == encoder.encode(obj)
+
+
+def test_decode_from_memoryview(encoder):
+    data = b"--key: value\n--"
+    assert encoder.decode_from(memoryview(data)[2:-2]) == {"key": "value"}
+
+
+def test_decode_many(encoder):
+    objs = [{"a": 1}, [1, 2], "text"]
+    assert encoder.decode_many(encoder.encode_many(objs)) == objs
+
+
+def test_decode_many_with_document_markers(encoder):
+    assert encoder.decode_many([b"---\na: 1\n", b"b: 2\n...\n"]) == [{"a": 1}, {"b": 2}]
+
+
+def test_decode_many_with_embedded_documents(encoder):
+    with pytest.raises(ValueError):
+        encoder.decode_many([b"# no document\n", b"a: 1\n---\nb: 2\n"])
+
+
+def test_decode_many_invalid(encoder):
+    with pytest.raises(ValueError):
+        encoder.decode_many([b"a: 1\n", b"a: [unclosed\n"])
+
+
+def test_decode_bytearray(encoder):
+    assert encoder.decode(bytearray(b"key: value\n")) == {"key": "value"}
+
+
+def test_default_loader():
+    encoder = YamlEncoder()
+    if LIBYAML_AVAILABLE:
+        assert encoder.loader is yaml.CSafeLoader
+        assert encoder.dumper is yaml.CSafeDumper
+    else:
+        assert encoder.loader is yaml.SafeLoader
+        assert encoder.dumper is yaml.SafeDumper
+
+
+def test_explicit_loader_wins():
+    encoder = YamlEncoder(loader=yaml.FullLoader, use_libyaml=False)
+    assert encoder.loader is yaml.FullLoader
+    assert encoder.dumper is yaml.SafeDumper
+
+
+@pytest.mark.skipif(LIBYAML_AVAILABLE, reason="libyaml is available")
+def test_libyaml_unavailable():
+    with pytest.raises(ValueError):
+        YamlEncoder(use_libyaml=True)
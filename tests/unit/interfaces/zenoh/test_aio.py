@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+
+import pytest
+import zenoh
+
+from make87.interfaces.zenoh import FifoChannel, RingChannel, aio
+from make87.interfaces.zenoh.aio import _LoopBridge
+
+
+def _fill(bridge, items):
+    thread = threading.Thread(target=lambda: [bridge.put(item) for item in items])
+    thread.start()
+    thread.join()
+
+
+async def _drain(bridge):
+    bridge.close()
+    items = []
+    while True:
+        try:
+            items.append(await bridge.get())
+        except StopAsyncIteration:
+            return items
+
+
+def test_loop_bridge_wakes_loop_once_per_batch():
+    async def run():
+        loop = asyncio.get_running_loop()
+        wakeups = []
+        call_soon_threadsafe = loop.call_soon_threadsafe
+        loop.call_soon_threadsafe = lambda *args: wakeups.append(args) or call_soon_threadsafe(*args)
+        bridge = _LoopBridge(loop, None)
+
+        _fill(bridge, range(100))  # the loop does not run while the thread puts
+        items = [await bridge.get() for _ in range(100)]
+        await asyncio.sleep(0)  # run the pending wakeup
+        _fill(bridge, range(100, 150))
+        items += [await bridge.get() for _ in range(50)]
+        return items, len(wakeups)
+
+    items, wakeups = asyncio.run(run())
+
+    assert items == list(range(150))
+    assert wakeups == 2
+
+
+def test_loop_bridge_waits_for_items_from_other_threads():
+    async def run():
+        bridge = _LoopBridge(asyncio.get_running_loop(), None)
+        timer = threading.Timer(0.05, bridge.put, args=("late",))
+        timer.start()
+        item = await asyncio.wait_for(bridge.get(), 5)
+        timer.join()
+        return item
+
+    assert asyncio.run(run()) == "late"
+
+
+def test_loop_bridge_fifo_channel_drops_new_items():
+    async def run():
+        bridge = _LoopBridge(asyncio.get_running_loop(), FifoChannel(handler_type="FIFO", capacity=3))
+        _fill(bridge, range(5))
+        return await _drain(bridge), bridge.dropped
+
+    assert asyncio.run(run()) == ([0, 1, 2], 2)
+
+
+def test_loop_bridge_ring_channel_drops_oldest_items():
+    async def run():
+        bridge = _LoopBridge(asyncio.get_running_loop(), RingChannel(handler_type="RING", capacity=3))
+        _fill(bridge, range(5))
+        return await _drain(bridge), bridge.dropped
+
+    assert asyncio.run(run()) == ([2, 3, 4], 2)
+
+
+@pytest.mark.parametrize("cancellable", [True, False], ids=["token", "no-token"])
+def test_query_collects_replies(monkeypatch, cancellable):
+    if not cancellable:
+        monkeypatch.setattr(aio, "_CancellationToken", None)
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    session = zenoh.open(config)
+    queryable = session.declare_queryable("test/aio/query", lambda query: query.reply("test/aio/query", b"pong"))
+    try:
+        replies = asyncio.run(aio.query(session, "test/aio/query", payload=b"ping", timeout=5.0))
+    finally:
+        queryable.undeclare()
+        session.close()
+
+    assert [reply.ok.payload.to_bytes() for reply in replies] == [b"pong"]
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from make87.encodings.framing import iter_frames
+from make87.interfaces.zenoh import Batcher, BatchingConfig
+from make87.interfaces.zenoh.batching import BATCH_ATTACHMENT
+
+
+class _Recorder:
+    def __init__(self):
+        self.puts = []
+        self.published = threading.Event()
+
+    def put(self, payload, attachment=None):
+        self.puts.append((payload, attachment))
+        self.published.set()
+
+    def messages(self):
+        messages = []
+        for payload, attachment in self.puts:
+            if attachment == BATCH_ATTACHMENT:
+                messages.extend(bytes(frame) for frame in iter_frames(payload))
+            else:
+                messages.append(payload)
+        return messages
+
+
+def test_batcher_flushes_on_max_messages():
+    recorder = _Recorder()
+    batcher = Batcher(recorder.put, BatchingConfig(max_messages=3, linger_ms=10_000))
+
+    for i in range(7):
+        batcher.add(b"%d" % i)
+
+    assert len(recorder.puts) == 2
+    assert all(attachment == BATCH_ATTACHMENT for _, attachment in recorder.puts)
+    batcher.close()
+    assert recorder.messages() == [b"%d" % i for i in range(7)]
+    assert (batcher.batches, batcher.messages) == (3, 7)
+
+
+def test_batcher_flushes_on_max_bytes():
+    recorder = _Recorder()
+    batcher = Batcher(recorder.put, BatchingConfig(max_messages=100, max_bytes=10, linger_ms=10_000))
+
+    batcher.add(b"x" * 6)
+    assert recorder.puts == []
+    batcher.add(b"y" * 6)
+
+    assert recorder.messages() == [b"x" * 6, b"y" * 6]
+    batcher.close()
+
+
+def test_batcher_flushes_after_linger():
+    recorder = _Recorder()
+    batcher = Batcher(recorder.put, BatchingConfig(max_messages=100, linger_ms=20))
+
+    start = time.monotonic()
+    batcher.add(b"a")
+    batcher.add(b"b")
+
+    assert recorder.published.wait(5)
+    assert time.monotonic() - start >= 0.015
+    assert recorder.messages() == [b"a", b"b"]
+    batcher.close()
+
+
+def test_batcher_publishes_single_message_unframed():
+    recorder = _Recorder()
+    batcher = Batcher(recorder.put, BatchingConfig(linger_ms=10_000))
+
+    batcher.add(b"only")
+    batcher.flush()
+
+    assert recorder.puts == [(b"only", None)]
+    batcher.close()
+
+
+def test_batcher_keeps_order_across_threads():
+    recorder = _Recorder()
+    batcher = Batcher(recorder.put, BatchingConfig(max_messages=7, linger_ms=0.1))
+
+    for i in range(500):
+        batcher.add(b"%d" % i)
+        if i % 50 == 0:
+            time.sleep(0.001)  # let the linger timer publish partial batches
+    batcher.close()
+
+    assert recorder.messages() == [b"%d" % i for i in range(500)]
+
+
+def test_batcher_rejects_messages_after_close():
+    batcher = Batcher(_Recorder().put, BatchingConfig())
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.add(b"late")
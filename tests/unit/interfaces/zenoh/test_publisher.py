@@ -1,7 +1,12 @@
+import json
+import threading
+
 import pytest
 import uuid
 
 from make87.config import load_config_from_json
+from make87.encodings import JsonEncoder, NdarrayEncoder
+from make87.interfaces.zenoh import BatchingConfig, ShmConfig, TypedPublisher, TypedSubscriber, is_shm, shm
 from make87.interfaces.zenoh.interface import ZenohInterface
 from make87.internal.models.application_env_config import InterfaceConfig, ApplicationInfo, PublisherTopicConfig
 from make87.models import ApplicationConfig, MountedPeripherals
@@ -71,3 +76,152 @@ def test_get_requester(zenoh_interface):
 def test_get_provider(zenoh_interface):
     with pytest.raises(KeyError):
         zenoh_interface.get_queryable("HELLO_WORLD_MESSAGE")
+
+
+def _receive(zenoh_interface, count):
+    received = []
+    done = threading.Event()
+
+    def on_sample(sample):
+        received.append(sample.payload.to_bytes())
+        if len(received) == count:
+            done.set()
+
+    subscriber = zenoh_interface.session.declare_subscriber("my_topic_key", on_sample)
+    return subscriber, received, done
+
+
+def test_get_typed_publisher(zenoh_interface):
+    encoder = JsonEncoder()
+    publisher = zenoh_interface.get_typed_publisher("HELLO_WORLD_MESSAGE", encoder=encoder)
+    assert isinstance(publisher, TypedPublisher)
+    subscriber, received, done = _receive(zenoh_interface, 1)
+
+    publisher.put({"body": "Hello, World!"})
+
+    assert done.wait(5)
+    assert encoder.decode(received[0]) == {"body": "Hello, World!"}
+    subscriber.undeclare()
+    publisher.undeclare()
+
+
+def test_get_typed_publisher_resolves_encoder_from_config(zenoh_interface):
+    zenoh_interface.get_interface_type_by_name("HELLO_WORLD_MESSAGE", "PUB").encoding = "json"
+
+    publisher = zenoh_interface.get_typed_publisher("HELLO_WORLD_MESSAGE")
+
+    assert isinstance(publisher.encoder, JsonEncoder)
+    publisher.undeclare()
+
+
+def test_typed_publisher_reuses_buffer_across_payload_sizes(zenoh_interface):
+    np = pytest.importorskip("numpy")
+    encoder = NdarrayEncoder()
+    frames = [np.full((4, 4), i, dtype=np.uint8) for i in range(3)] + [np.arange(100, dtype=np.int32), np.ones(2)]
+    subscriber, received, done = _receive(zenoh_interface, len(frames))
+
+    with zenoh_interface.get_typed_publisher("HELLO_WORLD_MESSAGE", encoder=encoder) as publisher:
+        for frame in frames:
+            publisher.put(frame)
+        assert done.wait(5)
+
+    for frame, payload in zip(frames, received):
+        np.testing.assert_array_equal(encoder.decode(payload), frame)
+    subscriber.undeclare()
+
+
+def test_get_typed_publisher_enables_batching_from_config(zenoh_interface):
+    iface_config = zenoh_interface.get_interface_type_by_name("HELLO_WORLD_MESSAGE", "PUB")
+    iface_config.model_extra["batching"] = {"max_messages": 8, "linger_ms": 1.0}
+
+    publisher = zenoh_interface.get_typed_publisher("HELLO_WORLD_MESSAGE", encoder=JsonEncoder())
+
+    assert publisher.batcher.config == BatchingConfig(max_messages=8, linger_ms=1.0)
+    publisher.undeclare()
+
+
+def test_typed_subscriber_splits_batches(zenoh_interface):
+    session = zenoh_interface.session
+    received = []
+    done = threading.Event()
+
+    def handle(obj):
+        received.append(obj)
+        if len(received) == 25:
+            done.set()
+
+    with TypedSubscriber(session, "my_topic_key", JsonEncoder(), handle, workers=2):
+        publisher = TypedPublisher(
+            session.declare_publisher("my_topic_key"), JsonEncoder(), batching=BatchingConfig(max_messages=10)
+        )
+        for i in range(25):
+            publisher.put({"seq": i})
+        publisher.undeclare()
+        assert done.wait(5)
+
+    assert received == [{"seq": i} for i in range(25)]
+    assert publisher.batcher.batches == 3
+
+
+def _receive_samples(session, count):
+    samples = []
+    done = threading.Event()
+
+    def on_sample(sample):
+        samples.append(sample)
+        if len(samples) == count:
+            done.set()
+
+    return session.declare_subscriber("my_topic_key", on_sample), samples, done
+
+
+def test_typed_publisher_publishes_large_payloads_from_shared_memory(zenoh_interface):
+    session = zenoh_interface.session
+    subscriber, samples, done = _receive_samples(session, 2)
+
+    with TypedPublisher(
+        session.declare_publisher("my_topic_key"), JsonEncoder(), shm=ShmConfig(pool_size=1024 * 1024, threshold=100)
+    ) as publisher:
+        publisher.put("small")
+        publisher.put("x" * 1000)
+        assert done.wait(5)
+
+    assert [is_shm(sample) for sample in samples] == [False, True]
+    assert JsonEncoder().decode(samples[1].payload.to_bytes()) == "x" * 1000
+    subscriber.undeclare()
+
+
+def test_typed_publisher_falls_back_when_shared_memory_pool_is_exhausted(zenoh_interface):
+    session = zenoh_interface.session
+    subscriber, samples, done = _receive_samples(session, 1)
+
+    with TypedPublisher(
+        session.declare_publisher("my_topic_key"), JsonEncoder(), shm=ShmConfig(pool_size=4096, threshold=1)
+    ) as publisher:
+        publisher.put("x" * 100_000)
+        assert done.wait(5)
+
+    assert not is_shm(samples[0])
+    assert JsonEncoder().decode(samples[0].payload.to_bytes()) == "x" * 100_000
+    subscriber.undeclare()
+
+
+def test_typed_publisher_requires_shared_memory_support(zenoh_interface, monkeypatch):
+    monkeypatch.setattr(shm, "zenoh_shm", None)
+    monkeypatch.setattr(shm, "_as_shm", None)
+    session = zenoh_interface.session
+    subscriber, samples, done = _receive_samples(session, 1)
+
+    with pytest.raises(ImportError):
+        TypedPublisher(session.declare_publisher("my_topic_key"), JsonEncoder(), shm=ShmConfig(pool_size=4096))
+    session.put("my_topic_key", b"1")
+    assert done.wait(5)
+    assert not is_shm(samples[0])
+    subscriber.undeclare()
+
+
+def test_zenoh_config_enables_shared_memory_for_shm_publishers(zenoh_interface):
+    iface_config = zenoh_interface.get_interface_type_by_name("HELLO_WORLD_MESSAGE", "PUB")
+    iface_config.model_extra["shm"] = {"pool_size": 1024 * 1024}
+
+    assert json.loads(zenoh_interface.zenoh_config.get_json("transport/shared_memory/enabled")) is True
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import uuid
 
@@ -78,3 +80,18 @@ def test_get_subscriber(zenoh_interface):
 def test_get_queryable(zenoh_interface):
     with pytest.raises(KeyError):
         zenoh_interface.get_queryable("HELLO_WORLD_MESSAGE")
+
+
+def test_aio_query(zenoh_interface):
+    queryable = zenoh_interface.session.declare_queryable(
+        "my_endpoint_key", lambda query: query.reply("my_endpoint_key", b"echo:" + query.payload.to_bytes())
+    )
+
+    replies = asyncio.run(zenoh_interface.aio_query("HELLO_WORLD_MESSAGE", b"ping", timeout=5.0))
+
+    assert [reply.ok.payload.to_bytes() for reply in replies] == [b"echo:ping"]
+    queryable.undeclare()
+
+
+def test_aio_query_without_queryable_returns_no_replies(zenoh_interface):
+    assert asyncio.run(zenoh_interface.aio_query("HELLO_WORLD_MESSAGE", timeout=0.2)) == []
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import uuid
 
@@ -75,3 +77,25 @@ def test_get_subscriber(zenoh_interface):
 def test_get_querier(zenoh_interface):
     with pytest.raises(KeyError):
         zenoh_interface.get_querier("HELLO_WORLD_MESSAGE")
+
+
+def test_aio_queryable_serve(zenoh_interface):
+    async def handle(query):
+        await asyncio.sleep(0.01)
+        query.reply(query.key_expr, b"echo:" + query.payload.to_bytes())
+
+    def ask(payloads, replies):
+        for payload in payloads:
+            for reply in zenoh_interface.session.get("my_endpoint_key", payload=payload, timeout=5.0):
+                replies.append(reply.ok.payload.to_bytes())
+
+    async def serve():
+        queryable = zenoh_interface.aio_queryable("HELLO_WORLD_MESSAGE")
+        serving = asyncio.ensure_future(queryable.serve(handle))
+        replies = []
+        await asyncio.get_running_loop().run_in_executor(None, ask, [b"a", b"b"], replies)
+        queryable.close()
+        await asyncio.wait_for(serving, 5)
+        return replies
+
+    assert asyncio.run(serve()) == [b"echo:a", b"echo:b"]
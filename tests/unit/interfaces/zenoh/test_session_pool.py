@@ -0,0 +1,62 @@
+import json
+
+import zenoh
+
+from make87.interfaces.zenoh.session_pool import acquire_session, is_pooled, release_session
+
+
+def _config(**settings):
+    config = zenoh.Config()
+    config.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    for key, value in settings.items():
+        config.insert_json5(key.replace("__", "/"), json.dumps(value))
+    return config
+
+
+def test_equal_configs_share_a_session():
+    first = acquire_session(_config())
+    second = acquire_session(_config())
+    try:
+        assert first is second
+    finally:
+        release_session(first)
+        release_session(second)
+
+
+def test_different_configs_get_different_sessions():
+    first = acquire_session(_config())
+    second = acquire_session(_config(transport__shared_memory__enabled=False))
+    try:
+        assert first is not second
+    finally:
+        release_session(first)
+        release_session(second)
+
+
+def test_session_is_closed_on_last_release():
+    config = _config()
+    first = acquire_session(config)
+    second = acquire_session(config)
+
+    release_session(first)
+    assert not second.is_closed()
+    assert is_pooled(config)
+
+    release_session(second)
+    assert second.is_closed()
+    assert not is_pooled(config)
+
+
+def test_closed_session_is_replaced():
+    config = _config()
+    session = acquire_session(config)
+    session.close()
+
+    replacement = acquire_session(config)
+    try:
+        assert replacement is not session
+        assert not replacement.is_closed()
+        release_session(session)  # no longer pooled, so this does nothing
+        assert not replacement.is_closed()
+    finally:
+        release_session(replacement)
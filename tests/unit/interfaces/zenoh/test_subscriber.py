@@ -1,8 +1,18 @@
+import asyncio
+import json
+import random
+import threading
+import time
+
 import pytest
 import uuid
+import zenoh
 
 from make87.config import load_config_from_json
-from make87.interfaces.zenoh.interface import ZenohInterface
+from make87.encodings import JsonEncoder
+from make87.interfaces.zenoh import FifoChannel, RingChannel, TypedSubscriber
+from make87.interfaces.zenoh import interface
+from make87.interfaces.zenoh.interface import ZenohInterface, listen_endpoints, unixsock_endpoint
 from make87.internal.models.application_env_config import (
     InterfaceConfig,
     ApplicationInfo,
@@ -81,3 +91,180 @@ def test_get_requester(zenoh_interface):
 def test_get_provider(zenoh_interface):
     with pytest.raises(KeyError):
         zenoh_interface.get_queryable("HELLO_WORLD_MESSAGE")
+
+
+class _SlowJsonEncoder(JsonEncoder):
+    """Decodes after a random delay, so concurrent workers finish out of order."""
+
+    def decode_from(self, data):
+        time.sleep(random.uniform(0, 0.005))
+        return super().decode_from(data)
+
+
+def _collector(count):
+    received = []
+    done = threading.Event()
+
+    def handle(obj):
+        received.append(obj)
+        if len(received) == count:
+            done.set()
+
+    return handle, received, done
+
+
+def test_get_typed_subscriber(zenoh_interface):
+    handle, received, done = _collector(1)
+
+    with zenoh_interface.get_typed_subscriber("HELLO_WORLD_MESSAGE", handle, encoder=JsonEncoder()) as subscriber:
+        assert isinstance(subscriber, TypedSubscriber)
+        assert subscriber.capacity == 10
+        zenoh_interface.session.put("my_topic_key", JsonEncoder().encode({"body": "Hello, World!"}))
+        assert done.wait(5)
+
+    assert received == [{"body": "Hello, World!"}]
+
+
+def test_typed_subscriber_keeps_per_key_order(zenoh_interface):
+    session = zenoh_interface.session
+    encoder = JsonEncoder()
+    handle, received, done = _collector(200)
+
+    with TypedSubscriber(session, "typed/*", _SlowJsonEncoder(), handle, workers=4):
+        for i in range(100):
+            for key in ("a", "b"):
+                session.put(f"typed/{key}", encoder.encode({"key": key, "seq": i}))
+        assert done.wait(10)
+
+    for key in ("a", "b"):
+        assert [obj["seq"] for obj in received if obj["key"] == key] == list(range(100))
+
+
+def test_typed_subscriber_skips_undecodable_samples(zenoh_interface):
+    session = zenoh_interface.session
+    handle, received, done = _collector(2)
+
+    with TypedSubscriber(session, "typed/skip", JsonEncoder(), handle, workers=2):
+        for payload in (b"1", b"{not json", b"2"):
+            session.put("typed/skip", payload)
+        assert done.wait(5)
+
+    assert received == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "channel, expected",
+    [
+        (FifoChannel(handler_type="FIFO", capacity=2), [0, 1, 2]),
+        (RingChannel(handler_type="RING", capacity=2), [0, 4, 5]),
+    ],
+)
+def test_typed_subscriber_bounds_queue_by_channel_capacity(zenoh_interface, channel, expected):
+    session = zenoh_interface.session
+    started, release = threading.Event(), threading.Event()
+    received = []
+
+    def handle(obj):
+        received.append(obj)
+        started.set()
+        release.wait(5)
+
+    with TypedSubscriber(session, "typed/bounded", JsonEncoder(), handle, channel=channel) as subscriber:
+        session.put("typed/bounded", b"0")
+        assert started.wait(5)
+        for i in range(1, 6):
+            session.put("typed/bounded", str(i).encode())
+        deadline = time.monotonic() + 5
+        while subscriber.dropped < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+
+    assert subscriber.dropped == 3
+    assert received == expected
+
+
+def test_typed_subscriber_decodes_in_processes(zenoh_interface):
+    session = zenoh_interface.session
+    handle, received, done = _collector(3)
+
+    with TypedSubscriber(session, "typed/processes", JsonEncoder(), handle, workers=2, processes=True) as subscriber:
+        assert subscriber._parallel._executor._mp_context.get_start_method() == "spawn"
+        for i in range(3):
+            session.put("typed/processes", JsonEncoder().encode({"seq": i}))
+        assert done.wait(30)
+
+    assert received == [{"seq": 0}, {"seq": 1}, {"seq": 2}]
+
+
+def test_aio_subscriber(zenoh_interface):
+    async def receive():
+        async with zenoh_interface.aio_subscriber("HELLO_WORLD_MESSAGE") as subscriber:
+            assert subscriber.capacity == 10
+            for i in range(3):
+                zenoh_interface.session.put("my_topic_key", str(i))
+            return [(await subscriber.__anext__()).payload.to_string() for _ in range(3)]
+
+    assert asyncio.run(receive()) == ["0", "1", "2"]
+
+
+def test_aio_subscriber_stops_iterating_when_closed(zenoh_interface):
+    async def receive():
+        subscriber = zenoh_interface.aio_subscriber("HELLO_WORLD_MESSAGE")
+        zenoh_interface.session.put("my_topic_key", "last")
+        await asyncio.sleep(0.1)
+        subscriber.close()
+        return [sample.payload.to_string() async for sample in subscriber]
+
+    assert asyncio.run(receive()) == ["last"]
+
+
+def test_zenoh_config_enables_shared_memory_for_same_node_peers(zenoh_interface):
+    assert json.loads(zenoh_interface.zenoh_config.get_json("transport/shared_memory/enabled")) is True
+
+
+def test_zenoh_config_connects_to_same_node_peers_locally_then_over_vpn(zenoh_interface, monkeypatch):
+    monkeypatch.setattr(interface, "is_port_in_use", lambda port: True)  # another process holds the listener
+    peer = zenoh_interface.interface_config.subscribers["HELLO_WORLD_MESSAGE"]
+    peer.vpn_ip, peer.vpn_port = "10.0.0.5", 9000
+    endpoints = json.loads(zenoh_interface.zenoh_config.get_json("connect/endpoints"))
+    assert endpoints == [unixsock_endpoint(7447), "tcp/127.0.0.1:7447", "tcp/10.0.0.5:9000"]
+
+
+def test_zenoh_config_skips_own_local_listener(zenoh_interface, monkeypatch):
+    monkeypatch.setattr(interface, "is_port_in_use", lambda port: False)  # this process will hold the listener
+    peer = zenoh_interface.interface_config.subscribers["HELLO_WORLD_MESSAGE"]
+    peer.vpn_ip, peer.vpn_port = "10.0.0.5", 9000
+    listen = json.loads(zenoh_interface.zenoh_config.get_json("listen/endpoints"))
+    endpoints = json.loads(zenoh_interface.zenoh_config.get_json("connect/endpoints"))
+    assert listen == listen_endpoints(7447)
+    assert endpoints == ["tcp/10.0.0.5:9000"]
+
+
+def test_zenoh_config_connects_to_remote_peers_over_vpn(zenoh_interface):
+    peer = zenoh_interface.interface_config.subscribers["HELLO_WORLD_MESSAGE"]
+    peer.vpn_ip, peer.same_node = "10.0.0.5", False
+    endpoints = json.loads(zenoh_interface.zenoh_config.get_json("connect/endpoints"))
+    assert endpoints == ["tcp/10.0.0.5:7447"]
+
+
+def test_same_node_peers_connect_over_unix_socket():
+    listener = zenoh.Config()
+    listener.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    listener.insert_json5("listen/endpoints", json.dumps([unixsock_endpoint(17448)]))
+    connector = zenoh.Config()
+    connector.insert_json5("scouting/multicast/enabled", json.dumps(False))
+    connector.insert_json5("connect/endpoints", json.dumps([unixsock_endpoint(17448)]))
+    with zenoh.open(listener) as listening, zenoh.open(connector) as connecting:
+        received = threading.Event()
+        listening.declare_subscriber("local", lambda sample: received.set())
+        time.sleep(0.2)
+        connecting.put("local", b"hello")
+        assert received.wait(2)
+
+
+def test_interfaces_with_the_same_config_share_a_session(sub_config):
+    with ZenohInterface(name="zenoh_test", make87_config=sub_config) as first:
+        with ZenohInterface(name="zenoh_test", make87_config=sub_config) as second:
+            assert first.session is second.session
+        assert not first.session.is_closed()
+    assert first.__dict__.get("session") is None